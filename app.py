@@ -4,7 +4,13 @@ Notion-Streamlit 블로그 시스템의 홈페이지
 """
 import streamlit as st
 from datetime import datetime
-from notion_client import NotionClient
+from notion_client import create_content_client
+
+
+@st.cache_resource
+def get_client():
+    """글 조회 클라이언트 (프로세스 전체에서 하나만 생성해 연결을 재사용)"""
+    return create_content_client()
 
 
 def main():
@@ -20,8 +26,8 @@ def main():
     st.subheader("📝 최신 글")
     
     try:
-        client = NotionClient()
-        recent_posts = client.fetch_published_posts()
+        client = get_client()
+        recent_posts = client.fetch_recent_posts(3)
         
         if recent_posts:
             # 최신 3개 글만 표시
@@ -0,0 +1,238 @@
+"""
+비동기 Notion API 연동 모듈
+동기화 작업에서 여러 글의 블록 트리와 이미지를 동시에 처리하는 asyncio 기반 클라이언트
+"""
+import time
+import asyncio
+import threading
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
+
+from notion_client import AsyncClient, NotionClient
+from config.settings import settings
+from content_store import ContentStore
+from http_session import create_async_http_client
+from request_scheduler import RequestScheduler
+
+
+class AsyncNotionClient(NotionClient):
+    """
+    asyncio 기반 Notion API 클라이언트
+
+    블록 조회는 notion-client의 AsyncClient로 동시에 실행하고, 모든 요청은
+    NotionClient와 같은 공유 스케줄러를 거쳐 속도 제한을 지킵니다.
+    마크다운 변환과 이미지 처리는 NotionClient의 구현을 그대로 사용합니다.
+
+    동기화 파이프라인(`sync_notion.py --concurrency N`, N > 1)에서는 fetch_post_blocks가
+    전용 이벤트 루프 스레드에서 블록 트리를 조회하므로, 블록 조회 단계의 작업 스레드들이
+    하나의 이벤트 루프와 요청 슬롯(concurrency개)을 함께 사용합니다. 사용 후 close()로 닫아야 합니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        store: Optional[ContentStore] = None,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        """
+        비동기 클라이언트 초기화
+
+        Args:
+            concurrency (Optional[int]): 동시에 실행할 최대 요청/글 처리 수
+            store (Optional[ContentStore]): 읽기용 콘텐츠 저장소
+            scheduler (Optional[RequestScheduler]): 요청 스케줄러 (기본값: 공유 Notion 스케줄러)
+        """
+        super().__init__(store=store)
+        self.async_client = AsyncClient(
+            auth=settings.NOTION_TOKEN,
+            timeout_ms=int(settings.HTTP_TIMEOUT * 1000),
+            base_url=settings.NOTION_API_BASE_URL,
+            client=create_async_http_client()
+        )
+        self.concurrency = max(1, concurrency or settings.SYNC_CONCURRENCY)
+        if scheduler is not None:
+            self.scheduler = scheduler
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._render_slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def fetch_post_blocks(self, post: Dict, fragment_store: ContentStore) -> Dict:
+        """
+        렌더링 1단계를 이벤트 루프 스레드에서 비동기로 실행 (파이프라인 작업 스레드용)
+
+        Args:
+            post (Dict): _extract_page_properties 형식의 글
+            fragment_store (ContentStore): 블록 렌더링 캐시 저장소
+
+        Returns:
+            Dict: NotionClient.fetch_post_blocks와 같은 형식의 렌더링 작업
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="notion-async", daemon=True
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(
+            self.fetch_post_blocks_async(post, fragment_store), self._loop
+        ).result()
+
+    def close(self):
+        """fetch_post_blocks가 시작한 이벤트 루프와 비동기 HTTP 클라이언트 종료"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.async_client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    async def render_posts(
+        self,
+        posts: List[Dict],
+        fragment_store: Optional[ContentStore] = None
+    ) -> List[Dict]:
+        """
+        여러 글을 동시에 렌더링
+
+        Args:
+            posts (List[Dict]): _extract_page_properties 형식의 글 목록
+            fragment_store (Optional[ContentStore]): 블록 렌더링 캐시 저장소
+
+        Returns:
+            List[Dict]: content, images, fetch_stats가 채워진 글 목록 (입력 순서 유지)
+        """
+        self._request_slots = asyncio.Semaphore(self.concurrency)
+        self._render_slots = asyncio.Semaphore(self.concurrency)
+
+        try:
+            return await asyncio.gather(
+                *(self.render_post_async(post, fragment_store) for post in posts)
+            )
+        finally:
+            await self.async_client.aclose()
+
+    async def render_post_async(self, post: Dict, fragment_store: Optional[ContentStore] = None) -> Dict:
+        """
+        글 하나의 블록 트리를 비동기로 조회하고 렌더링
+
+        Args:
+            post (Dict): _extract_page_properties 형식의 글
+            fragment_store (Optional[ContentStore]): 블록 렌더링 캐시 저장소
+
+        Returns:
+            Dict: content, images, fetch_stats가 채워진 글
+        """
+        if self._render_slots is None:
+            self._render_slots = asyncio.Semaphore(self.concurrency)
+
+        job = await self.fetch_post_blocks_async(post, fragment_store)
+
+        # 변환과 이미지 다운로드는 스레드에서 실행해 이벤트 루프를 막지 않음
+        async with self._render_slots:
+            await asyncio.to_thread(self.convert_post, job)
+        if fragment_store:
+            fragment_store.replace_fragments(post["id"], job["fragments"])
+
+        stats = post["fetch_stats"]
+        print(f"블록 조회 완료 ({post['slug']}): API {stats['api_calls']}회, {stats['elapsed']}초")
+
+        return post
+
+    async def fetch_post_blocks_async(self, post: Dict, fragment_store: Optional[ContentStore] = None) -> Dict:
+        """
+        렌더링 1단계: 최상위 블록을 조회해 캐시와 비교하고 바뀐 블록의 하위 트리만 동시에 조회
+
+        캐시 재사용 규칙은 NotionClient.fetch_post_blocks와 같습니다.
+
+        Args:
+            post (Dict): _extract_page_properties 형식의 글
+            fragment_store (Optional[ContentStore]): 블록 렌더링 캐시 저장소
+
+        Returns:
+            Dict: 렌더링 작업 {"post", "top_blocks", "stale_blocks", "cached", "now", "prefetched"}
+        """
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.concurrency)
+
+        started = time.perf_counter()
+        stats = {"api_calls": 0, "blocks": 0, "max_depth": 0}
+        now = datetime.now(timezone.utc)
+
+        top_blocks = await self._list_children(post["id"], stats)
+        cached = fragment_store.get_fragments(post["id"]) if fragment_store else {}
+        stale_blocks = self._select_stale_blocks(top_blocks, cached, now)
+
+        # 중첩된 하위 블록만 수정된 글은 전체 하위 트리를 다시 조회
+        stored_edited = fragment_store.get_last_edited(post["id"]) if fragment_store else None
+        if stored_edited and post.get("last_edited") and stored_edited != post["last_edited"] and not any(
+            block["id"] not in cached or cached[block["id"]]["last_edited_time"] != block.get("last_edited_time")
+            for block in top_blocks
+        ):
+            stale_blocks = list(top_blocks)
+        await self._expand(stale_blocks, stats, depth=1)
+
+        stats["reused_blocks"] = len(top_blocks) - len(stale_blocks)
+        stats["rendered_blocks"] = len(stale_blocks)
+        stats["elapsed"] = round(time.perf_counter() - started, 3)
+        post["fetch_stats"] = stats
+
+        return {
+            "post": post,
+            "top_blocks": top_blocks,
+            "stale_blocks": stale_blocks,
+            "cached": cached,
+            "now": now,
+            "prefetched": None
+        }
+
+    async def _list_children(self, block_id: str, stats: Dict) -> List[Dict]:
+        """
+        한 블록의 직계 하위 블록을 모든 페이지에 걸쳐 비동기로 조회
+
+        Args:
+            block_id (str): 부모 블록 ID
+            stats (Dict): 조회 통계 (api_calls, blocks가 갱신됨)
+
+        Returns:
+            List[Dict]: 직계 하위 블록 리스트
+        """
+        blocks = []
+        start_cursor = None
+
+        while True:
+            kwargs = {"block_id": block_id, "page_size": 100}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+
+            async with self._request_slots:
+                response = await self.scheduler.acall(self.async_client.blocks.children.list, **kwargs)
+            stats["api_calls"] += 1
+            stats["blocks"] += len(response["results"])
+
+            blocks.extend(response["results"])
+
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not start_cursor:
+                return blocks
+
+    async def _expand(self, blocks: List[Dict], stats: Dict, depth: int):
+        """
+        `has_children`인 블록의 하위 트리를 동시에 채움
+
+        Args:
+            blocks (List[Dict]): 하위 트리를 채울 블록 리스트
+            stats (Dict): 조회 통계
+            depth (int): 채울 하위 블록의 깊이
+        """
+        async def fill(block: Dict):
+            block["children"] = await self._list_children(block["id"], stats)
+            stats["max_depth"] = max(stats["max_depth"], depth)
+            await self._expand(block["children"], stats, depth + 1)
+
+        await asyncio.gather(*(fill(block) for block in blocks if block.get("has_children")))
@@ -0,0 +1,4 @@
+"""
+오프라인 성능 측정 도구
+로컬 가짜 Notion API 서버로 동기화/렌더링 성능을 측정
+"""
@@ -0,0 +1,154 @@
+"""
+블록 렌더러 마이크로 벤치마크
+대용량 문서(기본 10,000개 블록)에서 BlockRenderer와 이전 if/elif 변환기의 처리량 비교
+
+사용법:
+    python -m benchmarks.bench_block_renderer --blocks 10000 --output renderer.json
+"""
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.fake_notion_server import FakeNotionWorkspace
+from benchmarks.run_benchmarks import BenchmarkRunner, build_report, write_report
+from block_renderer import BlockRenderer
+
+
+def legacy_rich_text(rich_text: List[Dict]) -> str:
+    """이전 NotionClient._extract_rich_text (두 변환기에 같은 rich text 변환 사용)"""
+    if not rich_text:
+        return ""
+
+    text_parts = []
+    for text_obj in rich_text:
+        text = text_obj["plain_text"]
+        if text_obj["annotations"]["bold"]:
+            text = f"**{text}**"
+        if text_obj["annotations"]["italic"]:
+            text = f"*{text}*"
+        if text_obj["annotations"]["code"]:
+            text = f"`{text}`"
+        if text_obj.get("href"):
+            text = f"[{text}]({text_obj['href']})"
+        text_parts.append(text)
+
+    return "".join(text_parts)
+
+
+def legacy_convert_block_list(blocks: List[Dict]) -> List[str]:
+    """이전 NotionClient._convert_block_list (if/elif 분기, 비교 기준)"""
+    markdown_parts = []
+
+    for block in blocks:
+        block_type = block["type"]
+
+        if block_type == "paragraph":
+            markdown_parts.append(legacy_rich_text(block["paragraph"]["rich_text"]))
+        elif block_type == "heading_1":
+            markdown_parts.append(f"# {legacy_rich_text(block['heading_1']['rich_text'])}")
+        elif block_type == "heading_2":
+            markdown_parts.append(f"## {legacy_rich_text(block['heading_2']['rich_text'])}")
+        elif block_type == "heading_3":
+            markdown_parts.append(f"### {legacy_rich_text(block['heading_3']['rich_text'])}")
+        elif block_type == "bulleted_list_item":
+            markdown_parts.append(f"- {legacy_rich_text(block['bulleted_list_item']['rich_text'])}")
+        elif block_type == "numbered_list_item":
+            markdown_parts.append(f"1. {legacy_rich_text(block['numbered_list_item']['rich_text'])}")
+        elif block_type == "code":
+            text = legacy_rich_text(block["code"]["rich_text"])
+            markdown_parts.append(f"```{block['code']['language']}\n{text}\n```")
+        elif block_type == "quote":
+            markdown_parts.append(f"> {legacy_rich_text(block['quote']['rich_text'])}")
+        elif block_type == "image":
+            image = block["image"]
+            image_url = image[image["type"]]["url"] if image["type"] in ("file", "external") else None
+            if image_url:
+                markdown_parts.append(f"![image]({image_url})")
+
+        children = block.get("children")
+        if children:
+            child_parts = legacy_convert_block_list(children)
+            if block_type in ("bulleted_list_item", "numbered_list_item"):
+                child_parts = [
+                    "\n".join("    " + line if line else line for line in part.split("\n"))
+                    for part in child_parts
+                ]
+            markdown_parts.extend(child_parts)
+
+    return markdown_parts
+
+
+def legacy_convert_blocks_to_markdown(blocks: List[Dict]) -> str:
+    return "\n\n".join(legacy_convert_block_list(blocks)) + "\n\n"
+
+
+def run_renderer_benchmarks(blocks: List[Dict], total_blocks: int, repeat: int = 5,
+                            verbose: bool = False) -> Dict[str, Dict]:
+    """
+    두 변환기의 처리 시간과 처리량(블록/초) 측정
+
+    Args:
+        blocks (List[Dict]): `children`이 채워진 블록 트리
+        total_blocks (int): 중첩 블록을 포함한 전체 블록 수
+        repeat (int): 반복 횟수
+        verbose (bool): 진행 메시지 표시 여부
+
+    Returns:
+        Dict[str, Dict]: 벤치마크 이름별 결과
+    """
+    runner = BenchmarkRunner(None, repeat=repeat, verbose=verbose)
+    renderer = BlockRenderer(rich_text=legacy_rich_text)
+
+    runner.measure("legacy_if_elif", lambda: legacy_convert_blocks_to_markdown(blocks), blocks=total_blocks)
+    runner.measure("block_renderer", lambda: renderer.render(blocks) + "\n\n", blocks=total_blocks)
+
+    for result in runner.results.values():
+        result["blocks_per_second"] = round(total_blocks / result["median"]) if result["median"] else None
+
+    baseline = runner.results["legacy_if_elif"]["median"]
+    current = runner.results["block_renderer"]["median"]
+    runner.results["block_renderer"]["speedup"] = round(baseline / current, 3) if current else None
+    return runner.results
+
+
+def _count_blocks(blocks: List[Dict]) -> int:
+    return sum(1 + _count_blocks(block.get("children") or []) for block in blocks)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="블록 렌더러 마이크로 벤치마크")
+    parser.add_argument("--blocks", type=int, default=10000, help="문서의 전체 블록 수 (중첩 포함, 근삿값)")
+    parser.add_argument("--depth", type=int, default=2, help="목록 블록 중첩 깊이")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="데이터 생성 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("--verbose", action="store_true", help="진행 메시지 표시")
+
+    args = parser.parse_args()
+
+    # 목록 블록의 하위 블록을 고려해 최상위 블록 수를 맞춤
+    probe = FakeNotionWorkspace(posts=1, blocks_per_post=100, nesting_depth=args.depth, images_per_post=0)
+    ratio = probe.block_count / 100
+    workspace = FakeNotionWorkspace(
+        posts=1,
+        blocks_per_post=max(1, round(args.blocks / ratio)),
+        nesting_depth=args.depth,
+        images_per_post=10,
+        seed=args.seed
+    )
+    blocks = workspace.block_tree(workspace.pages[0]["id"])
+    total_blocks = _count_blocks(blocks)
+
+    results = run_renderer_benchmarks(blocks, total_blocks, repeat=args.repeat, verbose=args.verbose)
+    report = build_report(args, results, document={"blocks": total_blocks, "top_level_blocks": len(blocks)})
+    write_report(report, Path(args.output).resolve() if args.output else None)
+
+
+if __name__ == "__main__":
+    main()
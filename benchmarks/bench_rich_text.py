@@ -0,0 +1,144 @@
+"""
+rich text 컴파일러 마이크로 벤치마크
+서식이 많은 rich text 픽스처에서 RichTextCompiler와 이전 _extract_rich_text의 처리량 비교
+
+사용법:
+    python -m benchmarks.bench_rich_text --items 20000 --output rich_text.json
+"""
+import sys
+import random
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.bench_block_renderer import legacy_rich_text
+from benchmarks.run_benchmarks import BenchmarkRunner, build_report, write_report
+from rich_text import RichTextCompiler
+
+WORDS = ["Notion", "동기화", "캐시", "마크다운", "렌더링", "이미지", "블록", "성능", "API", "스트리밍"]
+COLORS = ["default", "default", "default", "red", "blue", "gray_background", "yellow"]
+
+
+def make_run(rng: random.Random, annotated: bool) -> Dict:
+    """rich text 런 하나 생성 (annotated가 False이면 서식 없음)"""
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))) + rng.choice(["", " ", ", "])
+    annotations = {
+        "bold": annotated and rng.random() < 0.4,
+        "italic": annotated and rng.random() < 0.3,
+        "strikethrough": annotated and rng.random() < 0.1,
+        "underline": annotated and rng.random() < 0.1,
+        "code": annotated and rng.random() < 0.2,
+        "color": rng.choice(COLORS) if annotated else "default",
+    }
+    return {
+        "type": "text",
+        "plain_text": text,
+        "href": "https://example.com/" + rng.choice(WORDS) if annotated and rng.random() < 0.1 else None,
+        "annotations": annotations,
+    }
+
+
+def make_fixtures(items: int, runs: int, repeated_ratio: float, plain_ratio: float, seed: int = 0) -> List[List[Dict]]:
+    """
+    벤치마크용 rich text 목록 생성
+
+    Args:
+        items (int): rich text 목록 수 (블록 수)
+        runs (int): 목록당 최대 런 수
+        repeated_ratio (float): 여러 글에 반복되는 캡션/콜아웃 비율
+        plain_ratio (float): 서식이 전혀 없는 목록 비율
+        seed (int): 데이터 생성 시드
+
+    Returns:
+        List[List[Dict]]: rich text 목록 리스트
+    """
+    rng = random.Random(seed)
+    # 반복되는 캡션/콜아웃 (같은 내용이지만 매번 새 dict로 전달됨)
+    templates = [[make_run(rng, True) for _ in range(rng.randint(2, runs))] for _ in range(50)]
+
+    fixtures = []
+    for _ in range(items):
+        roll = rng.random()
+        if roll < repeated_ratio:
+            fixtures.append([{**run, "annotations": dict(run["annotations"])} for run in rng.choice(templates)])
+        elif roll < repeated_ratio + plain_ratio:
+            fixtures.append([make_run(rng, False) for _ in range(rng.randint(1, runs))])
+        else:
+            fixtures.append([make_run(rng, True) for _ in range(rng.randint(1, runs))])
+    return fixtures
+
+
+def run_rich_text_benchmarks(fixtures: List[List[Dict]], repeat: int = 5, verbose: bool = False) -> Dict[str, Dict]:
+    """
+    이전 함수와 컴파일러의 처리 시간 측정
+
+    - `compiler_uncached`: 캐시 없이 매번 변환
+    - `compiler_cold_cache`: 빈 캐시에서 한 번 변환 (픽스처 안의 반복만 캐시 적중)
+    - `compiler_warm_cache`: 같은 글을 다시 변환 (모든 목록이 캐시 적중)
+
+    Args:
+        fixtures (List[List[Dict]]): rich text 목록 리스트
+        repeat (int): 반복 횟수
+        verbose (bool): 진행 메시지 표시 여부
+
+    Returns:
+        Dict[str, Dict]: 벤치마크 이름별 결과
+    """
+    runner = BenchmarkRunner(None, repeat=repeat, verbose=verbose)
+    items = len(fixtures)
+
+    def compile_all(compiler):
+        return [compiler(rich_text) for rich_text in fixtures]
+
+    uncached = RichTextCompiler(cache_size=0)
+    state = {}
+
+    def fresh_compiler():
+        state["compiler"] = RichTextCompiler(cache_size=items)
+
+    warm = RichTextCompiler(cache_size=items)
+    compile_all(warm)
+    warm.hits = warm.misses = 0
+
+    runner.measure("legacy_extract_rich_text", lambda: compile_all(legacy_rich_text), items=items)
+    runner.measure("compiler_uncached", lambda: compile_all(uncached), items=items)
+    runner.measure("compiler_cold_cache", lambda: compile_all(state["compiler"]), setup=fresh_compiler, items=items)
+    runner.measure("compiler_warm_cache", lambda: compile_all(warm), items=items)
+
+    baseline = runner.results["legacy_extract_rich_text"]["median"]
+    for result in runner.results.values():
+        result["items_per_second"] = round(items / result["median"]) if result["median"] else None
+        result["speedup"] = round(baseline / result["median"], 3) if result["median"] else None
+
+    for name, compiler in (("compiler_cold_cache", state["compiler"]), ("compiler_warm_cache", warm)):
+        info = compiler.cache_info()
+        runner.results[name]["cache_hit_ratio"] = round(info["hits"] / max(info["hits"] + info["misses"], 1), 3)
+    return runner.results
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="rich text 컴파일러 마이크로 벤치마크")
+    parser.add_argument("--items", type=int, default=20000, help="rich text 목록 수")
+    parser.add_argument("--runs", type=int, default=8, help="목록당 최대 런 수")
+    parser.add_argument("--repeated", type=float, default=0.3, help="반복되는 캡션/콜아웃 비율")
+    parser.add_argument("--plain", type=float, default=0.2, help="서식 없는 목록 비율")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="데이터 생성 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("--verbose", action="store_true", help="진행 메시지 표시")
+
+    args = parser.parse_args()
+
+    fixtures = make_fixtures(args.items, args.runs, args.repeated, args.plain, seed=args.seed)
+    results = run_rich_text_benchmarks(fixtures, repeat=args.repeat, verbose=args.verbose)
+    report = build_report(args, results, fixtures={"items": len(fixtures), "runs": sum(map(len, fixtures))})
+    write_report(report, Path(args.output).resolve() if args.output else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,679 @@
+"""
+가짜 Notion API 서버
+생성된 데이터베이스(글 N개 × 블록 M개, 중첩 블록, 이미지)를 로컬 HTTP로 제공하는 기능
+"""
+import hmac
+import json
+import random
+import hashlib
+import struct
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+
+
+# 블록의 file 이미지 URL에 사용하는 호스트 (NotionClient가 Notion 이미지로 인식하는 주소)
+IMAGE_HOST = "prod-files-secure.s3.amazonaws.com"
+
+TAGS = ["Python", "Notion", "Streamlit", "자동화", "성능", "블로그"]
+WORDS = [
+    "노션", "블로그", "동기화", "성능", "측정", "캐시", "이미지", "마크다운",
+    "요청", "응답", "서버", "클라이언트", "데이터", "블록", "페이지", "속도"
+]
+
+
+def make_png(width: int, height: int, seed: int) -> bytes:
+    """
+    무작위 픽셀로 채운 유효한 PNG 생성 (압축되지 않아 실제 이미지 크기에 가까움)
+
+    Args:
+        width (int): 가로 픽셀 수
+        height (int): 세로 픽셀 수
+        seed (int): 픽셀 생성 시드
+
+    Returns:
+        bytes: PNG 파일 내용
+    """
+    rng = random.Random(seed)
+    row_size = width * 3
+    raw = b"".join(b"\x00" + rng.randbytes(row_size) for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 1))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _notion_time(value: datetime) -> str:
+    """Notion 타임스탬프 형식 (분 단위로 반올림된 UTC)"""
+    return value.replace(second=0, microsecond=0).strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _rich_text(content: str, bold: bool = False, italic: bool = False,
+               code: bool = False, href: Optional[str] = None) -> Dict:
+    """Notion rich text 객체 생성"""
+    return {
+        "type": "text",
+        "text": {"content": content, "link": {"url": href} if href else None},
+        "annotations": {
+            "bold": bold,
+            "italic": italic,
+            "strikethrough": False,
+            "underline": False,
+            "code": code,
+            "color": "default"
+        },
+        "plain_text": content,
+        "href": href
+    }
+
+
+class FakeNotionWorkspace:
+    """
+    가짜 Notion 데이터베이스 생성
+
+    같은 인자와 시드로 만들면 항상 같은 글/블록 ID와 내용을 생성합니다.
+    """
+
+    def __init__(
+        self,
+        posts: int = 20,
+        blocks_per_post: int = 50,
+        nesting_depth: int = 2,
+        images_per_post: int = 2,
+        image_size: int = 128,
+        draft_ratio: float = 0.1,
+        seed: int = 0
+    ):
+        """
+        Args:
+            posts (int): 데이터베이스의 글 수
+            blocks_per_post (int): 글당 최상위 블록 수
+            nesting_depth (int): 목록 블록의 최대 중첩 깊이
+            images_per_post (int): 글당 이미지 블록 수
+            image_size (int): 이미지 가로/세로 픽셀 수
+            draft_ratio (float): 발행되지 않은(Draft) 글 비율
+            seed (int): 데이터 생성 시드
+        """
+        self.rng = random.Random(seed)
+        self.nesting_depth = nesting_depth
+        self.image_size = image_size
+        self.database_id = self._new_id()
+        self.pages: List[Dict] = []
+        self.children: Dict[str, List[Dict]] = {}
+        self.image_seeds: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for index in range(posts):
+            edited = base_time + timedelta(hours=index)
+            page = self._make_page(index, edited, published=self.rng.random() >= draft_ratio)
+            self.pages.append(page)
+            self.children[page["id"]] = self._make_blocks(
+                page["id"], blocks_per_post, images_per_post, edited
+            )
+
+    @property
+    def block_count(self) -> int:
+        """전체 블록 수 (중첩 블록 포함)"""
+        return sum(len(blocks) for blocks in self.children.values())
+
+    @property
+    def published_pages(self) -> List[Dict]:
+        """발행된 글 페이지"""
+        return [
+            page for page in self.pages
+            if page["properties"]["상태"]["select"]["name"] == "Published"
+        ]
+
+    def _new_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _sentence(self, words: int = 8) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words))
+
+    def _make_page(self, index: int, edited: datetime, published: bool) -> Dict:
+        """데이터베이스 페이지(글) 생성"""
+        title = f"벤치마크 글 {index + 1}"
+        return {
+            "object": "page",
+            "id": self._new_id(),
+            "created_time": _notion_time(edited),
+            "last_edited_time": _notion_time(edited),
+            "archived": False,
+            "parent": {"type": "database_id", "database_id": self.database_id},
+            "properties": {
+                "제목": {"id": "title", "type": "title", "title": [_rich_text(title)]},
+                "슬러그": {"id": "slug", "type": "rich_text", "rich_text": [_rich_text(f"benchmark-post-{index + 1}")]},
+                "상태": {"id": "status", "type": "select", "select": {"name": "Published" if published else "Draft"}},
+                "발행일": {"id": "date", "type": "date", "date": {"start": (edited.date()).isoformat()}},
+                "태그": {"id": "tags", "type": "multi_select", "multi_select": [
+                    {"name": tag} for tag in self.rng.sample(TAGS, 2)
+                ]},
+                "메타 설명": {"id": "meta", "type": "rich_text", "rich_text": [_rich_text(self._sentence(12))]}
+            }
+        }
+
+    def _make_block(self, parent_id: str, block_type: str, data: Dict, edited: datetime) -> Dict:
+        return {
+            "object": "block",
+            "id": self._new_id(),
+            "parent": {"type": "block_id", "block_id": parent_id},
+            "created_time": _notion_time(edited),
+            "last_edited_time": _notion_time(edited),
+            "has_children": False,
+            "archived": False,
+            "type": block_type,
+            block_type: data
+        }
+
+    def _make_blocks(self, page_id: str, count: int, images: int, edited: datetime) -> List[Dict]:
+        """글의 최상위 블록 생성 (목록 블록에는 중첩 하위 블록 포함)"""
+        image_positions = {
+            int((i + 1) * count / (images + 1)) for i in range(images)
+        } if count else set()
+
+        blocks = []
+        for position in range(count):
+            if position in image_positions:
+                blocks.append(self._make_image_block(page_id, edited))
+                continue
+
+            kind = position % 10
+            if kind == 0:
+                block = self._make_block(page_id, f"heading_{self.rng.randint(1, 3)}", {
+                    "rich_text": [_rich_text(self._sentence(4))], "is_toggleable": False, "color": "default"
+                }, edited)
+            elif kind in (3, 4):
+                list_type = "bulleted_list_item" if kind == 3 else "numbered_list_item"
+                block = self._make_list_block(page_id, list_type, 1, edited)
+            elif kind == 6:
+                block = self._make_block(page_id, "code", {
+                    "rich_text": [_rich_text("def handler(event):\n    return event")],
+                    "language": "python",
+                    "caption": []
+                }, edited)
+            elif kind == 8:
+                block = self._make_block(page_id, "quote", {
+                    "rich_text": [_rich_text(self._sentence())], "color": "default"
+                }, edited)
+            else:
+                block = self._make_block(page_id, "paragraph", {
+                    "rich_text": [
+                        _rich_text(self._sentence()),
+                        _rich_text(" 강조", bold=True),
+                        _rich_text(" 링크", href="https://example.com/docs"),
+                        _rich_text(" " + self._sentence(5), italic=True)
+                    ],
+                    "color": "default"
+                }, edited)
+            blocks.append(block)
+
+        return blocks
+
+    def _make_list_block(self, parent_id: str, list_type: str, depth: int, edited: datetime) -> Dict:
+        """목록 블록 생성 (nesting_depth까지 하위 목록 추가)"""
+        block = self._make_block(parent_id, list_type, {
+            "rich_text": [_rich_text(self._sentence(6))], "color": "default"
+        }, edited)
+        if depth < self.nesting_depth:
+            block["has_children"] = True
+            self.children[block["id"]] = [
+                self._make_list_block(block["id"], list_type, depth + 1, edited) for _ in range(2)
+            ]
+        return block
+
+    def _make_image_block(self, parent_id: str, edited: datetime) -> Dict:
+        block = self._make_block(parent_id, "image", {}, edited)
+        self.image_seeds[block["id"]] = self.rng.getrandbits(32)
+        block["image"] = {
+            "caption": [_rich_text(self._sentence(3))],
+            "type": "file",
+            "file": {
+                "url": f"https://{IMAGE_HOST}/benchmark/{block['id']}/image.png?X-Amz-Signature={self.rng.getrandbits(64):016x}",
+                "expiry_time": _notion_time(edited + timedelta(hours=1))
+            }
+        }
+        return block
+
+    def block_tree(self, block_id: str) -> List[Dict]:
+        """
+        하위 블록을 `children`에 채운 블록 트리 (BlockTreeLoader.load와 같은 형식)
+
+        Args:
+            block_id (str): 글 또는 블록 ID
+
+        Returns:
+            List[Dict]: 최상위 블록 리스트 (복사본)
+        """
+        tree = []
+        for block in self.children.get(block_id, []):
+            block = dict(block)
+            if block["has_children"]:
+                block["children"] = self.block_tree(block["id"])
+            tree.append(block)
+        return tree
+
+    def touch_post(self, page_id: str, when: Optional[datetime] = None):
+        """
+        글과 첫 블록의 수정 시각 갱신 (증분 동기화 측정용)
+
+        Args:
+            page_id (str): 수정할 글 ID
+            when (Optional[datetime]): 수정 시각 (기본값: 현재 시각)
+        """
+        edited = _notion_time(when or datetime.now(timezone.utc))
+        with self._lock:
+            for page in self.pages:
+                if page["id"] == page_id:
+                    page["last_edited_time"] = edited
+            blocks = self.children.get(page_id)
+            if blocks:
+                blocks[0]["last_edited_time"] = edited
+
+    def rotate_image_signatures(self):
+        """모든 이미지 URL의 서명 갱신 (Notion이 조회할 때마다 새로 서명한 URL을 주는 동작 재현)"""
+        with self._lock:
+            for blocks in self.children.values():
+                for block in blocks:
+                    if block["type"] == "image":
+                        url = block["image"]["file"]["url"].split("?")[0]
+                        block["image"]["file"]["url"] = f"{url}?X-Amz-Signature={self.rng.getrandbits(64):016x}"
+
+    def get_page(self, page_id: str) -> Optional[Dict]:
+        """pages.retrieve 응답 생성 (없으면 None)"""
+        with self._lock:
+            for page in self.pages:
+                if page["id"].replace("-", "") == page_id.replace("-", ""):
+                    return dict(page)
+        return None
+
+    def query_database(self, body: Dict, filter_properties: List[str]) -> Dict:
+        """
+        databases.query 응답 생성 (filter, sorts, 페이지네이션, filter_properties 지원)
+
+        Raises:
+            ValueError: 지원하지 않는 필터가 포함된 경우
+        """
+        with self._lock:
+            pages = [page for page in self.pages if self._matches(page, body.get("filter"))]
+
+        for sort in reversed(body.get("sorts") or []):
+            pages.sort(
+                key=lambda page: self._sort_value(page, sort),
+                reverse=sort.get("direction") == "descending"
+            )
+
+        if filter_properties:
+            wanted = set(filter_properties)
+            pages = [
+                dict(page, properties={
+                    name: prop for name, prop in page["properties"].items()
+                    if name in wanted or prop["id"] in wanted
+                })
+                for page in pages
+            ]
+
+        return self._paginate(pages, body.get("start_cursor"), body.get("page_size"), "page")
+
+    def list_children(self, block_id: str, start_cursor: Optional[str], page_size: Optional[int]) -> Dict:
+        """blocks.children.list 응답 생성"""
+        with self._lock:
+            blocks = list(self.children.get(block_id, []))
+        return self._paginate(blocks, start_cursor, page_size, "block")
+
+    def _paginate(self, items: List[Dict], start_cursor: Optional[str], page_size: Optional[int], kind: str) -> Dict:
+        start = 0
+        if start_cursor:
+            ids = [item["id"] for item in items]
+            start = ids.index(start_cursor) if start_cursor in ids else len(items)
+        size = min(max(int(page_size or 100), 1), 100)
+        results = items[start:start + size]
+        has_more = start + size < len(items)
+        return {
+            "object": "list",
+            "results": results,
+            "next_cursor": items[start + size]["id"] if has_more else None,
+            "has_more": has_more,
+            "type": kind,
+            kind: {}
+        }
+
+    @staticmethod
+    def _sort_value(page: Dict, sort: Dict):
+        if sort.get("timestamp"):
+            return page[sort["timestamp"]]
+        prop = page["properties"].get(sort.get("property"), {})
+        if prop.get("type") == "date":
+            return (prop["date"] or {}).get("start") or ""
+        return json.dumps(prop, ensure_ascii=False)
+
+    def _matches(self, page: Dict, query_filter: Optional[Dict]) -> bool:
+        """Notion 필터 평가 (and/or, select, rich_text, multi_select, 타임스탬프)"""
+        if not query_filter:
+            return True
+        if "and" in query_filter:
+            return all(self._matches(page, item) for item in query_filter["and"])
+        if "or" in query_filter:
+            return any(self._matches(page, item) for item in query_filter["or"])
+
+        if query_filter.get("timestamp") in ("last_edited_time", "created_time"):
+            name = query_filter["timestamp"]
+            value = _parse_time(page[name])
+            condition = query_filter[name]
+            checks = {
+                "on_or_after": lambda bound: value >= bound,
+                "after": lambda bound: value > bound,
+                "on_or_before": lambda bound: value <= bound,
+                "before": lambda bound: value < bound,
+            }
+            return all(
+                checks[op](_parse_time(bound)) for op, bound in condition.items() if op in checks
+            )
+
+        prop = page["properties"].get(query_filter.get("property"))
+        if prop is None:
+            raise ValueError(f"Could not find property with name or id: {query_filter.get('property')}")
+
+        if "select" in query_filter:
+            return (prop["select"] or {}).get("name") == query_filter["select"].get("equals")
+        if "rich_text" in query_filter:
+            text = "".join(item["plain_text"] for item in prop["rich_text"])
+            return text == query_filter["rich_text"].get("equals")
+        if "multi_select" in query_filter:
+            names = {item["name"] for item in prop["multi_select"]}
+            return query_filter["multi_select"].get("contains") in names
+
+        raise ValueError(f"지원하지 않는 필터입니다: {query_filter}")
+
+    def image_bytes(self, block_id: str) -> Optional[bytes]:
+        """이미지 블록의 파일 내용"""
+        seed = self.image_seeds.get(block_id)
+        if seed is None:
+            return None
+        return make_png(self.image_size, self.image_size, seed)
+
+
+class _FakeNotionHandler(BaseHTTPRequestHandler):
+    """가짜 Notion API 요청 처리"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 한 번에 보내 keep-alive 연결에서 Nagle 지연이 생기지 않도록 함
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    server: "_FakeHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def _dispatch(self, method: str):
+        fake = self.server.fake
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        query = parse_qs(url.query)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+
+        # 이미지 파일: /benchmark/{block_id}/image.png
+        if method == "GET" and parts and parts[-1].endswith(".png"):
+            fake.count("images")
+            content = fake.workspace.image_bytes(parts[-2]) if len(parts) >= 2 else None
+            if content is None:
+                self._send(404, b"Not Found", "text/plain")
+            else:
+                self._send(200, content, "image/png")
+            return
+
+        if not parts or parts[0] != "v1":
+            self._send_error(404, "object_not_found", f"Unknown path: {url.path}")
+            return
+
+        if fake.latency:
+            time.sleep(fake.latency)
+
+        if fake.should_rate_limit():
+            self._send_error(
+                429, "rate_limited", "You have been rated limited. Please try again in a few minutes.",
+                {"Retry-After": fake.retry_after}
+            )
+            return
+
+        try:
+            if method == "POST" and len(parts) == 4 and parts[1] == "databases" and parts[3] == "query":
+                fake.count("databases.query")
+                if parts[2].replace("-", "") != fake.workspace.database_id.replace("-", ""):
+                    self._send_error(404, "object_not_found", f"Could not find database with ID: {parts[2]}.")
+                    return
+                body = json.loads(raw_body or b"{}")
+                self._send_json(fake.workspace.query_database(body, query.get("filter_properties", [])))
+                return
+
+            if method == "GET" and len(parts) == 3 and parts[1] == "pages":
+                fake.count("pages.retrieve")
+                page = fake.workspace.get_page(parts[2])
+                if page is None:
+                    self._send_error(404, "object_not_found", f"Could not find page with ID: {parts[2]}.")
+                else:
+                    self._send_json(page)
+                return
+
+            if method == "GET" and len(parts) == 4 and parts[1] == "blocks" and parts[3] == "children":
+                fake.count("blocks.children.list")
+                self._send_json(fake.workspace.list_children(
+                    parts[2],
+                    (query.get("start_cursor") or [None])[0],
+                    (query.get("page_size") or [None])[0]
+                ))
+                return
+
+        except ValueError as e:
+            self._send_error(400, "validation_error", str(e))
+            return
+
+        self._send_error(404, "object_not_found", f"Unknown endpoint: {method} {url.path}")
+
+    def _send(self, status: int, content: bytes, content_type: str, headers: Optional[Dict] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_json(self, data: Dict, status: int = 200, headers: Optional[Dict] = None):
+        self._send(status, json.dumps(data, ensure_ascii=False).encode("utf-8"), "application/json", headers)
+
+    def _send_error(self, status: int, code: str, message: str, headers: Optional[Dict] = None):
+        self._send_json(
+            {"object": "error", "status": status, "code": code, "message": message},
+            status,
+            headers
+        )
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeNotionServer"
+
+
+class FakeNotionServer:
+    """
+    로컬 가짜 Notion API 서버
+
+    사용 예:
+        with FakeNotionServer(FakeNotionWorkspace(posts=50)) as server:
+            settings.NOTION_API_BASE_URL = server.url
+    """
+
+    def __init__(
+        self,
+        workspace: FakeNotionWorkspace,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: str = "0.05"
+    ):
+        """
+        Args:
+            workspace (FakeNotionWorkspace): 제공할 데이터베이스
+            host (str): 바인딩 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            latency (float): API 응답마다 추가할 지연 시간(초)
+            rate_limit_every (int): N번째 API 요청마다 429 응답 (0이면 사용 안 함)
+            retry_after (str): 429 응답의 Retry-After 헤더 값
+        """
+        self.workspace = workspace
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self._httpd = _FakeHTTPServer((host, port), _FakeNotionHandler)
+        self._httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._api_requests = 0
+        self.stats: Dict[str, int] = {}
+
+    @property
+    def url(self) -> str:
+        """서버 주소 (settings.NOTION_API_BASE_URL에 사용)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str):
+        """요청 수 집계"""
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def should_rate_limit(self) -> bool:
+        """이번 API 요청을 429로 응답할지 결정"""
+        with self._lock:
+            self._api_requests += 1
+            if self.rate_limit_every and self._api_requests % self.rate_limit_every == 0:
+                self.stats["rate_limited"] = self.stats.get("rate_limited", 0) + 1
+                return True
+            return False
+
+    def reset_stats(self) -> Dict[str, int]:
+        """
+        요청 수 집계를 초기화
+
+        Returns:
+            Dict[str, int]: 초기화 직전까지의 집계
+        """
+        with self._lock:
+            stats, self.stats = self.stats, {}
+            return stats
+
+    def start(self) -> "FakeNotionServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeNotionServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def image_transport(self) -> "ImageHostTransport":
+        """Notion 이미지 호스트 요청을 이 서버로 보내는 httpx transport"""
+        return ImageHostTransport(self.url)
+
+
+def page_event(page_id: str, event_type: str = "page.content_updated") -> Dict:
+    """
+    Notion 웹훅 페이지 이벤트 생성
+
+    Args:
+        page_id (str): 변경된 페이지 ID
+        event_type (str): 이벤트 종류 (page.created, page.content_updated, page.properties_updated, page.deleted 등)
+
+    Returns:
+        Dict: Notion 웹훅 요청 본문 형식의 이벤트
+    """
+    return {
+        "id": str(uuid.uuid4()),
+        "timestamp": _notion_time(datetime.now(timezone.utc)),
+        "type": event_type,
+        "entity": {"id": page_id, "type": "page"},
+        "data": {}
+    }
+
+
+def post_page_event(
+    receiver_url: str,
+    page_id: str,
+    event_type: str = "page.content_updated",
+    secret: Optional[str] = None
+) -> httpx.Response:
+    """
+    웹훅 수신기에 페이지 이벤트 전송 (Notion 웹훅 대신 사용하는 로컬 이벤트 소스)
+
+    Args:
+        receiver_url (str): 수신기 주소
+        page_id (str): 변경된 페이지 ID
+        event_type (str): 이벤트 종류
+        secret (Optional[str]): 서명 토큰 (있으면 X-Notion-Signature 헤더 추가)
+
+    Returns:
+        httpx.Response: 수신기 응답
+    """
+    body = json.dumps(page_event(page_id, event_type)).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if secret:
+        headers["X-Notion-Signature"] = "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return httpx.post(receiver_url, content=body, headers=headers)
+
+
+class ImageHostTransport(httpx.BaseTransport):
+    """IMAGE_HOST로 가는 요청을 가짜 서버로 바꿔 보내는 httpx transport"""
+
+    def __init__(self, server_url: str, inner: Optional[httpx.BaseTransport] = None):
+        self.target = httpx.URL(server_url)
+        self.inner = inner or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == IMAGE_HOST:
+            request.url = request.url.copy_with(
+                scheme=self.target.scheme, host=self.target.host, port=self.target.port
+            )
+            request.headers["Host"] = f"{self.target.host}:{self.target.port}"
+        return self.inner.handle_request(request)
+
+    def close(self):
+        self.inner.close()
@@ -0,0 +1,371 @@
+"""
+오프라인 벤치마크 실행
+로컬 가짜 Notion API 서버를 띄우고 주요 조회/렌더링/동기화 경로의 소요 시간을 JSON으로 기록
+
+사용법:
+    python -m benchmarks.run_benchmarks --posts 50 --blocks 40 --output benchmark.json
+"""
+import os
+import io
+import gc
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from contextlib import redirect_stdout, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import httpx
+
+from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace
+
+
+# 결과 JSON 형식 버전 (필드 의미가 바뀌면 증가)
+RESULT_FORMAT_VERSION = 1
+
+
+class BenchmarkRunner:
+    """가짜 Notion 서버를 대상으로 벤치마크를 실행하고 결과를 모음"""
+
+    def __init__(self, server: Optional[FakeNotionServer], repeat: int = 5, verbose: bool = False):
+        """
+        Args:
+            server (Optional[FakeNotionServer]): 실행 중인 가짜 Notion 서버 (None이면 요청 수를 집계하지 않음)
+            repeat (int): 벤치마크별 반복 횟수
+            verbose (bool): 측정 대상 코드의 출력을 그대로 표시할지 여부
+        """
+        self.server = server
+        self.repeat = max(1, repeat)
+        self.verbose = verbose
+        self.results: Dict[str, Dict] = {}
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], object],
+        setup: Optional[Callable[[], None]] = None,
+        **extra
+    ) -> Dict:
+        """
+        함수를 repeat회 실행해 소요 시간과 서버 요청 수를 기록
+
+        Args:
+            name (str): 벤치마크 이름
+            func (Callable): 측정할 함수
+            setup (Optional[Callable]): 매 반복 전에 실행할 준비 함수 (측정 제외)
+            **extra: 결과에 함께 기록할 값
+
+        Returns:
+            Dict: 측정 결과
+        """
+        timings: List[float] = []
+        if self.server:
+            self.server.reset_stats()
+
+        for _ in range(self.repeat):
+            with self.quiet():
+                if setup:
+                    setup()
+                gc.collect()
+                started = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - started)
+
+        requests = self.server.reset_stats() if self.server else {}
+        result = {
+            "repeat": self.repeat,
+            "min": round(min(timings), 6),
+            "median": round(statistics.median(timings), 6),
+            "mean": round(statistics.mean(timings), 6),
+            "max": round(max(timings), 6),
+            "stdev": round(statistics.stdev(timings), 6) if len(timings) > 1 else 0.0,
+            **extra
+        }
+        if self.server:
+            result["requests_per_run"] = {
+                key: round(value / self.repeat, 2) for key, value in sorted(requests.items())
+            }
+        self.results[name] = result
+        print(f"{name}: median {result['median'] * 1000:.1f}ms (min {result['min'] * 1000:.1f}ms)", file=sys.stderr)
+        return result
+
+    def quiet(self):
+        """측정 대상 코드의 진행 메시지를 숨김"""
+        return nullcontext() if self.verbose else redirect_stdout(io.StringIO())
+
+
+def configure_environment(server: FakeNotionServer, rate_limit: float):
+    """
+    설정과 공유 HTTP 클라이언트를 가짜 서버로 연결
+
+    요청 스케줄러는 처음 사용할 때 설정값으로 만들어지므로
+    NotionClient를 만들기 전에 호출해야 합니다.
+    """
+    from config.settings import settings
+    from http_session import DEFAULT_HEADERS, pool_timeout, set_http_client
+
+    settings.NOTION_TOKEN = "secret_benchmark"
+    settings.NOTION_DATABASE_ID = server.workspace.database_id
+    settings.NOTION_API_BASE_URL = server.url
+    settings.NOTION_RATE_LIMIT = rate_limit
+    settings.HTTP_RATE_LIMIT = rate_limit
+
+    # 동기화 성공 알림(GitHub 이슈) 전송 방지
+    os.environ.pop("GITHUB_TOKEN", None)
+
+    # Notion 이미지 호스트 요청을 가짜 서버로 전달
+    set_http_client(httpx.Client(
+        transport=server.image_transport(),
+        timeout=pool_timeout(),
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True
+    ))
+
+
+def run_benchmarks(
+    server: FakeNotionServer,
+    workdir: Path,
+    repeat: int = 5,
+    concurrency: int = 1,
+    verbose: bool = False
+) -> Dict[str, Dict]:
+    """
+    모든 벤치마크 실행
+
+    Args:
+        server (FakeNotionServer): 실행 중인 가짜 Notion 서버 (configure_environment 적용 후)
+        workdir (Path): 저장소/스냅샷/이미지를 기록할 작업 디렉토리
+        repeat (int): 벤치마크별 반복 횟수
+        concurrency (int): run_sync의 글 렌더링 동시 실행 수
+        verbose (bool): 측정 대상 코드의 출력 표시 여부
+
+    Returns:
+        Dict[str, Dict]: 벤치마크 이름별 결과
+    """
+    from notion_client import NotionClient
+    from block_loader import BlockTreeLoader
+    from sync_notion import NotionSyncWorkflow, GitManager
+
+    class NoGitManager(GitManager):
+        """작업 디렉토리가 Git 저장소가 아니므로 커밋/푸시를 건너뜀"""
+
+        def has_changes(self) -> bool:
+            return False
+
+    workspace = server.workspace
+    runner = BenchmarkRunner(server, repeat=repeat, verbose=verbose)
+    published = sorted(
+        workspace.published_pages,
+        key=lambda page: page["properties"]["발행일"]["date"]["start"],
+        reverse=True
+    )
+    if not published:
+        raise ValueError("발행된 글이 없어 벤치마크를 실행할 수 없습니다.")
+
+    live_dir = workdir / "live"
+    live_dir.mkdir(parents=True)
+    os.chdir(live_dir)
+
+    # 콘텐츠 저장소 없이 항상 Notion API를 호출하는 클라이언트
+    client = NotionClient()
+    client.store = None
+
+    runner.measure(
+        "fetch_published_posts",
+        client.fetch_published_posts,
+        posts=len(published)
+    )
+
+    slug = published[len(published) // 2]["properties"]["슬러그"]["rich_text"][0]["plain_text"]
+    runner.measure(
+        "get_post_by_slug",
+        lambda: client.get_post_by_slug(slug),
+        slug=slug
+    )
+
+    # 스트리밍 렌더링: 첫 섹션을 받을 때까지의 시간 (time-to-first-content)
+    def first_section():
+        sections = client.iter_post_sections(client.find_post_by_slug(slug))
+        next(sections, None)
+        sections.close()
+
+    runner.measure("get_post_by_slug_first_section", first_section, slug=slug)
+
+    # 변환/이미지 처리는 블록 트리를 미리 조회해 두고 로컬 처리 시간만 측정
+    loader = BlockTreeLoader(client.client, scheduler=client.scheduler)
+    with runner.quiet():
+        trees = [(page["id"], loader.load(page["id"])) for page in published]
+    blocks_count = sum(_count_blocks(blocks) for _, blocks in trees)
+
+    runner.measure(
+        "convert_blocks_to_markdown",
+        lambda: [client.convert_blocks_to_markdown(blocks) for _, blocks in trees],
+        posts=len(trees),
+        blocks=blocks_count
+    )
+
+    markdowns = [(page_id, client.convert_blocks_to_markdown(blocks)) for page_id, blocks in trees]
+    runner.measure(
+        "process_notion_images",
+        lambda: [client.process_notion_images(markdown, page_id, []) for page_id, markdown in markdowns],
+        posts=len(markdowns),
+        images=sum(markdown.count("![") for _, markdown in markdowns)
+    )
+
+    # 전체 동기화: 반복마다 빈 작업 디렉토리에서 시작
+    sync_runs = iter(range(runner.repeat))
+
+    def fresh_sync_dir():
+        run_dir = workdir / "sync" / str(next(sync_runs))
+        run_dir.mkdir(parents=True)
+        os.chdir(run_dir)
+
+    def sync_once():
+        workflow = NotionSyncWorkflow(concurrency=concurrency)
+        workflow.git_manager = NoGitManager()
+        summary = workflow.run_sync()
+        if not summary["success"]:
+            raise RuntimeError(f"동기화 실패: {summary['errors']}")
+
+    runner.measure(
+        "run_sync",
+        sync_once,
+        setup=fresh_sync_dir,
+        concurrency=concurrency,
+        posts=len(published)
+    )
+
+    # 증분 동기화: 마지막 전체 동기화 디렉토리에서 글 하나씩 수정 후 실행
+    touched = iter(published * runner.repeat)
+    runner.measure(
+        "run_sync_incremental",
+        sync_once,
+        setup=lambda: workspace.touch_post(next(touched)["id"]),
+        concurrency=concurrency
+    )
+
+    return runner.results
+
+
+def _count_blocks(blocks: List[Dict]) -> int:
+    return sum(1 + _count_blocks(block.get("children") or []) for block in blocks)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(args: argparse.Namespace, results: Dict[str, Dict], **sections) -> Dict:
+    """
+    결과 JSON 생성
+
+    Args:
+        args (argparse.Namespace): 실행 인자 (output, verbose 제외하고 기록)
+        results (Dict[str, Dict]): 벤치마크 이름별 결과
+        **sections: 함께 기록할 항목 (예: workspace)
+
+    Returns:
+        Dict: 결과 JSON
+    """
+    return {
+        "format_version": RESULT_FORMAT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit()
+        },
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "verbose")},
+        **sections,
+        "results": results
+    }
+
+
+def write_report(report: Dict, output_path: Optional[Path] = None):
+    """결과 JSON을 파일 또는 표준 출력에 기록"""
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if output_path:
+        output_path.write_text(text + "\n", encoding="utf-8")
+        print(f"결과 저장: {output_path}", file=sys.stderr)
+    else:
+        print(text)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="가짜 Notion API 서버 기반 오프라인 벤치마크")
+    parser.add_argument("--posts", type=int, default=20, help="데이터베이스 글 수")
+    parser.add_argument("--blocks", type=int, default=50, help="글당 최상위 블록 수")
+    parser.add_argument("--depth", type=int, default=2, help="목록 블록 중첩 깊이")
+    parser.add_argument("--images", type=int, default=2, help="글당 이미지 수")
+    parser.add_argument("--image-size", type=int, default=128, help="이미지 가로/세로 픽셀 수")
+    parser.add_argument("--repeat", type=int, default=5, help="벤치마크별 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=1, help="run_sync 글 렌더링 동시 실행 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="API 응답 지연(초)")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 API 요청마다 429 응답")
+    parser.add_argument("--client-rate", type=float, default=1000.0, help="클라이언트 초당 요청 제한")
+    parser.add_argument("--seed", type=int, default=0, help="데이터 생성 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본값: 표준 출력)")
+    parser.add_argument("--verbose", action="store_true", help="측정 대상 코드의 출력 표시")
+
+    args = parser.parse_args()
+
+    workspace = FakeNotionWorkspace(
+        posts=args.posts,
+        blocks_per_post=args.blocks,
+        nesting_depth=args.depth,
+        images_per_post=args.images,
+        image_size=args.image_size,
+        seed=args.seed
+    )
+    original_cwd = Path.cwd()
+    output_path = Path(args.output).resolve() if args.output else None
+
+    with FakeNotionServer(
+        workspace,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every
+    ) as server, tempfile.TemporaryDirectory(prefix="notion-bench-") as workdir:
+        configure_environment(server, args.client_rate)
+        try:
+            results = run_benchmarks(
+                server,
+                Path(workdir),
+                repeat=args.repeat,
+                concurrency=args.concurrency,
+                verbose=args.verbose
+            )
+        finally:
+            os.chdir(original_cwd)
+
+    report = build_report(args, results, workspace={
+        "posts": len(workspace.pages),
+        "published_posts": len(workspace.published_pages),
+        "blocks": workspace.block_count,
+        "images": len(workspace.image_seeds)
+    })
+    write_report(report, output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Notion 블록 트리 로더
+페이지의 모든 하위 블록을 페이지네이션과 중첩 구조까지 포함해 병렬로 조회
+"""
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Optional, Iterator
+
+from config.settings import settings
+from request_scheduler import get_scheduler, RequestScheduler
+
+
+class BlockTreeLoader:
+    """Notion 블록 트리 병렬 로더"""
+
+    def __init__(
+        self,
+        client,
+        max_workers: Optional[int] = None,
+        page_size: int = 100,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        """
+        블록 트리 로더 초기화
+
+        Args:
+            client: notion-client의 Client 인스턴스
+            max_workers (Optional[int]): 동시에 실행할 최대 요청 수
+            page_size (int): 요청당 조회할 블록 수 (최대 100)
+            scheduler (Optional[RequestScheduler]): 요청 스케줄러 (기본값: 공유 Notion 스케줄러)
+        """
+        self.client = client
+        self.max_workers = max_workers or settings.BLOCK_FETCH_WORKERS
+        self.page_size = min(max(page_size, 1), 100)
+        self.scheduler = scheduler or get_scheduler("notion")
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """조회 통계 초기화"""
+        self.last_stats = {"api_calls": 0, "blocks": 0, "max_depth": 0, "elapsed": 0.0}
+
+    def load(self, block_id: str) -> List[Dict]:
+        """
+        블록의 전체 하위 트리를 조회
+
+        `has_children`인 블록은 `children` 키에 하위 블록 리스트가 채워집니다.
+        같은 깊이의 하위 목록 조회는 워커 풀에서 동시에 실행됩니다.
+
+        Args:
+            block_id (str): 루트 블록(또는 페이지) ID
+
+        Returns:
+            List[Dict]: 하위 블록이 채워진 최상위 블록 리스트
+        """
+        self.reset_stats()
+        root = self.list_children(block_id)
+        self.expand(root)
+        return root
+
+    def list_children(self, block_id: str) -> List[Dict]:
+        """
+        한 블록의 직계 하위 블록만 조회 (하위 트리는 채우지 않음)
+
+        Args:
+            block_id (str): 부모 블록 ID
+
+        Returns:
+            List[Dict]: 직계 하위 블록 리스트
+        """
+        started = time.perf_counter()
+        blocks = self._list_children(block_id)
+        self.last_stats["elapsed"] = round(self.last_stats["elapsed"] + time.perf_counter() - started, 3)
+        return blocks
+
+    def expand(self, blocks: List[Dict]):
+        """
+        주어진 블록들 중 `has_children`인 블록의 하위 트리를 병렬로 채움
+
+        Args:
+            blocks (List[Dict]): 하위 트리를 채울 블록 리스트
+        """
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            for block in blocks:
+                if block.get("has_children"):
+                    pending[executor.submit(self._list_children, block["id"])] = (block, 1)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent, depth = pending.pop(future)
+                    children = future.result()
+                    parent["children"] = children
+                    self.last_stats["max_depth"] = max(self.last_stats["max_depth"], depth)
+
+                    for child in children:
+                        if child.get("has_children"):
+                            pending[executor.submit(self._list_children, child["id"])] = (child, depth + 1)
+
+        self.last_stats["elapsed"] = round(self.last_stats["elapsed"] + time.perf_counter() - started, 3)
+
+    def iter_blocks(self, block_id: str) -> Iterator[Dict]:
+        """
+        최상위 블록을 하위 트리가 채워지는 대로 순서대로 반환
+
+        최상위 블록을 한 페이지(page_size개) 받을 때마다 하위 트리 조회를 워커 풀에 맡기고,
+        앞쪽 블록부터 하위 트리가 완성되는 즉시 반환합니다. 호출하는 쪽이 앞 블록을
+        변환하는 동안 뒤쪽 블록의 하위 트리는 계속 조회됩니다.
+
+        Args:
+            block_id (str): 루트 블록(또는 페이지) ID
+
+        Yields:
+            Dict: `children`이 채워진 최상위 블록
+        """
+        self.reset_stats()
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        try:
+            for page in self._iter_child_pages(block_id):
+                futures = [
+                    executor.submit(self._load_subtree, block, 1) if block.get("has_children") else None
+                    for block in page
+                ]
+                for block, future in zip(page, futures):
+                    if future is not None:
+                        future.result()
+                    yield block
+        finally:
+            # 호출하는 쪽이 중간에 멈추면 아직 시작하지 않은 조회는 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.last_stats["elapsed"] = round(time.perf_counter() - started, 3)
+
+    def _load_subtree(self, block: Dict, depth: int):
+        """블록 하나의 하위 트리를 깊이 우선으로 채움 (iter_blocks의 워커에서 실행)"""
+        block["children"] = self._list_children(block["id"])
+        with self._lock:
+            self.last_stats["max_depth"] = max(self.last_stats["max_depth"], depth)
+
+        for child in block["children"]:
+            if child.get("has_children"):
+                self._load_subtree(child, depth + 1)
+
+    def _list_children(self, block_id: str) -> List[Dict]:
+        """
+        한 블록의 직계 하위 블록을 모든 페이지에 걸쳐 조회
+
+        Args:
+            block_id (str): 부모 블록 ID
+
+        Returns:
+            List[Dict]: 직계 하위 블록 리스트
+        """
+        blocks = []
+        for page in self._iter_child_pages(block_id):
+            blocks.extend(page)
+        return blocks
+
+    def _iter_child_pages(self, block_id: str) -> Iterator[List[Dict]]:
+        """
+        한 블록의 직계 하위 블록을 API 응답 페이지 단위로 반환
+
+        Args:
+            block_id (str): 부모 블록 ID
+
+        Yields:
+            List[Dict]: 응답 한 페이지의 블록 리스트
+        """
+        start_cursor = None
+
+        while True:
+            kwargs = {"block_id": block_id, "page_size": self.page_size}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+
+            response = self.scheduler.call(self.client.blocks.children.list, **kwargs)
+            with self._lock:
+                self.last_stats["api_calls"] += 1
+                self.last_stats["blocks"] += len(response["results"])
+
+            yield response["results"]
+
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not start_cursor:
+                return
@@ -0,0 +1,373 @@
+"""
+블록 렌더러 모듈
+블록 타입별 핸들러 레지스트리로 Notion 블록 트리를 마크다운으로 변환하는 기능 제공
+"""
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+
+# 하위 블록을 한 단계 들여 써야 하는 목록 블록
+LIST_TYPES = ("bulleted_list_item", "numbered_list_item", "to_do")
+
+# 목록 하위 블록 들여쓰기
+INDENT = "    "
+
+# 블록 사이 구분자
+BLOCK_SEPARATOR = "\n\n"
+
+# 스트리밍 렌더링 시 새 섹션을 시작하는 최상위 블록
+SECTION_TYPES = ("heading_1", "heading_2", "heading_3")
+
+
+def plain_rich_text(rich_text: List[Dict]) -> str:
+    """rich text를 서식 없이 이어 붙임 (기본 rich text 변환기)"""
+    return "".join(item.get("plain_text", "") for item in rich_text or [])
+
+
+def alt_text(caption: str) -> str:
+    """이미지 캡션을 마크다운 대체 텍스트로 사용할 수 있게 정리 (대괄호/줄바꿈 제거)"""
+    return " ".join(caption.replace("[", " ").replace("]", " ").split())
+
+
+def list_numbers(blocks: List[Dict]) -> Dict[str, int]:
+    """
+    형제 블록 중 번호 목록 항목의 번호 계산
+
+    연속된 numbered_list_item은 1부터 차례로 번호가 붙고, 다른 타입의 블록이 나오면 다시 시작합니다.
+
+    Args:
+        blocks (List[Dict]): 같은 부모를 가진 블록 리스트
+
+    Returns:
+        Dict[str, int]: 블록 ID별 번호 (번호 목록 항목만 포함)
+    """
+    numbers = {}
+    number = 0
+    for block in blocks:
+        if block.get("type") == "numbered_list_item":
+            number += 1
+            numbers[block.get("id")] = number
+        else:
+            number = 0
+    return numbers
+
+
+# 에셋 리졸버: (block_id, url, caption) -> 출력할 URL (None이면 원래 URL 사용)
+AssetResolver = Callable[[str, str, str], Optional[str]]
+
+
+class RenderContext:
+    """
+    렌더링 한 번의 상태
+
+    출력 버퍼, 현재 들여쓰기, 번호 목록 번호, 지원하지 않는 블록 타입 집계를 관리합니다.
+    """
+
+    def __init__(self, renderer: "BlockRenderer", resolve_asset: Optional[AssetResolver] = None):
+        self.renderer = renderer
+        # rich text 변환 함수 (핸들러에서 ctx.rich_text(...)로 호출)
+        self.rich_text: Callable[[List[Dict]], str] = renderer.rich_text
+        # 이미지 등 에셋 URL을 변환할 때 호출 (예: 다운로드 후 저장소 URL로 교체)
+        self.resolve_asset = resolve_asset
+        # 블록마다 [구분자, 마크다운]을 추가하고 결과에서 첫 구분자를 뺌
+        self.buffer: List[str] = []
+        self.indent = ""
+        self.depth = 0
+        self.list_number = 0
+        self.unknown_types: Counter = Counter()
+
+    def write(self, text: str):
+        """
+        블록 하나의 마크다운을 버퍼에 추가 (현재 들여쓰기 적용)
+
+        Args:
+            text (str): 블록 마크다운
+        """
+        if self.indent:
+            text = "\n".join(self.indent + line if line else line for line in text.split("\n"))
+        self.buffer.append(BLOCK_SEPARATOR)
+        self.buffer.append(text)
+
+    @property
+    def markdown(self) -> str:
+        """지금까지 렌더링된 마크다운"""
+        return "".join(self.buffer[1:])
+
+
+# 핸들러: (block, data, ctx) -> 블록 마크다운 (None이면 출력하지 않음)
+# 또는 문자열: rich text 앞에 붙는 접두어 (함수 호출 없이 처리되는 빠른 경로)
+BlockHandler = Union[str, Callable[[Dict, Dict, RenderContext], Optional[str]]]
+UnknownHandler = Callable[[Dict, RenderContext], Optional[str]]
+
+DEFAULT_HANDLERS: Dict[str, BlockHandler] = {
+    "paragraph": "",
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+    "bulleted_list_item": "- ",
+    "toggle": "",
+    "quote": "> ",
+}
+
+
+def handles(*block_types: str):
+    """기본 핸들러 등록 데코레이터"""
+    def decorator(handler: BlockHandler) -> BlockHandler:
+        for block_type in block_types:
+            DEFAULT_HANDLERS[block_type] = handler
+        return handler
+    return decorator
+
+
+@handles("numbered_list_item")
+def render_numbered_list_item(block: Dict, data: Dict, ctx: RenderContext) -> str:
+    return f"{ctx.list_number}. {ctx.rich_text(data['rich_text'])}"
+
+
+@handles("to_do")
+def render_to_do(block: Dict, data: Dict, ctx: RenderContext) -> str:
+    mark = "x" if data.get("checked") else " "
+    return f"- [{mark}] {ctx.rich_text(data['rich_text'])}"
+
+
+@handles("code")
+def render_code(block: Dict, data: Dict, ctx: RenderContext) -> str:
+    return f"```{data.get('language', '')}\n{ctx.rich_text(data['rich_text'])}\n```"
+
+
+@handles("callout")
+def render_callout(block: Dict, data: Dict, ctx: RenderContext) -> str:
+    icon = (data.get("icon") or {}).get("emoji")
+    text = ctx.rich_text(data["rich_text"])
+    return f"> {icon} {text}" if icon else f"> {text}"
+
+
+@handles("divider")
+def render_divider(block: Dict, data: Dict, ctx: RenderContext) -> str:
+    return "---"
+
+
+@handles("equation")
+def render_equation(block: Dict, data: Dict, ctx: RenderContext) -> str:
+    return f"$$\n{data.get('expression', '')}\n$$"
+
+
+@handles("bookmark", "embed", "link_preview")
+def render_link(block: Dict, data: Dict, ctx: RenderContext) -> Optional[str]:
+    url = data.get("url")
+    if not url:
+        return None
+    caption = ctx.rich_text(data.get("caption") or [])
+    return f"[{caption or url}]({url})"
+
+
+@handles("image")
+def render_image(block: Dict, data: Dict, ctx: RenderContext) -> Optional[str]:
+    image_url = image_block_url(data)
+    if not image_url:
+        return None
+    caption = plain_rich_text(data.get("caption") or [])
+    if ctx.resolve_asset:
+        image_url = ctx.resolve_asset(block.get("id", ""), image_url, caption) or image_url
+    return f"![{alt_text(caption)}]({image_url})"
+
+
+def image_block_url(image_block: Dict) -> Optional[str]:
+    """
+    이미지 블록에서 URL 추출
+
+    Args:
+        image_block (Dict): Notion 이미지 블록의 image 값
+
+    Returns:
+        Optional[str]: 이미지 URL
+    """
+    if image_block.get("type") == "file":
+        return image_block["file"]["url"]
+    elif image_block.get("type") == "external":
+        return image_block["external"]["url"]
+    return None
+
+
+def render_unknown_block(block: Dict, ctx: RenderContext) -> Optional[str]:
+    """
+    등록되지 않은 블록 타입 기본 처리
+
+    타입을 집계하고, rich text가 있으면 단락으로 출력합니다.
+    """
+    block_type = block.get("type", "")
+    ctx.unknown_types[block_type] += 1
+
+    data = block.get(block_type) or {}
+    if data.get("rich_text"):
+        return ctx.rich_text(data["rich_text"])
+    return None
+
+
+class BlockRenderer:
+    """
+    블록 타입별 핸들러 레지스트리 기반 마크다운 렌더러
+
+    블록 트리를 한 번 순회하며 하나의 출력 버퍼에 기록합니다.
+    목록 하위 블록은 한 단계씩 들여 쓰고, 번호 목록은 형제 블록 순서대로 번호를 매깁니다.
+
+    사용 예:
+        renderer = BlockRenderer()
+        renderer.register("table_of_contents", lambda block, data, ctx: "[TOC]")
+        markdown = renderer.render(blocks)
+    """
+
+    def __init__(
+        self,
+        rich_text: Optional[Callable[[List[Dict]], str]] = None,
+        unknown_handler: Optional[UnknownHandler] = None
+    ):
+        """
+        Args:
+            rich_text (Optional[Callable]): rich text 변환 함수 (기본값: 서식 없는 텍스트)
+            unknown_handler (Optional[UnknownHandler]): 등록되지 않은 블록 타입 처리 함수
+        """
+        self.handlers: Dict[str, BlockHandler] = dict(DEFAULT_HANDLERS)
+        self.rich_text = rich_text or plain_rich_text
+        self.unknown_handler = unknown_handler or render_unknown_block
+
+    def register(self, block_type: str, handler: BlockHandler):
+        """
+        블록 타입 핸들러 등록 (같은 타입이 있으면 교체)
+
+        Args:
+            block_type (str): Notion 블록 타입
+            handler (BlockHandler): (block, data, ctx)를 받아 마크다운을 반환하는 함수,
+                또는 rich text 앞에 붙일 접두어 문자열
+        """
+        self.handlers[block_type] = handler
+
+    def render(
+        self,
+        blocks: List[Dict],
+        first_number: int = 1,
+        resolve_asset: Optional[AssetResolver] = None
+    ) -> str:
+        """
+        블록 트리를 마크다운으로 변환
+
+        Args:
+            blocks (List[Dict]): 블록 리스트 (`children`에 하위 블록 포함 가능)
+            first_number (int): 첫 번호 목록 항목의 번호 (블록 일부만 렌더링할 때 사용)
+            resolve_asset (Optional[AssetResolver]): 이미지 URL 변환 함수
+
+        Returns:
+            str: 블록 사이를 빈 줄로 구분한 마크다운 (끝 구분자 없음)
+        """
+        return self.render_context(blocks, first_number, resolve_asset).markdown
+
+    def render_context(
+        self,
+        blocks: List[Dict],
+        first_number: int = 1,
+        resolve_asset: Optional[AssetResolver] = None
+    ) -> RenderContext:
+        """
+        블록 트리를 변환하고 렌더링 상태를 반환
+
+        Args:
+            blocks (List[Dict]): 블록 리스트
+            first_number (int): 첫 번호 목록 항목의 번호
+            resolve_asset (Optional[AssetResolver]): 이미지 URL 변환 함수
+
+        Returns:
+            RenderContext: markdown과 unknown_types를 포함한 렌더링 상태
+        """
+        ctx = RenderContext(self, resolve_asset)
+        self._render_blocks(blocks, ctx, first_number)
+        return ctx
+
+    def iter_sections(
+        self,
+        blocks: Iterable[Dict],
+        section_types: Iterable[str] = SECTION_TYPES,
+        resolve_asset: Optional[AssetResolver] = None
+    ) -> Iterator[str]:
+        """
+        최상위 블록을 받는 대로 변환해 섹션(제목 블록 단위)마다 마크다운 반환
+
+        블록은 리스트가 아닌 반복자여도 되며, 섹션이 끝나는 즉시(다음 제목 블록을 받았을 때)
+        반환하므로 나머지 블록을 조회하는 동안 앞 섹션을 먼저 표시할 수 있습니다.
+        반환된 섹션을 BLOCK_SEPARATOR로 이으면 render(blocks)와 같은 결과가 됩니다.
+
+        Args:
+            blocks (Iterable[Dict]): `children`이 채워진 최상위 블록
+            section_types (Iterable[str]): 새 섹션을 시작하는 블록 타입
+            resolve_asset (Optional[AssetResolver]): 이미지 URL 변환 함수
+
+        Yields:
+            str: 섹션 마크다운
+        """
+        section_types = frozenset(section_types)
+        ctx = RenderContext(self, resolve_asset)
+        number = 0
+
+        for block in blocks:
+            if block["type"] in section_types and ctx.buffer:
+                yield ctx.markdown
+                ctx.buffer.clear()
+
+            number = number + 1 if block["type"] == "numbered_list_item" else 0
+            self._render_blocks([block], ctx, first_number=number or 1)
+
+        if ctx.buffer:
+            yield ctx.markdown
+
+    def _render_blocks(self, blocks: List[Dict], ctx: RenderContext, first_number: int = 1):
+        """
+        블록 트리를 깊이 우선으로 한 번 순회하며 렌더링
+
+        재귀 호출 대신 (형제 블록 반복자, 들여쓰기, 번호) 스택을 사용해
+        하위 블록이 많은 문서에서도 호출 오버헤드가 늘지 않도록 합니다.
+        """
+        get_handler = self.handlers.get
+        unknown_handler = self.unknown_handler
+        rich_text = self.rich_text
+        append = ctx.buffer.append
+        base_depth, base_indent = ctx.depth, ctx.indent
+
+        stack = [(iter(blocks), base_indent, first_number - 1)]
+        while stack:
+            siblings, indent, number = stack[-1]
+            ctx.indent = indent
+            ctx.depth = base_depth + len(stack) - 1
+
+            for block in siblings:
+                block_type = block["type"]
+
+                if block_type == "numbered_list_item":
+                    number += 1
+                    ctx.list_number = number
+                else:
+                    number = 0
+
+                handler = get_handler(block_type)
+                if handler.__class__ is str:
+                    text = handler + rich_text(block[block_type]["rich_text"])
+                elif handler is not None:
+                    text = handler(block, block[block_type], ctx)
+                else:
+                    text = unknown_handler(block, ctx)
+                if text is not None:
+                    # ctx.write와 같은 처리 (블록마다 호출되므로 인라인)
+                    if indent:
+                        text = "\n".join(indent + line if line else line for line in text.split("\n"))
+                    append(BLOCK_SEPARATOR)
+                    append(text)
+
+                # 하위 블록 (중첩 목록, 토글, 컬럼 등): 현재 위치를 저장하고 내려감
+                children = block.get("children")
+                if children:
+                    stack[-1] = (siblings, indent, number)
+                    child_indent = indent + INDENT if block_type in LIST_TYPES else indent
+                    stack.append((iter(children), child_indent, 0))
+                    break
+            else:
+                stack.pop()
+
+        ctx.indent, ctx.depth = base_indent, base_depth
@@ -19,6 +19,75 @@ class Settings:
     NOTION_TOKEN = os.getenv('NOTION_TOKEN')
     NOTION_DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
     
+    # Notion API 주소 (벤치마크에서 로컬 가짜 서버로 바꿀 때 사용)
+    NOTION_API_BASE_URL = os.getenv('NOTION_API_BASE_URL', 'https://api.notion.com')
+    
+    # 블록 트리 조회 동시 요청 수
+    BLOCK_FETCH_WORKERS = int(os.getenv('BLOCK_FETCH_WORKERS', '4'))
+    
+    # 동기화 파이프라인 단계별 작업 스레드 수 (SYNC_CONCURRENCY는 블록 조회 단계에서 동시에 처리할 글 수)
+    SYNC_CONCURRENCY = int(os.getenv('SYNC_CONCURRENCY', '1'))
+    SYNC_ASSET_WORKERS = int(os.getenv('SYNC_ASSET_WORKERS', '2'))
+    SYNC_CONVERT_WORKERS = int(os.getenv('SYNC_CONVERT_WORKERS', '1'))
+    SYNC_QUEUE_SIZE = int(os.getenv('SYNC_QUEUE_SIZE', '4'))
+    
+    # 요청 속도 제한 및 재시도 (Notion API는 평균 초당 3회 허용)
+    NOTION_RATE_LIMIT = float(os.getenv('NOTION_RATE_LIMIT', '3'))
+    HTTP_RATE_LIMIT = float(os.getenv('HTTP_RATE_LIMIT', '10'))
+    REQUEST_MAX_RETRIES = int(os.getenv('REQUEST_MAX_RETRIES', '5'))
+    REQUEST_DEADLINE = float(os.getenv('REQUEST_DEADLINE', '120'))
+    HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '30'))
+    
+    # 이미지 동시 다운로드 수
+    IMAGE_DOWNLOAD_WORKERS = int(os.getenv('IMAGE_DOWNLOAD_WORKERS', '4'))
+    
+    # 이미지 최적화 (Pillow 필요): 너비별 WebP(선택적으로 AVIF) 변형 생성
+    IMAGE_OPTIMIZE = os.getenv('IMAGE_OPTIMIZE', 'true').lower() == 'true'
+    IMAGE_WIDTHS = [int(width) for width in os.getenv('IMAGE_WIDTHS', '480,960,1600').split(',') if width.strip()]
+    IMAGE_FORMATS = [name.strip() for name in os.getenv('IMAGE_FORMATS', 'webp').split(',') if name.strip()]
+    IMAGE_DEFAULT_WIDTH = int(os.getenv('IMAGE_DEFAULT_WIDTH', '960'))
+    IMAGE_QUALITY = int(os.getenv('IMAGE_QUALITY', '80'))
+    IMAGE_OPTIMIZE_WORKERS = int(os.getenv('IMAGE_OPTIMIZE_WORKERS', '0'))  # 0이면 CPU 수
+    
+    # 참조되지 않는 이미지 삭제 여부와 Git LFS로 추적할 최소 파일 크기 (0이면 LFS 사용 안 함)
+    IMAGE_GC = os.getenv('IMAGE_GC', 'true').lower() == 'true'
+    IMAGE_LFS_MIN_BYTES = int(os.getenv('IMAGE_LFS_MIN_BYTES', '0'))
+    
+    # 공유 HTTP 연결 풀
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '20'))
+    HTTP_POOL_KEEPALIVE = int(os.getenv('HTTP_POOL_KEEPALIVE', '10'))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30'))
+    
+    # 콘텐츠 저장소 (sync_notion.py가 기록하고 페이지가 읽음)
+    CONTENT_STORE_PATH = os.getenv('CONTENT_STORE_PATH', 'data/content.db')
+    
+    # 페이지별 동기화 원장 (수정 시각, 렌더링 결과 해시, 출력 파일; 저장소와 함께 커밋됨)
+    SYNC_LEDGER_PATH = os.getenv('SYNC_LEDGER_PATH', 'data/sync_ledger.json')
+    
+    # 삭제/발행 취소된 글을 찾기 위한 전체 글 목록 조회 주기 (그 사이에는 수정된 글만 증분 조회, 0이면 매번 전체 조회)
+    SYNC_FULL_LISTING_HOURS = float(os.getenv('SYNC_FULL_LISTING_HOURS', '24'))
+    
+    # 동기화 지표 보고서 (JSON은 커밋되지 않는 위치, Prometheus 텍스트 파일은 경로를 지정할 때만 기록)
+    SYNC_METRICS_PATH = os.getenv('SYNC_METRICS_PATH', '.sync_metrics.json')
+    SYNC_PROMETHEUS_PATH = os.getenv('SYNC_PROMETHEUS_PATH', '')
+    
+    # Notion 웹훅 수신기 (sync_notion.py --serve): 같은 글의 연속 수정은 마지막 이벤트 후 DEBOUNCE초 뒤에 한 번만
+    # 동기화하고, 계속 수정되어도 첫 이벤트 후 MAX_DELAY초 안에는 동기화
+    # (SECRET이 없으면 구독 확인 요청만 받고, 있으면 모든 요청의 서명 검증, MAX_BODY_BYTES보다 큰 요청은 거부)
+    WEBHOOK_HOST = os.getenv('WEBHOOK_HOST', '127.0.0.1')
+    WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', '8787'))
+    WEBHOOK_DEBOUNCE_SECONDS = float(os.getenv('WEBHOOK_DEBOUNCE_SECONDS', '10'))
+    WEBHOOK_MAX_DELAY_SECONDS = float(os.getenv('WEBHOOK_MAX_DELAY_SECONDS', '40'))
+    NOTION_WEBHOOK_SECRET = os.getenv('NOTION_WEBHOOK_SECRET', '')
+    WEBHOOK_MAX_BODY_BYTES = int(os.getenv('WEBHOOK_MAX_BODY_BYTES', '65536'))
+    
+    # 렌더링된 콘텐츠 스냅샷 (앱은 기본적으로 스냅샷에서 읽음)
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'content')
+    CONTENT_SOURCE = os.getenv('CONTENT_SOURCE', 'auto')  # auto | snapshot | live
+    
+    # 블록 렌더링 캐시 최대 유지 시간 (하위 블록 수정 누락 방지)
+    RENDER_CACHE_MAX_AGE_HOURS = float(os.getenv('RENDER_CACHE_MAX_AGE_HOURS', '24'))
+    
     # fly.io 설정 (Phase 3에서 사용)
     FLY_API_TOKEN = os.getenv('FLY_API_TOKEN')
     
@@ -0,0 +1,366 @@
+"""
+콘텐츠 저장소 모듈
+동기화된 블로그 글을 로컬 SQLite 데이터베이스에 저장하고 조회하는 기능 제공
+"""
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Optional, Iterable, Iterator
+
+from config.settings import settings
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    page_id TEXT PRIMARY KEY,
+    slug TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    published_date TEXT,
+    last_edited_time TEXT NOT NULL,
+    properties TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    html TEXT,
+    toc TEXT,
+    image_manifest TEXT NOT NULL DEFAULT '[]',
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posts_slug ON posts (slug);
+CREATE INDEX IF NOT EXISTS idx_posts_published_date ON posts (published_date DESC);
+
+CREATE TABLE IF NOT EXISTS post_tags (
+    page_id TEXT NOT NULL REFERENCES posts (page_id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (page_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_post_tags_tag ON post_tags (tag);
+
+CREATE TABLE IF NOT EXISTS block_fragments (
+    block_id TEXT PRIMARY KEY,
+    page_id TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    list_number INTEGER,
+    markdown TEXT NOT NULL,
+    images TEXT NOT NULL DEFAULT '[]',
+    rendered_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_block_fragments_page ON block_fragments (page_id);
+"""
+
+# 이전 버전 데이터베이스에 추가할 컬럼 (테이블, 컬럼, 정의)
+MIGRATIONS = [
+    ("block_fragments", "list_number", "INTEGER"),
+    ("posts", "html", "TEXT"),
+    ("posts", "toc", "TEXT"),
+]
+
+# 목록 조회 시 본문(content) 없이 읽는 컬럼
+LIST_COLUMNS = "page_id, properties"
+
+
+class ContentStore:
+    """SQLite 기반 콘텐츠 저장소"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        저장소 초기화 (파일과 스키마가 없으면 생성)
+
+        Args:
+            path (Optional[str]): SQLite 파일 경로 (기본값: settings.CONTENT_STORE_PATH)
+        """
+        self.path = Path(path or settings.CONTENT_STORE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+
+    @classmethod
+    def open_existing(cls, path: Optional[str] = None) -> Optional["ContentStore"]:
+        """
+        저장소 파일이 이미 있을 때만 연다
+
+        Args:
+            path (Optional[str]): SQLite 파일 경로
+
+        Returns:
+            Optional[ContentStore]: 저장소 (파일이 없으면 None)
+        """
+        path = Path(path or settings.CONTENT_STORE_PATH)
+        if not path.exists():
+            return None
+        return cls(str(path))
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """이전 버전 스키마에 없는 컬럼 추가"""
+        for table, column, definition in MIGRATIONS:
+            columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
+    @contextmanager
+    def _connect(self):
+        """
+        호출마다 새 연결을 열고 커밋 후 닫는다
+
+        Streamlit 스크립트는 여러 스레드에서 실행되므로 연결을 공유하지 않습니다.
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def upsert_post(self, post: Dict, image_manifest: Optional[List[Dict]] = None):
+        """
+        글을 저장 (같은 page_id가 있으면 갱신)
+
+        Args:
+            post (Dict): NotionClient 형식의 글 (content 포함, 사전 렌더링한 html/toc는 선택)
+            image_manifest (Optional[List[Dict]]): 글에 포함된 이미지 목록
+        """
+        properties = {
+            key: value for key, value in post.items()
+            if key not in ("content", "html", "toc", "images", "fetch_stats")
+        }
+        manifest = image_manifest if image_manifest is not None else post.get("images", [])
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO posts (
+                    page_id, slug, title, status, published_date, last_edited_time,
+                    properties, content, html, toc, image_manifest, synced_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (page_id) DO UPDATE SET
+                    slug = excluded.slug,
+                    title = excluded.title,
+                    status = excluded.status,
+                    published_date = excluded.published_date,
+                    last_edited_time = excluded.last_edited_time,
+                    properties = excluded.properties,
+                    content = excluded.content,
+                    html = excluded.html,
+                    toc = excluded.toc,
+                    image_manifest = excluded.image_manifest,
+                    synced_at = excluded.synced_at
+                """,
+                (
+                    post["id"],
+                    post.get("slug", ""),
+                    post.get("title", ""),
+                    post.get("status", ""),
+                    post.get("published_date"),
+                    post.get("last_edited", ""),
+                    json.dumps(properties, ensure_ascii=False),
+                    post.get("content", ""),
+                    post.get("html"),
+                    json.dumps(post["toc"], ensure_ascii=False) if post.get("toc") else None,
+                    json.dumps(manifest, ensure_ascii=False),
+                    datetime.now(timezone.utc).isoformat()
+                )
+            )
+            conn.execute("DELETE FROM post_tags WHERE page_id = ?", (post["id"],))
+            conn.executemany(
+                "INSERT OR IGNORE INTO post_tags (page_id, tag) VALUES (?, ?)",
+                [(post["id"], tag) for tag in post.get("tags", [])]
+            )
+
+    def delete_post(self, page_id: str) -> bool:
+        """
+        글 삭제
+
+        Args:
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            bool: 삭제된 글이 있으면 True
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM block_fragments WHERE page_id = ?", (page_id,))
+            cursor = conn.execute("DELETE FROM posts WHERE page_id = ?", (page_id,))
+            return cursor.rowcount > 0
+
+    def get_post_by_slug(self, slug: str) -> Optional[Dict]:
+        """
+        슬러그로 글 조회 (인덱스 조회 1회)
+
+        Args:
+            slug (str): 글의 슬러그
+
+        Returns:
+            Optional[Dict]: content와 images(사전 렌더링한 글은 html/toc도)가 포함된 글 (없으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT properties, content, html, toc, image_manifest FROM posts WHERE slug = ? "
+                "ORDER BY last_edited_time DESC LIMIT 1",
+                (slug,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        post = json.loads(row["properties"])
+        post["content"] = row["content"]
+        if row["html"] is not None:
+            post["html"] = row["html"]
+        if row["toc"] is not None:
+            post["toc"] = json.loads(row["toc"])
+        post["images"] = json.loads(row["image_manifest"])
+        return post
+
+    def get_last_edited(self, page_id: str) -> Optional[str]:
+        """
+        저장된 글의 last_edited_time 조회
+
+        Args:
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            Optional[str]: 저장된 last_edited_time (없으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT last_edited_time FROM posts WHERE page_id = ?", (page_id,)
+            ).fetchone()
+        return row["last_edited_time"] if row else None
+
+    def list_posts(self, tag: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        발행일 역순으로 글 목록 조회 (본문 제외)
+
+        Args:
+            tag (Optional[str]): 이 태그가 붙은 글만 조회
+            limit (Optional[int]): 최대 조회 개수
+
+        Returns:
+            List[Dict]: 글 목록
+        """
+        query = f"SELECT {LIST_COLUMNS} FROM posts"
+        params: list = []
+
+        if tag:
+            query += " WHERE page_id IN (SELECT page_id FROM post_tags WHERE tag = ?)"
+            params.append(tag)
+
+        query += " ORDER BY published_date IS NULL, published_date DESC"
+
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [json.loads(row["properties"]) for row in rows]
+
+    def iter_post_assets(self) -> Iterator[Dict]:
+        """
+        모든 글의 이미지 목록과 본문을 하나씩 조회 (이미지 참조 집계용)
+
+        Yields:
+            Dict: {"page_id", "images", "content"}
+        """
+        with self._connect() as conn:
+            for row in conn.execute("SELECT page_id, image_manifest, content FROM posts"):
+                yield {
+                    "page_id": row["page_id"],
+                    "images": json.loads(row["image_manifest"]),
+                    "content": row["content"]
+                }
+
+    def get_fragments(self, page_id: str) -> Dict[str, Dict]:
+        """
+        페이지의 블록별 렌더링 캐시 조회
+
+        Args:
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            Dict[str, Dict]: 블록 ID별
+                {"block_id", "last_edited_time", "list_number", "markdown", "images", "rendered_at"}
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT block_id, last_edited_time, list_number, markdown, images, rendered_at "
+                "FROM block_fragments WHERE page_id = ?",
+                (page_id,)
+            ).fetchall()
+
+        return {
+            row["block_id"]: {
+                "block_id": row["block_id"],
+                "last_edited_time": row["last_edited_time"],
+                "list_number": row["list_number"],
+                "markdown": row["markdown"],
+                "images": json.loads(row["images"]),
+                "rendered_at": row["rendered_at"]
+            }
+            for row in rows
+        }
+
+    def replace_fragments(self, page_id: str, fragments: List[Dict]):
+        """
+        페이지의 블록별 렌더링 캐시를 현재 블록 목록으로 교체
+
+        목록에 없는 블록(삭제된 블록)의 캐시는 제거됩니다.
+
+        Args:
+            page_id (str): Notion 페이지 ID
+            fragments (List[Dict]): get_fragments와 같은 형식의 조각 리스트
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM block_fragments WHERE page_id = ?", (page_id,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO block_fragments "
+                "(block_id, page_id, last_edited_time, list_number, markdown, images, rendered_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        fragment["block_id"],
+                        page_id,
+                        fragment["last_edited_time"],
+                        fragment.get("list_number"),
+                        fragment["markdown"],
+                        json.dumps(fragment["images"], ensure_ascii=False),
+                        fragment["rendered_at"]
+                    )
+                    for fragment in fragments
+                ]
+            )
+
+    def replace_posts(self, posts: Iterable[Dict]) -> int:
+        """
+        저장된 글을 주어진 글로 맞춤 (없는 글은 추가/갱신, 목록에 없는 글은 블록 조각과 함께 삭제)
+
+        블록 렌더링 캐시는 남은 글의 조각을 그대로 유지합니다.
+
+        Args:
+            posts (Iterable[Dict]): content가 포함된 전체 글 (예: 스냅샷의 글)
+
+        Returns:
+            int: 저장된 글 수
+        """
+        page_ids = set()
+        for post in posts:
+            self.upsert_post(post)
+            page_ids.add(post["id"])
+
+        with self._connect() as conn:
+            stored_ids = [row["page_id"] for row in conn.execute("SELECT page_id FROM posts")]
+        for page_id in stored_ids:
+            if page_id not in page_ids:
+                self.delete_post(page_id)
+        return len(page_ids)
+
+    def count(self) -> int:
+        """저장된 글 수"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
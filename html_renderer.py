@@ -0,0 +1,478 @@
+"""
+HTML 사전 렌더링 모듈
+BlockRenderer가 만든 마크다운을 동기화 시점에 HTML로 변환하는 기능 제공
+
+입력은 BlockRenderer/RichTextCompiler가 출력하는 마크다운 문법만 지원합니다.
+모든 텍스트는 이스케이프되고 이 모듈이 만든 태그만 출력되므로 결과 HTML에는
+Notion 콘텐츠에서 온 태그나 스크립트가 들어가지 않습니다.
+"""
+import re
+from html import escape, unescape
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # 구문 강조 없이 <pre><code>로 출력
+    highlight = None
+
+
+# HTML 형식 버전 (출력 형식이 바뀌면 증가시켜 다시 렌더링)
+HTML_FORMAT_VERSION = 2
+
+# 링크/이미지에 허용하는 URL (그 외 스킴은 제거)
+SAFE_URL = re.compile(r"^(https?://|mailto:|/|#|\?|\.{0,2}/)|^[\w\-./%]+$", re.IGNORECASE)
+
+# Streamlit 색상 이름 → CSS 색상
+CSS_COLORS = {
+    "red": "#ff4b4b",
+    "orange": "#ffa421",
+    "green": "#21c354",
+    "blue": "#1c83e1",
+    "violet": "#803df5",
+    "gray": "#808495",
+    "grey": "#808495",
+}
+
+# 반응형 이미지의 표시 너비 (Streamlit 기본 레이아웃의 본문 최대 너비)
+IMAGE_SIZES = "(max-width: 736px) 100vw, 736px"
+
+# 변형 형식별 MIME 타입
+IMAGE_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+# 코드 블록 구문 강조 스타일 (Streamlit에는 Pygments CSS가 없으므로 인라인 스타일 사용)
+HIGHLIGHT_STYLE = "friendly"
+
+LIST_ITEM = re.compile(r"^(?:(?P<task>- \[(?P<checked>[ x])\] )|(?P<bullet>- )|(?P<number>\d+)\. )")
+HEADING = re.compile(r"^(#{1,3}) (.*)$", re.DOTALL)
+IMAGE_LINE = re.compile(r"^!\[([^\]]*)\]\(([^)\s]+)\)$")
+
+CODE_SPAN = re.compile(r"(`+)(.+?)\1", re.DOTALL)
+IMAGE = re.compile(r"!\[([^\]]*)\]\(([^)\s]+)\)")
+LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+BOLD = re.compile(r"\*\*(.+?)\*\*", re.DOTALL)
+STRIKE = re.compile(r"~~(.+?)~~", re.DOTALL)
+ITALIC = re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])", re.DOTALL)
+# Streamlit 색상 이름만 해석 (시각 "10:30[...]" 같은 일반 텍스트는 그대로 둠)
+COLOR = re.compile(r":(" + "|".join(CSS_COLORS) + r")(-background)?\[(.*?)\]", re.DOTALL)
+PLACEHOLDER = re.compile(r"\x00(\d+)\x00")
+
+
+class UnsupportedMarkdown(ValueError):
+    """HTML로 변환할 수 없는 마크다운 (예: 수식 블록)"""
+
+
+def safe_url(url: str) -> Optional[str]:
+    """허용된 스킴의 URL만 반환 (javascript: 등은 None)"""
+    url = url.strip()
+    return url if SAFE_URL.match(url) else None
+
+
+def image_tag(url: str, alt: str = "", attributes: Optional[Dict[str, str]] = None) -> str:
+    """
+    이미지 태그 생성 (지연 로딩, 비동기 디코딩)
+
+    Args:
+        url (str): 이미지 URL
+        alt (str): 대체 텍스트
+        attributes (Optional[Dict[str, str]]): 추가 속성 (width, height 등)
+
+    Returns:
+        str: <img> 태그 (허용되지 않는 URL이면 빈 문자열)
+    """
+    src = safe_url(url)
+    if not src:
+        return ""
+    attrs = {"src": src, "alt": alt, "loading": "lazy", "decoding": "async", **(attributes or {})}
+    rendered = " ".join(f'{name}="{escape(str(value), quote=True)}"' for name, value in attrs.items())
+    return f'<img {rendered} style="max-width:100%;height:auto">'
+
+
+def responsive_image(image: Dict, alt: str = "") -> str:
+    """
+    최적화 변형이 있는 이미지의 <picture> 생성 (형식별 srcset, 크기 지정으로 레이아웃 이동 방지)
+
+    Args:
+        image (Dict): 변형 목록(variants)과 width/height가 있는 글의 이미지 항목
+        alt (str): 대체 텍스트
+
+    Returns:
+        str: <picture> 태그 (허용되지 않는 URL이면 빈 문자열)
+    """
+    srcsets: Dict[str, List[str]] = {}
+    for variant in image["variants"]:
+        if safe_url(variant["url"]):
+            srcsets.setdefault(variant["format"], []).append(f'{variant["url"]} {variant["width"]}w')
+    if not srcsets:
+        return ""
+
+    # 첫 형식(기본 변형 형식)은 <img>에, 나머지(AVIF 등)는 먼저 선택되도록 <source>에 넣음
+    formats = list(srcsets)
+    sources = "".join(
+        f'<source type="{IMAGE_TYPES.get(image_format, "")}" '
+        f'srcset="{escape(", ".join(srcsets[image_format]), quote=True)}" sizes="{IMAGE_SIZES}">'
+        for image_format in reversed(formats[1:])
+    )
+    img = image_tag(image["url"], alt, {
+        "srcset": ", ".join(srcsets[formats[0]]),
+        "sizes": IMAGE_SIZES,
+        "width": image["width"],
+        "height": image["height"]
+    })
+    return f"<picture>{sources}{img}</picture>" if img else ""
+
+
+def render_inline(text: str) -> str:
+    """
+    인라인 마크다운(코드, 링크, 이미지, 강조, 취소선, 색상)을 HTML로 변환
+
+    Args:
+        text (str): 한 블록의 마크다운 텍스트
+
+    Returns:
+        str: HTML
+    """
+    tokens: List[str] = []
+
+    def stash(html: str) -> str:
+        tokens.append(html)
+        return f"\x00{len(tokens) - 1}\x00"
+
+    # 코드 스팬은 안쪽 문법을 해석하지 않음
+    text = CODE_SPAN.sub(lambda m: stash(f"<code>{escape(m.group(2).strip() if m.group(1) != '`' else m.group(2))}</code>"), text)
+    text = escape(text, quote=False)
+
+    # 이미 이스케이프된 텍스트에서 잡은 URL/대체 텍스트는 원래대로 돌린 뒤 속성 값으로 한 번만 이스케이프
+    text = IMAGE.sub(lambda m: stash(image_tag(unescape(m.group(2)), unescape(m.group(1)))), text)
+
+    def link(match):
+        href = safe_url(unescape(match.group(2)))
+        label = match.group(1)
+        return f'<a href="{escape(href, quote=True)}" rel="noopener noreferrer">{label}</a>' if href else label
+
+    text = LINK.sub(link, text)
+    text = BOLD.sub(r"<strong>\1</strong>", text)
+    text = STRIKE.sub(r"<del>\1</del>", text)
+    text = ITALIC.sub(r"<em>\1</em>", text)
+
+    def color(match):
+        css = CSS_COLORS[match.group(1)]
+        if match.group(2):
+            return f'<span style="background-color:{css}33">{match.group(3)}</span>'
+        return f'<span style="color:{css}">{match.group(3)}</span>'
+
+    # 색상 안에 색상이 올 수 있으므로 바뀌지 않을 때까지 반복
+    previous = None
+    while previous != text:
+        previous, text = text, COLOR.sub(color, text)
+
+    text = text.replace("\n", "<br>\n")
+    return PLACEHOLDER.sub(lambda m: tokens[int(m.group(1))], text)
+
+
+def highlight_code(code: str, language: str) -> str:
+    """
+    코드 블록 HTML (Pygments가 있고 언어를 알면 구문 강조)
+
+    Args:
+        code (str): 코드
+        language (str): Notion 코드 블록 언어
+
+    Returns:
+        str: HTML
+    """
+    if highlight is not None and language:
+        try:
+            lexer = get_lexer_by_name(language.lower())
+        except ClassNotFound:
+            lexer = None
+        if lexer is not None:
+            return highlight(code, lexer, HtmlFormatter(noclasses=True, style=HIGHLIGHT_STYLE))
+
+    css_class = f' class="language-{escape(language, quote=True)}"' if language else ""
+    return f"<pre><code{css_class}>{escape(code)}</code></pre>"
+
+
+def plain_heading(text: str) -> str:
+    """제목 마크다운에서 서식 기호와 링크 URL을 뺀 텍스트"""
+    return " ".join(re.sub(r"[`*~]|:\w+(?:-background)?\[|\]\([^)]*\)|[\[\]]", "", text).split())
+
+
+def heading_anchor(text: str, used: Dict[str, int]) -> str:
+    """
+    제목 앵커 ID 생성 (같은 제목이 있으면 -2, -3 ... 을 붙임)
+
+    Args:
+        text (str): 제목 마크다운
+        used (Dict[str, int]): 문서에서 이미 사용한 ID별 횟수
+
+    Returns:
+        str: 앵커 ID
+    """
+    anchor = re.sub(r"[^\w\- ]", "", plain_heading(text).lower()).strip()
+    anchor = re.sub(r"\s+", "-", anchor) or "section"
+
+    count = used.get(anchor, 0) + 1
+    used[anchor] = count
+    return anchor if count == 1 else f"{anchor}-{count}"
+
+
+def _dedent(lines: List[str]) -> List[str]:
+    """목록 하위 블록의 들여쓰기(4칸) 한 단계 제거"""
+    return [line[4:] if line.startswith("    ") else line.lstrip(" ") for line in lines]
+
+
+def split_blocks(markdown: str) -> List[Tuple[int, List[str]]]:
+    """
+    마크다운을 빈 줄 기준으로 블록(줄 리스트)으로 나눔 (코드 블록 안의 빈 줄은 유지)
+
+    Args:
+        markdown (str): 마크다운
+
+    Returns:
+        List[Tuple[int, List[str]]]: 블록별 (시작 위치, 줄 리스트)
+    """
+    blocks: List[Tuple[int, List[str]]] = []
+    current: List[str] = []
+    start = offset = 0
+    fence: Optional[str] = None
+
+    for line in markdown.split("\n"):
+        line_start, offset = offset, offset + len(line) + 1
+        stripped = line.lstrip(" ")
+        if fence is not None:
+            current.append(line)
+            if stripped == "```" and line[:len(line) - len(stripped)] == fence:
+                fence = None
+            continue
+        if not line.strip():
+            if current:
+                blocks.append((start, current))
+                current = []
+            continue
+        if not current:
+            start = line_start
+            if stripped.startswith("```"):
+                fence = line[:len(line) - len(stripped)]
+        current.append(line)
+
+    if current:
+        blocks.append((start, current))
+    return blocks
+
+
+class HtmlRenderer:
+    """
+    BlockRenderer 마크다운 → HTML 변환기
+
+    사용 예:
+        html = HtmlRenderer(post["images"]).render(post["content"])
+    """
+
+    def __init__(self, images: Optional[List[Dict]] = None):
+        """
+        Args:
+            images (Optional[List[Dict]]): 글의 이미지 목록 (최적화 변형이 있는 이미지는 <picture>로 출력)
+        """
+        self.images = {image["url"]: image for image in images or [] if image.get("variants")}
+
+    def render(self, markdown: str) -> str:
+        """
+        마크다운 문서를 HTML로 변환
+
+        Args:
+            markdown (str): BlockRenderer가 만든 마크다운
+
+        Returns:
+            str: HTML
+
+        Raises:
+            UnsupportedMarkdown: 수식 블록처럼 HTML로 표시할 수 없는 내용이 있을 때
+        """
+        return "\n".join(section["html"] for section in self.render_sections(markdown))
+
+    def render_sections(self, markdown: str, with_html: bool = True) -> List[Dict]:
+        """
+        마크다운 문서를 최상위 제목 단위 섹션으로 나누어 변환
+
+        첫 제목 앞의 내용은 제목 없는 섹션(level 0)이 됩니다.
+        섹션 HTML을 "\n"으로 이으면 render() 결과와 같습니다.
+
+        Args:
+            markdown (str): BlockRenderer가 만든 마크다운
+            with_html (bool): False면 HTML 없이 목차 정보만 계산
+
+        Returns:
+            List[Dict]: 섹션별 {"id", "level", "title", "start", "end", "html"}
+                (start/end는 마크다운에서의 위치)
+
+        Raises:
+            UnsupportedMarkdown: with_html이고 HTML로 표시할 수 없는 내용이 있을 때
+        """
+        self._anchors: Dict[str, int] = {}
+        groups: List[Tuple[int, List[List[str]]]] = []
+        for start, lines in split_blocks(markdown):
+            if not groups or HEADING.match(lines[0]):
+                groups.append((start, []))
+            groups[-1][1].append(lines)
+
+        sections = []
+        for index, (start, blocks) in enumerate(groups):
+            end = groups[index + 1][0] if index + 1 < len(groups) else len(markdown)
+            heading = HEADING.match("\n".join(blocks[0]))
+            section = {"id": None, "level": 0, "title": "", "start": start, "end": end, "html": ""}
+            if heading:
+                section["level"] = len(heading.group(1))
+                section["title"] = plain_heading(heading.group(2))
+
+            if heading:
+                # 제목 블록은 목록에 속하지 않으므로 따로 변환해도 결과가 같음
+                section["id"] = heading_anchor(heading.group(2), self._anchors)
+                if with_html:
+                    section["html"] = "\n".join(
+                        [self._heading_html(section["level"], heading.group(2), section["id"])]
+                        + self._render_blocks(blocks[1:])
+                    )
+            elif with_html:
+                section["html"] = "\n".join(self._render_blocks(blocks))
+            sections.append(section)
+
+        return sections
+
+    def _render_blocks(self, blocks: List[List[str]]) -> List[str]:
+        html: List[str] = []
+        # 열린 목록: (태그, [(항목 HTML, 하위 블록들)], 시작 번호)
+        open_list: Optional[Tuple[str, List, int]] = None
+
+        def close_list():
+            nonlocal open_list
+            if open_list:
+                tag, items, start = open_list
+                start_attr = f' start="{start}"' if tag == "ol" and start != 1 else ""
+                rendered_items = [
+                    f"<li>{item}{''.join(self._render_blocks(children))}</li>" for item, children in items
+                ]
+                html.append(f"<{tag}{start_attr}>{''.join(rendered_items)}</{tag}>")
+                open_list = None
+
+        for lines in blocks:
+            if lines[0].startswith("    "):
+                # 목록 항목의 하위 블록 (목록이 없으면 한 단계 내어 일반 블록으로 처리)
+                if open_list:
+                    open_list[1][-1][1].append(_dedent(lines))
+                    continue
+                lines = _dedent(lines)
+
+            match = LIST_ITEM.match(lines[0])
+            if match:
+                tag = "ol" if match.group("number") else "ul"
+                if open_list and open_list[0] != tag:
+                    close_list()
+                if not open_list:
+                    open_list = (tag, [], int(match.group("number") or 1))
+
+                text = render_inline("\n".join([lines[0][match.end():]] + lines[1:]))
+                if match.group("task"):
+                    text = ("☑ " if match.group("checked") == "x" else "☐ ") + text
+                open_list[1].append((text, []))
+                continue
+
+            close_list()
+            html.append(self._render_block(lines))
+
+        close_list()
+        return html
+
+    def _render_block(self, lines: List[str]) -> str:
+        first = lines[0]
+
+        if first.startswith("```"):
+            language = first[3:].strip()
+            end = -1 if len(lines) > 1 and lines[-1].strip() == "```" else len(lines)
+            return highlight_code("\n".join(lines[1:end]), language)
+
+        if first == "$$":
+            raise UnsupportedMarkdown("수식 블록은 HTML로 변환하지 않습니다.")
+
+        if first == "---" and len(lines) == 1:
+            return "<hr>"
+
+        text = "\n".join(lines)
+
+        heading = HEADING.match(text)
+        if heading:
+            anchor = heading_anchor(heading.group(2), self._anchors)
+            return self._heading_html(len(heading.group(1)), heading.group(2), anchor)
+
+        if first.startswith(">"):
+            quoted = "\n".join(line[1:].lstrip(" ") if line.startswith(">") else line for line in lines)
+            return f"<blockquote><p>{render_inline(quoted)}</p></blockquote>"
+
+        image = IMAGE_LINE.match(text)
+        if image:
+            optimized = self.images.get(image.group(2))
+            if optimized:
+                tag = responsive_image(optimized, image.group(1))
+            else:
+                tag = image_tag(image.group(2), image.group(1))
+            return f"<figure>{tag}</figure>" if tag else ""
+
+        return f"<p>{render_inline(text)}</p>"
+
+    @staticmethod
+    def _heading_html(level: int, text: str, anchor: str) -> str:
+        return (
+            f'<h{level} id="{escape(anchor, quote=True)}">{render_inline(text)}'
+            f' <a class="anchor" href="#{escape(anchor, quote=True)}" aria-hidden="true">#</a></h{level}>'
+        )
+
+
+def prerender_post(markdown: str, images: Optional[List[Dict]] = None) -> Tuple[Optional[str], List[Dict]]:
+    """
+    글 본문을 HTML과 목차(섹션 색인)로 변환
+
+    목차 항목의 start/end는 마크다운에서의 위치, html_start/html_end는 HTML에서의 위치이므로
+    앱은 앞쪽 섹션만 잘라서 보낼 수 있습니다. HTML로 변환할 수 없는 글은 HTML 없이
+    목차만 반환합니다 (html_start/html_end 없음, 앱은 마크다운으로 표시).
+
+    Args:
+        markdown (str): 글 마크다운
+        images (Optional[List[Dict]]): 글의 이미지 목록 (최적화 변형 정보)
+
+    Returns:
+        Tuple[Optional[str], List[Dict]]: (HTML, 목차 항목 리스트)
+    """
+    if not markdown or not markdown.strip():
+        return None, []
+
+    renderer = HtmlRenderer(images)
+    try:
+        sections = renderer.render_sections(markdown)
+    except UnsupportedMarkdown as e:
+        print(f"HTML 사전 렌더링 건너뜀: {e}")
+        sections = renderer.render_sections(markdown, with_html=False)
+        return None, [{key: value for key, value in section.items() if key != "html"} for section in sections]
+
+    parts, toc = [], []
+    offset = 0
+    for section in sections:
+        html = section.pop("html")
+        parts.append(html)
+        toc.append({**section, "html_start": offset, "html_end": offset + len(html)})
+        offset += len(html) + 1
+    return "\n".join(parts), toc
+
+
+def render_post_html(markdown: str) -> Optional[str]:
+    """
+    글 본문을 HTML로 변환 (변환할 수 없으면 None, 앱은 마크다운으로 표시)
+
+    Args:
+        markdown (str): 글 마크다운
+
+    Returns:
+        Optional[str]: HTML
+    """
+    return prerender_post(markdown)[0]
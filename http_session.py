@@ -0,0 +1,128 @@
+"""
+HTTP 세션 모듈
+Notion API 클라이언트와 이미지 다운로더가 공유하는 keep-alive 연결 풀 제공
+"""
+import threading
+from typing import Optional
+
+import httpx
+
+from config.settings import settings
+
+
+# 이미지 다운로드 시 사용하는 기본 User-Agent
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+_transport: Optional[httpx.HTTPTransport] = None
+_http_client: Optional[httpx.Client] = None
+_lock = threading.Lock()
+
+
+def pool_limits() -> httpx.Limits:
+    """설정값으로 연결 풀 크기 생성"""
+    return httpx.Limits(
+        max_connections=settings.HTTP_POOL_SIZE,
+        max_keepalive_connections=settings.HTTP_POOL_KEEPALIVE,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+    )
+
+
+def pool_timeout() -> httpx.Timeout:
+    """설정값으로 요청 타임아웃 생성 (연결 타임아웃은 짧게 유지)"""
+    return httpx.Timeout(settings.HTTP_TIMEOUT, connect=min(settings.HTTP_TIMEOUT, 10.0))
+
+
+def get_http_transport() -> httpx.HTTPTransport:
+    """
+    프로세스 전역에서 공유하는 연결 풀(transport) 조회
+
+    httpx의 연결 풀은 transport에 있으므로 헤더가 다른 여러 클라이언트가
+    같은 transport를 쓰면 호스트별 keep-alive 연결을 함께 재사용합니다.
+
+    Returns:
+        httpx.HTTPTransport: 공유 transport
+    """
+    global _transport
+
+    with _lock:
+        if _transport is None:
+            _transport = httpx.HTTPTransport(limits=pool_limits())
+        return _transport
+
+
+def get_http_client() -> httpx.Client:
+    """
+    이미지 다운로드 등 일반 HTTP 요청용 공유 클라이언트 조회
+
+    httpx.Client는 스레드 안전하며, Notion 클라이언트와 같은 연결 풀을 사용합니다.
+
+    Returns:
+        httpx.Client: 공유 HTTP 클라이언트
+    """
+    global _http_client
+
+    transport = get_http_transport()
+    with _lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.Client(
+                transport=transport,
+                timeout=pool_timeout(),
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True
+            )
+        return _http_client
+
+
+def set_http_client(client: Optional[httpx.Client]):
+    """
+    이미지 다운로드용 공유 클라이언트 교체 (벤치마크에서 로컬 서버로 연결할 때 사용)
+
+    Args:
+        client (Optional[httpx.Client]): 사용할 클라이언트 (None이면 다음 조회 시 기본값으로 생성)
+    """
+    global _http_client
+
+    with _lock:
+        _http_client = client
+
+
+def create_notion_http_client() -> httpx.Client:
+    """
+    Notion 클라이언트용 HTTP 클라이언트 생성
+
+    notion-client는 전달받은 클라이언트의 base_url과 헤더(인증 토큰 포함)를 덮어쓰므로
+    이미지 다운로드용 클라이언트와 객체는 분리하고 연결 풀만 공유합니다.
+
+    Returns:
+        httpx.Client: 공유 연결 풀을 사용하는 새 클라이언트
+    """
+    return httpx.Client(transport=get_http_transport(), timeout=pool_timeout())
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    비동기 HTTP 클라이언트 생성 (이벤트 루프마다 새로 만들고 사용 후 닫아야 함)
+
+    Returns:
+        httpx.AsyncClient: 공유 설정을 적용한 비동기 클라이언트
+    """
+    return httpx.AsyncClient(
+        limits=pool_limits(),
+        timeout=pool_timeout(),
+        follow_redirects=True
+    )
+
+
+def close_http_client():
+    """공유 HTTP 클라이언트와 연결 풀 종료"""
+    global _http_client, _transport
+
+    with _lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+        if _transport is not None:
+            _transport.close()
+            _transport = None
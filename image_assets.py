@@ -0,0 +1,551 @@
+"""
+이미지 에셋 모듈
+블록 변환 중 Notion 이미지를 저장소에 내려받고 최종 URL로 바꾸는 에셋 리졸버 제공
+"""
+import os
+import re
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from block_renderer import image_block_url
+from config.settings import settings
+
+
+# Notion이 업로드 파일을 제공하는 호스트 (서명된 URL은 1시간 뒤 만료됨)
+NOTION_IMAGE_HOSTS = ("prod-files-secure.s3.amazonaws.com", "notion.so")
+
+# 저장소에 커밋된 이미지의 공개 URL 접두어
+IMAGE_BASE_URL = "https://raw.githubusercontent.com/dexelop/notion_to_blog/main/"
+
+# Git LFS로 추적하는 이미지의 공개 URL 접두어 (raw URL은 LFS 포인터 파일을 반환함)
+LFS_BASE_URL = "https://media.githubusercontent.com/media/dexelop/notion_to_blog/main/"
+
+# Git LFS 추적 규칙을 기록하는 파일
+GITATTRIBUTES_FILE = ".gitattributes"
+LFS_ATTRIBUTES = "filter=lfs diff=lfs merge=lfs -text"
+
+# 마크다운 이미지 (`![대체 텍스트](URL)`)
+MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\(([^)\s]+)\)")
+
+_lfs_lock = threading.Lock()
+
+# 이미지 매니페스트 파일 이름 (이미지 디렉토리 안에 저장되어 함께 커밋됨)
+MANIFEST_FILE = "manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
+
+def is_notion_image_url(url: str) -> bool:
+    """Notion에 업로드된(만료되는) 이미지 URL인지 확인"""
+    return url.startswith("https://") and any(host in url for host in NOTION_IMAGE_HOSTS)
+
+
+def image_source_key(url: str) -> str:
+    """
+    이미지 URL에서 서명과 무관한 원본 키 추출
+
+    Notion 파일 URL은 조회할 때마다 서명(쿼리 문자열)이 바뀌지만 S3 객체 키(경로)는
+    파일이 교체되지 않는 한 그대로이므로 호스트와 경로만 키로 사용합니다.
+
+    Args:
+        url (str): 이미지 URL
+
+    Returns:
+        str: 원본 키 (예: "prod-files-secure.s3.us-west-2.amazonaws.com/<workspace>/<file>/image.png")
+    """
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def lfs_tracked_paths(attributes_path: str = GITATTRIBUTES_FILE) -> List[str]:
+    """
+    .gitattributes에서 Git LFS로 추적하는 경로 목록 조회
+
+    Args:
+        attributes_path (str): .gitattributes 경로
+
+    Returns:
+        List[str]: LFS 추적 경로 (패턴 그대로)
+    """
+    if not os.path.exists(attributes_path):
+        return []
+    with open(attributes_path, 'r', encoding='utf-8') as f:
+        return [line.split()[0] for line in f if "filter=lfs" in line and line.strip()]
+
+
+def set_lfs_tracking(paths: List[str], tracked: bool, attributes_path: str = GITATTRIBUTES_FILE) -> List[str]:
+    """
+    이미지 파일별 Git LFS 추적 규칙 추가 또는 제거
+
+    Args:
+        paths (List[str]): 이미지 경로 (저장소 기준 상대 경로)
+        tracked (bool): True면 추가, False면 제거
+        attributes_path (str): .gitattributes 경로
+
+    Returns:
+        List[str]: 실제로 추가(또는 제거)한 경로
+    """
+    with _lfs_lock:
+        lines = []
+        if os.path.exists(attributes_path):
+            with open(attributes_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        current = {line.split()[0] for line in lines if "filter=lfs" in line and line.strip()}
+
+        if tracked:
+            changed = [path for path in dict.fromkeys(paths) if path not in current]
+            lines.extend(f"{path} {LFS_ATTRIBUTES}" for path in changed)
+        else:
+            removed = set(paths) & current
+            changed = sorted(removed)
+            lines = [line for line in lines if not (line.strip() and line.split()[0] in removed)]
+
+        if changed:
+            with open(attributes_path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n" if lines else "")
+        return changed
+
+
+def public_image_url(path: str, track: bool = True) -> str:
+    """
+    저장한 이미지의 공개 URL
+
+    IMAGE_LFS_MIN_BYTES가 설정되어 있으면 그보다 큰 파일은 Git LFS 추적 규칙에 추가하고
+    LFS 미디어 URL을 반환합니다. 한 번 추적한 파일은 (체크아웃에 포인터 파일만 있어도) 계속 LFS URL을 사용합니다.
+
+    Args:
+        path (str): 이미지 경로 (저장소 기준 상대 경로)
+        track (bool): False면 .gitattributes를 바꾸지 않고 이미 추적 중인 파일만 LFS URL로 반환 (서빙용)
+
+    Returns:
+        str: 공개 URL
+    """
+    min_bytes = settings.IMAGE_LFS_MIN_BYTES
+    if min_bytes:
+        if path in lfs_tracked_paths():
+            return LFS_BASE_URL + path
+        if track and os.path.exists(path) and os.path.getsize(path) >= min_bytes:
+            set_lfs_tracking([path], True)
+            return LFS_BASE_URL + path
+    return IMAGE_BASE_URL + path
+
+
+def notion_image_urls(blocks: List[Dict]) -> List[str]:
+    """
+    블록 트리(children 포함)에서 Notion 업로드 이미지 URL 수집
+
+    Args:
+        blocks (List[Dict]): Notion 블록 리스트
+
+    Returns:
+        List[str]: 문서 순서의 이미지 URL 목록
+    """
+    urls = []
+    for block in blocks:
+        if block.get("type") == "image":
+            url = image_block_url(block.get("image") or {})
+            if url and is_notion_image_url(url):
+                urls.append(url)
+        if block.get("children"):
+            urls.extend(notion_image_urls(block["children"]))
+    return urls
+
+
+def unresolved_image_keys(markdown: str) -> List[str]:
+    """
+    마크다운에 Notion 서명 URL로 남은 이미지(내려받지 못했거나 매니페스트에 없던 이미지)의 원본 키
+
+    Args:
+        markdown (str): 렌더링한 마크다운
+
+    Returns:
+        List[str]: 정렬된 원본 키 목록
+    """
+    return sorted({
+        image_source_key(url) for url in MARKDOWN_IMAGE.findall(markdown) if is_notion_image_url(url)
+    })
+
+
+def default_variant(info: Dict, default_width: int) -> Optional[Dict]:
+    """
+    마크다운과 <img src>에 사용할 기본 변형 (첫 형식 중 default_width 이하에서 가장 큰 너비)
+
+    Args:
+        info (Dict): optimize_image 결과
+        default_width (int): 기본 표시 너비
+
+    Returns:
+        Optional[Dict]: 변형 정보 (변형이 없으면 None)
+    """
+    variants = info.get("variants") or []
+    if not variants:
+        return None
+    first_format = [variant for variant in variants if variant["format"] == variants[0]["format"]]
+    fitting = [variant for variant in first_format if variant["width"] <= default_width]
+    if fitting:
+        return max(fitting, key=lambda variant: variant["width"])
+    return min(first_format, key=lambda variant: variant["width"])
+
+
+def image_entry(
+    block_id: str,
+    url: str,
+    caption: str,
+    local_path: str,
+    info: Optional[Dict] = None,
+    track: bool = True
+) -> Dict:
+    """
+    글의 이미지 목록(images) 항목 생성
+
+    Args:
+        block_id (str): 이미지 블록 ID
+        url (str): Notion이 반환한 이미지 URL
+        caption (str): 이미지 캡션
+        local_path (str): 저장한 원본 파일 경로
+        info (Optional[Dict]): 기본 변형("default")이 포함된 변형 정보
+        track (bool): public_image_url의 track
+
+    Returns:
+        Dict: {"block_id", "source_url", "path", "url", "caption"} (변형이 있으면 width, height, variants 추가).
+            source_url은 커밋되는 스냅샷에 서명이 남지 않도록 image_source_key로 만든 원본 키
+    """
+    entry = {
+        "block_id": block_id,
+        "source_url": image_source_key(url),
+        "path": local_path,
+        "url": public_image_url(local_path, track),
+        "caption": caption
+    }
+
+    if info and info.get("default"):
+        entry.update(
+            url=public_image_url(info["default"]["path"], track),
+            width=info["width"],
+            height=info["height"],
+            variants=[
+                {
+                    "url": public_image_url(variant["path"], track),
+                    "path": variant["path"],
+                    "width": variant["width"],
+                    "format": variant["format"],
+                    "bytes": variant["bytes"]
+                }
+                for variant in info["variants"]
+            ]
+        )
+    return entry
+
+
+class ImageAssetResolver:
+    """
+    Notion 이미지 에셋 리졸버
+
+    BlockRenderer가 이미지 블록을 변환할 때 (block_id, url, caption)으로 호출합니다.
+    Notion 업로드 이미지는 내려받아 저장소 URL을 반환하고, 외부 이미지는 그대로 둡니다.
+    처리한 이미지는 manifest에 추가되므로 변환이 끝난 뒤 본문을 다시 검색할 필요가 없습니다.
+    describe가 주어지고 최적화한 변형이 있으면 본문은 기본 변형(WebP)을 가리키고,
+    manifest 항목에 크기와 변형 목록이 함께 기록됩니다.
+
+    사용 예:
+        images = []
+        resolver = ImageAssetResolver(client._download_and_save_image, page_id, images)
+        markdown = renderer.render(blocks, resolve_asset=resolver)
+    """
+
+    def __init__(
+        self,
+        download: Callable[[str, str], Optional[str]],
+        page_id: str,
+        manifest: Optional[List[Dict]] = None,
+        describe: Optional[Callable[[str], Optional[Dict]]] = None
+    ):
+        """
+        Args:
+            download (Callable): (url, page_id)를 받아 저장한 파일 경로를 반환하는 함수 (실패 시 None)
+            page_id (str): Notion 페이지 ID
+            manifest (Optional[List[Dict]]): 처리한 이미지 정보를 추가할 리스트
+            describe (Optional[Callable]): 저장한 파일 경로로 변형 정보를 반환하는 함수 (ImageOptimizer.describe)
+        """
+        self.download = download
+        self.page_id = page_id
+        self.manifest = manifest if manifest is not None else []
+        self.describe = describe
+
+    def __call__(self, block_id: str, url: str, caption: str = "") -> Optional[str]:
+        """
+        이미지 URL을 최종 URL로 변환
+
+        Args:
+            block_id (str): 이미지 블록 ID
+            url (str): Notion이 반환한 이미지 URL
+            caption (str): 이미지 캡션 (서식 없는 텍스트)
+
+        Returns:
+            Optional[str]: 저장소 URL (외부 이미지이거나 다운로드에 실패하면 None)
+        """
+        if not is_notion_image_url(url):
+            return None
+
+        local_path = self.download(url, self.page_id)
+        if not local_path:
+            return None
+
+        info = self.describe(local_path) if self.describe else None
+        entry = image_entry(block_id, url, caption, local_path, info)
+        self.manifest.append(entry)
+        return entry["url"]
+
+
+class ImageManifest:
+    """
+    이미지 매니페스트 (이미지 디렉토리의 manifest.json)
+
+    원본 키(image_source_key)별 콘텐츠 해시와 저장 경로, 해시별 저장 경로와
+    최적화한 변형 정보를 기록합니다.
+    알려진 이미지는 네트워크 요청 없이 경로를 찾고, 내용이 같은 이미지는
+    원본이 달라도 파일 하나를 함께 사용합니다.
+
+    사용 예:
+        manifest = ImageManifest("images/manifest.json")
+        entry = manifest.lookup(image_source_key(url))
+        manifest.save()
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 매니페스트 파일 경로 (없으면 빈 매니페스트로 시작)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.sources: Dict[str, Dict] = {}
+        self.files: Dict[str, str] = {}
+        self.variants: Dict[str, Dict] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("format_version") == MANIFEST_FORMAT_VERSION:
+                    self.sources = data.get("sources", {})
+                    self.files = data.get("files", {})
+                    self.variants = data.get("variants", {})
+            except (OSError, ValueError) as e:
+                print(f"이미지 매니페스트 읽기 오류: {e}")
+
+    def lookup(self, key: str, check_file: bool = True) -> Optional[Dict]:
+        """
+        원본 키로 저장된 이미지 조회 (파일이 없어졌으면 None)
+
+        Args:
+            key (str): image_source_key 결과
+            check_file (bool): False면 파일 존재를 확인하지 않음 (이미지 파일 없이 배포된 앱)
+
+        Returns:
+            Optional[Dict]: {"hash", "path", "bytes", "recorded_at"}
+        """
+        with self._lock:
+            entry = self.sources.get(key)
+        if entry and (not check_file or os.path.exists(entry["path"])):
+            return entry
+        return None
+
+    def path_for_hash(self, content_hash: str) -> Optional[str]:
+        """
+        같은 내용의 이미지가 이미 저장되어 있으면 그 경로 반환
+
+        Args:
+            content_hash (str): 이미지 내용의 해시 (MD5 앞 16자)
+
+        Returns:
+            Optional[str]: 저장 경로 (없으면 None)
+        """
+        with self._lock:
+            path = self.files.get(content_hash)
+        return path if path and os.path.exists(path) else None
+
+    def record(self, key: str, content_hash: str, path: str, size: int) -> Dict:
+        """
+        이미지 저장 결과 기록
+
+        Args:
+            key (str): image_source_key 결과
+            content_hash (str): 이미지 내용의 해시
+            path (str): 저장 경로
+            size (int): 파일 크기(바이트)
+
+        Returns:
+            Dict: 기록한 항목
+        """
+        entry = {
+            "hash": content_hash,
+            "path": path,
+            "bytes": size,
+            "recorded_at": datetime.now(timezone.utc).isoformat()
+        }
+        with self._lock:
+            self.sources[key] = entry
+            self.files.setdefault(content_hash, path)
+            self._dirty = True
+        return entry
+
+    def get_variants(self, content_hash: str, check_files: bool = True) -> Optional[Dict]:
+        """
+        최적화한 변형 정보 조회 (변형 파일이 없어졌으면 None)
+
+        Args:
+            content_hash (str): 원본 이미지 내용의 해시
+            check_files (bool): False면 변형 파일 존재를 확인하지 않음
+
+        Returns:
+            Optional[Dict]: ImageOptimizer가 기록한 {"width", "height", "bytes", "variants"}
+        """
+        with self._lock:
+            info = self.variants.get(content_hash)
+        if info and (not check_files or all(os.path.exists(variant["path"]) for variant in info["variants"])):
+            return info
+        return None
+
+    def record_variants(self, content_hash: str, info: Dict):
+        """
+        최적화한 변형 정보 기록
+
+        Args:
+            content_hash (str): 원본 이미지 내용의 해시
+            info (Dict): {"width", "height", "bytes", "variants"}
+        """
+        with self._lock:
+            self.variants[content_hash] = info
+            self._dirty = True
+
+    def prune(self, removed_paths: List[str]) -> int:
+        """
+        삭제한 파일을 가리키는 항목 제거
+
+        Args:
+            removed_paths (List[str]): 삭제한 파일 경로
+
+        Returns:
+            int: 제거한 항목 수
+        """
+        removed = set(removed_paths)
+        with self._lock:
+            before = len(self.sources) + len(self.files) + len(self.variants)
+            self.sources = {key: entry for key, entry in self.sources.items() if entry["path"] not in removed}
+            self.files = {key: path for key, path in self.files.items() if path not in removed}
+            self.variants = {
+                key: info for key, info in self.variants.items()
+                if not any(variant["path"] in removed for variant in info["variants"])
+            }
+            pruned = before - len(self.sources) - len(self.files) - len(self.variants)
+            if pruned:
+                self._dirty = True
+        return pruned
+
+    def index_files(self, image_dir: Path) -> int:
+        """
+        해시 이름({해시 16자}.{확장자})으로 저장된 기존 파일을 해시별 경로에 등록
+
+        Args:
+            image_dir (Path): 이미지 디렉토리
+
+        Returns:
+            int: 새로 등록한 파일 수
+        """
+        added = 0
+        for path in Path(image_dir).rglob("*.*"):
+            # 최적화 변형({해시}-{너비}w.{형식})은 이름이 16자가 아니므로 제외됨
+            stem = path.stem
+            if len(stem) == 16 and all(c in "0123456789abcdef" for c in stem) and path.is_file():
+                with self._lock:
+                    if stem not in self.files:
+                        self.files[stem] = path.as_posix()
+                        self._dirty = True
+                        added += 1
+        return added
+
+    def save(self) -> bool:
+        """
+        변경된 내용이 있으면 파일에 기록 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            bool: 기록했으면 True
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = {
+                "format_version": MANIFEST_FORMAT_VERSION,
+                "sources": dict(sorted(self.sources.items())),
+                "files": dict(sorted(self.files.items())),
+                "variants": dict(sorted(self.variants.items()))
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        return True
+
+
+class ManifestImageResolver:
+    """
+    서빙용 에셋 리졸버 (미리 만든 이미지 매니페스트로만 이미지 URL을 찾음)
+
+    글을 보는 요청 중에는 이미지를 내려받거나 최적화하지 않습니다.
+    매니페스트에 없는 이미지는 Notion 서명 URL을 그대로 둡니다. 동기화는 같은 글을 직접
+    렌더링하며 이미지를 내려받고, 내려받지 못한 이미지는 원장에 기록해 다음 동기화에서 다시 처리합니다.
+
+    사용 예:
+        resolver = ManifestImageResolver(ImageManifest("images/manifest.json"), page_id, images)
+        markdown = renderer.render(blocks, resolve_asset=resolver)
+    """
+
+    def __init__(
+        self,
+        image_manifest: ImageManifest,
+        page_id: str,
+        manifest: Optional[List[Dict]] = None
+    ):
+        """
+        Args:
+            image_manifest (ImageManifest): 동기화에서 만든 이미지 매니페스트
+            page_id (str): Notion 페이지 ID
+            manifest (Optional[List[Dict]]): 찾은 이미지 정보를 추가할 리스트
+        """
+        self.image_manifest = image_manifest
+        self.page_id = page_id
+        self.manifest = manifest if manifest is not None else []
+
+    def __call__(self, block_id: str, url: str, caption: str = "") -> Optional[str]:
+        """
+        이미지 URL을 매니페스트의 저장소 URL로 변환
+
+        Args:
+            block_id (str): 이미지 블록 ID
+            url (str): Notion이 반환한 이미지 URL
+            caption (str): 이미지 캡션 (서식 없는 텍스트)
+
+        Returns:
+            Optional[str]: 저장소 URL (외부 이미지이거나 매니페스트에 없으면 None)
+        """
+        if not is_notion_image_url(url):
+            return None
+
+        stored = self.image_manifest.lookup(image_source_key(url), check_file=False)
+        if not stored:
+            return None
+
+        info = self.image_manifest.get_variants(stored["hash"], check_files=False)
+        if info:
+            info = {**info, "default": default_variant(info, settings.IMAGE_DEFAULT_WIDTH)}
+        entry = image_entry(block_id, url, caption, stored["path"], info, track=False)
+        self.manifest.append(entry)
+        return entry["url"]
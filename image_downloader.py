@@ -0,0 +1,243 @@
+"""
+이미지 다운로드 모듈
+Notion 이미지를 제한된 수의 작업 스레드로 동시에 내려받아 디스크에 스트리밍 저장하는 기능 제공
+
+응답 본문은 메모리에 모으지 않고 청크 단위로 임시 파일에 쓰면서 해시를 계산하고,
+다 받은 뒤 해시 이름의 파일로 원자적으로 이동합니다. 저장한 이미지는 이미지 매니페스트에
+기록되어 다음 동기화에서는 네트워크 요청 없이 경로를 찾습니다.
+"""
+import os
+import time
+import hashlib
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+import httpx
+
+from config.settings import settings
+from http_session import get_http_client
+from image_assets import MANIFEST_FILE, ImageManifest, image_source_key
+from request_scheduler import RequestScheduler, get_scheduler
+
+
+# 응답 본문을 읽는 청크 크기
+CHUNK_SIZE = 64 * 1024
+
+# 최근 다운로드 기록 보관 개수
+RECENT_LIMIT = 1000
+
+
+def image_extension(content_type: str) -> str:
+    """Content-Type으로 파일 확장자 결정 (알 수 없으면 .jpg)"""
+    if 'jpeg' in content_type or 'jpg' in content_type:
+        return '.jpg'
+    elif 'png' in content_type:
+        return '.png'
+    elif 'gif' in content_type:
+        return '.gif'
+    return '.jpg'
+
+
+class ImageDownloader:
+    """
+    스트리밍 이미지 다운로더
+
+    download()는 호출한 스레드에서 이미지 하나를 받고, download_all()은 공유 작업 풀에서
+    여러 이미지를 동시에 받습니다. 작업 풀은 다운로더마다 하나이므로 여러 글을 동시에
+    처리해도 동시 다운로드 수는 workers를 넘지 않습니다.
+
+    파일은 날짜와 무관한 내용 해시 경로(images/{해시 앞 2자리}/{해시}.{확장자})에 저장되고,
+    매니페스트에 있는 원본(S3 객체 키)은 내려받지 않습니다.
+
+    사용 예:
+        downloader = ImageDownloader(workers=4)
+        paths = downloader.download_all(urls, page_id)
+        print(downloader.summary())
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        image_dir: str = "images",
+        client: Optional[httpx.Client] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        manifest: Optional[ImageManifest] = None
+    ):
+        """
+        Args:
+            workers (Optional[int]): 동시 다운로드 수 (기본값: settings.IMAGE_DOWNLOAD_WORKERS)
+            image_dir (str): 이미지 저장 디렉토리
+            client (Optional[httpx.Client]): HTTP 클라이언트 (기본값: 공유 클라이언트)
+            scheduler (Optional[RequestScheduler]): 요청 스케줄러 (기본값: 공유 "http" 스케줄러)
+            manifest (Optional[ImageManifest]): 이미지 매니페스트 (기본값: image_dir의 manifest.json)
+        """
+        self.workers = max(1, workers or settings.IMAGE_DOWNLOAD_WORKERS)
+        self.image_dir = Path(image_dir)
+        self._client = client
+        self.scheduler = scheduler or get_scheduler("http")
+        self.manifest = manifest or ImageManifest(str(self.image_dir / MANIFEST_FILE))
+        if not self.manifest.path.exists():
+            # 매니페스트 도입 전에 저장한 파일도 해시로 찾을 수 있도록 등록
+            self.manifest.index_files(self.image_dir)
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.recent: deque = deque(maxlen=RECENT_LIMIT)
+        self.totals = {"cached": 0, "downloaded": 0, "existing": 0, "failed": 0, "bytes": 0, "elapsed": 0.0}
+
+    @property
+    def client(self) -> httpx.Client:
+        return self._client or get_http_client()
+
+    def download(self, url: str, page_id: str) -> Optional[str]:
+        """
+        이미지 하나를 내려받아 저장 (매니페스트에 있으면 내려받지 않음)
+
+        Args:
+            url (str): 이미지 URL
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            Optional[str]: 저장된 파일 경로 (실패 시 None)
+        """
+        started = time.perf_counter()
+        record = {"url": url, "page_id": page_id, "path": None, "bytes": 0, "status": "failed"}
+        key = image_source_key(url)
+
+        try:
+            known = self.manifest.lookup(key)
+            if known:
+                record.update(path=known["path"], status="cached")
+            else:
+                record.update(self._fetch(url))
+                self.manifest.record(key, record.pop("hash"), record["path"], record["bytes"])
+        except Exception as e:
+            print(f"이미지 다운로드 오류: {str(e)}")
+            record["error"] = str(e)
+
+        record["elapsed"] = round(time.perf_counter() - started, 3)
+        self._record(record)
+        return record["path"]
+
+    def download_all(
+        self,
+        urls: Iterable[str],
+        page_id: str,
+        download: Optional[Callable[[str, str], Optional[str]]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        여러 이미지를 작업 풀에서 동시에 내려받음 (같은 URL은 한 번만)
+
+        Args:
+            urls (Iterable[str]): 이미지 URL 목록
+            page_id (str): Notion 페이지 ID
+            download (Optional[Callable]): (url, page_id)를 받는 다운로드 함수 (기본값: self.download)
+
+        Returns:
+            Dict[str, Optional[str]]: URL별 저장된 파일 경로 (실패 시 None)
+        """
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return {}
+
+        download = download or self.download
+        if len(unique) == 1:
+            return {unique[0]: download(unique[0], page_id)}
+
+        executor = self._get_executor()
+        futures = {url: executor.submit(download, url, page_id) for url in unique}
+        return {url: future.result() for url, future in futures.items()}
+
+    def summary(self) -> Dict:
+        """
+        누적 다운로드 통계
+
+        Returns:
+            Dict: {"cached", "downloaded", "existing", "failed", "bytes", "elapsed", "average_latency"}
+        """
+        with self._lock:
+            totals = dict(self.totals)
+        count = totals["cached"] + totals["downloaded"] + totals["existing"] + totals["failed"]
+        totals["elapsed"] = round(totals["elapsed"], 3)
+        totals["average_latency"] = round(totals["elapsed"] / count, 3) if count else 0.0
+        return totals
+
+    def close(self):
+        """작업 풀을 종료하고 매니페스트 저장"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.manifest.save()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="image-download"
+                )
+            return self._executor
+
+    def _fetch(self, url: str) -> Dict:
+        """
+        응답을 청크 단위로 임시 파일에 쓰면서 해시를 계산하고 해시 이름으로 이동
+
+        Returns:
+            Dict: {"path", "bytes", "hash", "status"} (status는 "downloaded" 또는 "existing")
+        """
+        self.image_dir.mkdir(parents=True, exist_ok=True)
+
+        client = self.client
+        response = self.scheduler.request(
+            lambda request_url, timeout: client.send(
+                client.build_request("GET", request_url, timeout=timeout), stream=True
+            ),
+            url
+        )
+
+        try:
+            response.raise_for_status()
+            ext = image_extension(response.headers.get('content-type', ''))
+
+            # 같은 디렉토리에 임시 파일을 만들어야 rename이 원자적
+            digest = hashlib.md5()
+            size = 0
+            fd, temp_name = tempfile.mkstemp(dir=self.image_dir, prefix=".download-", suffix=ext)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_bytes(CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+
+                content_hash = digest.hexdigest()[:16]
+                result = {"bytes": size, "hash": content_hash}
+
+                # 내용이 같은 파일이 있으면 (이전 버전의 연/월 경로 포함) 그 파일을 사용
+                existing = self.manifest.path_for_hash(content_hash)
+                file_path = self.image_dir / content_hash[:2] / f"{content_hash}{ext}"
+                if existing or file_path.exists():
+                    return {**result, "path": existing or str(file_path), "status": "existing"}
+
+                # mkstemp는 0600으로 만들므로 일반 파일 권한으로 맞춤
+                file_path.parent.mkdir(exist_ok=True)
+                os.chmod(temp_name, 0o644)
+                os.replace(temp_name, file_path)
+                return {**result, "path": str(file_path), "status": "downloaded"}
+            finally:
+                if os.path.exists(temp_name):
+                    os.unlink(temp_name)
+        finally:
+            response.close()
+
+    def _record(self, record: Dict):
+        with self._lock:
+            self.recent.append(record)
+            self.totals[record["status"]] += 1
+            self.totals["bytes"] += record["bytes"]
+            self.totals["elapsed"] += record["elapsed"]
+
@@ -0,0 +1,112 @@
+"""
+이미지 정리 모듈
+저장된 글이 참조하지 않는 이미지 파일을 찾아 삭제하는 기능 제공
+
+참조는 콘텐츠 저장소의 모든 글의 이미지 목록(원본과 최적화 변형)과 본문의 이미지 URL로 집계합니다.
+삭제한 파일은 동기화 커밋(git add -A)에 함께 포함됩니다.
+"""
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from content_store import ContentStore
+from image_assets import (
+    GITATTRIBUTES_FILE, IMAGE_BASE_URL, LFS_BASE_URL, MANIFEST_FILE,
+    ImageManifest, set_lfs_tracking
+)
+
+
+# 이미지 디렉토리에서 삭제하지 않는 파일
+KEEP_FILES = {"README.md", MANIFEST_FILE, GITATTRIBUTES_FILE}
+
+# 본문에 남아 있는 저장소 이미지 URL (이미지 목록이 없던 이전 버전의 글)
+IMAGE_URL = re.compile(
+    "(?:" + re.escape(IMAGE_BASE_URL) + "|" + re.escape(LFS_BASE_URL) + r")([^)\s\"'?#]+)"
+)
+
+
+def count_image_references(store: ContentStore) -> Counter:
+    """
+    글별 이미지 참조 수 집계
+
+    Args:
+        store (ContentStore): 콘텐츠 저장소
+
+    Returns:
+        Counter: 절대 경로별 참조 수
+    """
+    references: Counter = Counter()
+    for post in store.iter_post_assets():
+        paths = set()
+        for image in post["images"]:
+            if image.get("path"):
+                paths.add(image["path"])
+            paths.update(variant["path"] for variant in image.get("variants", []))
+        paths.update(IMAGE_URL.findall(post["content"]))
+        references.update(str(Path(path).resolve()) for path in paths)
+    return references
+
+
+def collect_garbage(
+    store: ContentStore,
+    image_dir: str = "images",
+    manifest: Optional[ImageManifest] = None,
+    dry_run: bool = False
+) -> Dict:
+    """
+    참조되지 않는 이미지 파일 삭제
+
+    저장소에 글이 하나도 없으면 (동기화 실패 등) 모든 파일이 삭제되지 않도록 건너뜁니다.
+
+    Args:
+        store (ContentStore): 콘텐츠 저장소
+        image_dir (str): 이미지 디렉토리
+        manifest (Optional[ImageManifest]): 삭제한 파일 항목을 제거할 이미지 매니페스트
+        dry_run (bool): True면 삭제하지 않고 대상만 보고
+
+    Returns:
+        Dict: {"referenced", "orphaned", "reclaimed_bytes", "removed"}
+    """
+    report = {"referenced": 0, "orphaned": 0, "reclaimed_bytes": 0, "removed": []}
+    if not store.count():
+        print("이미지 정리 건너뜀: 저장된 글이 없습니다.")
+        return report
+
+    references = count_image_references(store)
+    root = Path(image_dir)
+    orphans: List[Path] = []
+    for path in sorted(root.rglob("*")):
+        if not path.is_file() or path.name in KEEP_FILES:
+            continue
+        if str(path.resolve()) in references:
+            report["referenced"] += 1
+        else:
+            orphans.append(path)
+
+    report["orphaned"] = len(orphans)
+    report["reclaimed_bytes"] = sum(path.stat().st_size for path in orphans)
+    report["removed"] = [path.as_posix() for path in orphans]
+    if dry_run or not orphans:
+        return report
+
+    for path in orphans:
+        path.unlink()
+    # 비게 된 하위 디렉토리 정리 (깊은 경로부터)
+    for directory in sorted((d for d in root.rglob("*") if d.is_dir()), key=lambda d: len(d.parts), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+
+    if manifest is not None:
+        manifest.prune(report["removed"])
+    set_lfs_tracking(report["removed"], False)
+    return report
+
+
+def format_bytes(size: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로 표시"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
@@ -0,0 +1,217 @@
+"""
+이미지 최적화 모듈
+동기화 시점에 내려받은 원본 이미지로 WebP/AVIF 너비별 변형을 만들고 크기 정보를 기록하는 기능 제공
+
+Pillow가 없으면 최적화를 건너뛰고 원본 이미지를 그대로 사용합니다.
+"""
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from config.settings import settings
+from image_assets import ImageManifest, default_variant
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 원본 이미지만 사용
+    Image = None
+
+
+# 형식별 저장 옵션 (metadata는 전달하지 않으므로 EXIF/XMP는 저장되지 않음)
+SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "method": 6},
+    "avif": {"format": "AVIF", "speed": 6},
+}
+
+
+def variant_path(path: Path, width: int, image_format: str) -> Path:
+    """원본 옆에 저장하는 변형 파일 경로 ({해시}-{너비}w.{형식})"""
+    return path.with_name(f"{path.stem}-{width}w.{image_format}")
+
+
+def optimize_image(
+    path: str,
+    widths: Sequence[int],
+    formats: Sequence[str],
+    quality: int = 80
+) -> Optional[Dict]:
+    """
+    이미지 하나의 변형 생성 (프로세스 풀에서 실행되므로 모듈 수준 함수)
+
+    원본보다 큰 너비는 만들지 않으며, 원본이 가장 작은 너비보다 작으면 원본 너비로 하나만 만듭니다.
+    애니메이션 이미지는 크기를 바꾸지 않고 애니메이션 WebP 하나만 만듭니다.
+    이미 있는 변형 파일은 다시 인코딩하지 않습니다.
+
+    Args:
+        path (str): 원본 이미지 경로
+        widths (Sequence[int]): 만들 너비 목록
+        formats (Sequence[str]): 만들 형식 목록 ("webp", "avif")
+        quality (int): 인코딩 품질
+
+    Returns:
+        Optional[Dict]: {"width", "height", "bytes", "variants": [{"path", "width", "height", "format", "bytes"}]}
+            (Pillow가 없거나 이미지를 읽을 수 없으면 None)
+    """
+    if Image is None:
+        return None
+
+    source = Path(path)
+    try:
+        with Image.open(source) as image:
+            width, height = image.size
+            variants = []
+
+            if getattr(image, "is_animated", False):
+                target = variant_path(source, width, "webp")
+                if not target.exists():
+                    image.save(target, save_all=True, quality=quality, **SAVE_OPTIONS["webp"])
+                variants.append(_variant(target, width, height, "webp"))
+            else:
+                # EXIF 회전을 픽셀에 적용한 뒤 메타데이터 없이 저장
+                image = ImageOps.exif_transpose(image)
+                width, height = image.size
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA" if "transparency" in image.info or "A" in image.mode else "RGB")
+
+                targets = sorted({min(target, width) for target in widths}) or [width]
+                for target_width in targets:
+                    target_height = max(1, round(height * target_width / width))
+                    resized = None
+                    for image_format in formats:
+                        target = variant_path(source, target_width, image_format)
+                        if not target.exists():
+                            if resized is None:
+                                resized = image if target_width == width else image.resize(
+                                    (target_width, target_height), Image.LANCZOS
+                                )
+                            resized.save(target, quality=quality, **SAVE_OPTIONS[image_format])
+                        variants.append(_variant(target, target_width, target_height, image_format))
+    except Exception as e:
+        print(f"이미지 최적화 오류 ({path}): {e}")
+        return None
+
+    return {"width": width, "height": height, "bytes": source.stat().st_size, "variants": variants}
+
+
+def _variant(path: Path, width: int, height: int, image_format: str) -> Dict:
+    return {
+        "path": path.as_posix(),
+        "width": width,
+        "height": height,
+        "format": image_format,
+        "bytes": path.stat().st_size
+    }
+
+
+class ImageOptimizer:
+    """
+    이미지 최적화 단계
+
+    변형 정보는 이미지 매니페스트에 내용 해시별로 기록되어 다음 동기화에서 재사용됩니다.
+    여러 이미지는 프로세스 풀에서 동시에 처리해 CI 러너의 모든 코어를 사용합니다.
+
+    사용 예:
+        optimizer = ImageOptimizer(downloader.manifest)
+        optimizer.optimize_all(paths)
+        info = optimizer.describe(paths[0])
+    """
+
+    def __init__(
+        self,
+        manifest: ImageManifest,
+        workers: Optional[int] = None,
+        widths: Optional[Sequence[int]] = None,
+        formats: Optional[Sequence[str]] = None,
+        quality: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Args:
+            manifest (ImageManifest): 변형 정보를 기록할 이미지 매니페스트
+            workers (Optional[int]): 프로세스 수 (기본값: settings.IMAGE_OPTIMIZE_WORKERS, 0이면 CPU 수)
+            widths (Optional[Sequence[int]]): 만들 너비 목록 (기본값: settings.IMAGE_WIDTHS)
+            formats (Optional[Sequence[str]]): 만들 형식 목록 (기본값: settings.IMAGE_FORMATS)
+            quality (Optional[int]): 인코딩 품질 (기본값: settings.IMAGE_QUALITY)
+            enabled (Optional[bool]): 최적화 여부 (기본값: settings.IMAGE_OPTIMIZE, Pillow가 없으면 False)
+        """
+        self.manifest = manifest
+        self.workers = workers or settings.IMAGE_OPTIMIZE_WORKERS or os.cpu_count() or 1
+        self.widths = list(widths or settings.IMAGE_WIDTHS)
+        self.formats = [image_format for image_format in (formats or settings.IMAGE_FORMATS) if image_format in SAVE_OPTIONS]
+        self.quality = quality or settings.IMAGE_QUALITY
+        self.enabled = (settings.IMAGE_OPTIMIZE if enabled is None else enabled) and Image is not None and bool(self.formats)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def optimize_all(self, paths: Iterable[str]) -> Dict[str, Dict]:
+        """
+        변형 정보가 없는 이미지들을 프로세스 풀에서 최적화
+
+        Args:
+            paths (Iterable[str]): 원본 이미지 경로 목록
+
+        Returns:
+            Dict[str, Dict]: 경로별 변형 정보 (최적화하지 못한 이미지는 제외)
+        """
+        if not self.enabled:
+            return {}
+
+        results = {}
+        pending: List[str] = []
+        for path in dict.fromkeys(paths):
+            info = self.manifest.get_variants(Path(path).stem)
+            if info:
+                results[path] = info
+            else:
+                pending.append(path)
+
+        if len(pending) == 1:
+            infos = [optimize_image(pending[0], self.widths, self.formats, self.quality)]
+        elif pending:
+            executor = self._get_executor()
+            infos = list(executor.map(
+                optimize_image, pending,
+                [self.widths] * len(pending), [self.formats] * len(pending), [self.quality] * len(pending)
+            ))
+        else:
+            infos = []
+
+        for path, info in zip(pending, infos):
+            if info:
+                self.manifest.record_variants(Path(path).stem, info)
+                results[path] = info
+        return results
+
+    def describe(self, path: str) -> Optional[Dict]:
+        """
+        이미지의 변형 정보 조회 (없으면 이 프로세스에서 바로 최적화)
+
+        Args:
+            path (str): 원본 이미지 경로
+
+        Returns:
+            Optional[Dict]: optimize_image 결과에 기본 변형("default")을 더한 정보
+        """
+        info = self.optimize_all([path]).get(path)
+        if not info:
+            return None
+        return {**info, "default": default_variant(info, settings.IMAGE_DEFAULT_WIDTH)}
+
+    def close(self):
+        """프로세스 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
@@ -2,65 +2,180 @@
 Notion API 연동 모듈
 Notion 데이터베이스에서 블로그 콘텐츠를 조회하고 변환하는 기능 제공
 """
-import os
-import hashlib
-import requests
-from datetime import datetime
-from typing import List, Dict, Optional
-from pathlib import Path
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Iterator, Sequence
 
 from notion_client import Client
 from config.settings import settings
+from itertools import islice
+from block_loader import BlockTreeLoader
+from block_renderer import BlockRenderer, AssetResolver, list_numbers
+from rich_text import compile_rich_text
+from content_store import ContentStore
+from request_scheduler import get_scheduler
+from http_session import create_notion_http_client
+from image_assets import ImageAssetResolver, ManifestImageResolver, notion_image_urls, unresolved_image_keys
+from image_downloader import ImageDownloader
+from image_optimizer import ImageOptimizer
+from snapshot import SnapshotReader
+
+
+# 목록 화면에서 실제로 표시하는 속성 (filter_properties 프로젝션용)
+LIST_PROPERTIES = ("제목", "슬러그", "발행일", "태그", "메타 설명")
 
 
 class NotionClient:
     """Notion API 클라이언트"""
     
-    def __init__(self):
-        """Notion 클라이언트 초기화"""
-        self.client = Client(auth=settings.NOTION_TOKEN)
+    def __init__(
+        self,
+        store: Optional[ContentStore] = None,
+        download_images: bool = True,
+        use_store: bool = True
+    ):
+        """
+        Notion 클라이언트 초기화
+        
+        Args:
+            store (Optional[ContentStore]): 읽기용 콘텐츠 저장소.
+                None이면 settings.CONTENT_STORE_PATH 파일이 있을 때만 사용
+            download_images (bool): False면 이미지를 내려받지 않고 이미지 매니페스트로만 URL을 찾음
+                (앱 서빙용, 찾지 못한 이미지는 서명 URL로 둠)
+            use_store (bool): False면 store가 없을 때 콘텐츠 저장소 파일을 열지 않고
+                항상 Notion API로 조회 (CONTENT_SOURCE=live)
+        """
+        self.client = Client(
+            auth=settings.NOTION_TOKEN,
+            timeout_ms=int(settings.HTTP_TIMEOUT * 1000),
+            base_url=settings.NOTION_API_BASE_URL,
+            client=create_notion_http_client()
+        )
+        self.scheduler = get_scheduler("notion")
         self.database_id = settings.NOTION_DATABASE_ID
         self.token = settings.NOTION_TOKEN
+        if store is None and use_store:
+            store = ContentStore.open_existing()
+        self.store = store
+        self.renderer = BlockRenderer(rich_text=compile_rich_text)
+        self.download_images = download_images
+        self.downloader = ImageDownloader()
+        self.optimizer = ImageOptimizer(self.downloader.manifest)
     
-    def fetch_published_posts(self) -> List[Dict]:
+    def iter_published_posts(
+        self,
+        page_size: int = 100,
+        properties: Optional[Sequence[str]] = None,
+        edited_after: Optional[datetime] = None
+    ) -> Iterator[Dict]:
         """
-        발행된 블로그 글 목록을 조회
+        발행된 블로그 글을 페이지 단위로 조회하며 하나씩 반환
         
-        Returns:
-            List[Dict]: 발행된 글 목록
+        `has_more`/`next_cursor`를 따라가며 전체 데이터베이스를 순회하고,
+        한 번에 한 페이지(최대 page_size개)만 메모리에 유지합니다.
+        
+        Args:
+            page_size (int): 요청당 조회할 글 수 (최대 100)
+            properties (Optional[Sequence[str]]): 응답에 포함할 속성 이름 또는 ID
+                (`filter_properties`). None이면 모든 속성을 조회
+            edited_after (Optional[datetime]): 이 시각 이후(포함)에 수정된 글만 조회.
+                Notion 쿼리의 `last_edited_time` 타임스탬프 필터로 전달됨
+            
+        Yields:
+            Dict: 발행된 글
         """
-        try:
-            response = self.client.databases.query(
-                database_id=self.database_id,
-                filter={
-                    "property": "상태",
-                    "select": {
-                        "equals": "Published"
-                    }
-                },
-                sorts=[
+        query_filter = {
+            "property": "상태",
+            "select": {
+                "equals": "Published"
+            }
+        }
+        if edited_after:
+            if edited_after.tzinfo is None:
+                edited_after = edited_after.astimezone()
+            query_filter = {
+                "and": [
+                    query_filter,
                     {
-                        "property": "발행일",
-                        "direction": "descending"
+                        "timestamp": "last_edited_time",
+                        "last_edited_time": {
+                            "on_or_after": edited_after.astimezone(timezone.utc).isoformat()
+                        }
                     }
                 ]
-            )
+            }
+        
+        query = {
+            "database_id": self.database_id,
+            "filter": query_filter,
+            "sorts": [
+                {
+                    "property": "발행일",
+                    "direction": "descending"
+                }
+            ],
+            "page_size": min(max(page_size, 1), 100)
+        }
+        if properties:
+            query["filter_properties"] = list(properties)
+        
+        start_cursor = None
+        while True:
+            if start_cursor:
+                query["start_cursor"] = start_cursor
+            
+            response = self.scheduler.call(self.client.databases.query, **query)
             
-            posts = []
             for page in response["results"]:
-                post = self._extract_page_properties(page)
-                posts.append(post)
+                yield self._extract_page_properties(page)
+            
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not start_cursor:
+                break
+    
+    def fetch_published_posts(self, properties: Optional[Sequence[str]] = None) -> List[Dict]:
+        """
+        발행된 블로그 글 목록을 조회
+        
+        Args:
+            properties (Optional[Sequence[str]]): 조회할 속성 (None이면 전체)
+        
+        Returns:
+            List[Dict]: 발행된 글 목록
+        """
+        try:
+            if self.store and self.store.count():
+                return self.store.list_posts()
             
-            return posts
+            return list(self.iter_published_posts(properties=properties))
             
         except Exception as e:
             print(f"글 목록 조회 오류: {str(e)}")
             return []
     
+    def fetch_recent_posts(self, limit: int, properties: Optional[Sequence[str]] = LIST_PROPERTIES) -> List[Dict]:
+        """
+        최신 글 limit개만 조회 (저장소가 있으면 저장소에서, 없으면 첫 페이지만 API로)
+        
+        Args:
+            limit (int): 조회할 글 수
+            properties (Optional[Sequence[str]]): 조회할 속성
+            
+        Returns:
+            List[Dict]: 최신 글 목록
+        """
+        if self.store and self.store.count():
+            return self.store.list_posts(limit=limit)
+        
+        return list(islice(self.iter_published_posts(page_size=limit, properties=properties), limit))
+    
     def get_post_by_slug(self, slug: str) -> Optional[Dict]:
         """
         슬러그로 특정 글을 조회
         
+        콘텐츠 저장소에 있으면 인덱스 조회 한 번으로 반환하고,
+        없을 때만 Notion API에서 조회해 변환합니다.
+        
         Args:
             slug (str): 글의 슬러그
             
@@ -68,33 +183,310 @@ class NotionClient:
             Optional[Dict]: 글 정보 (없으면 None)
         """
         try:
-            # 슬러그로 페이지 검색
-            response = self.client.databases.query(
-                database_id=self.database_id,
-                filter={
-                    "property": "슬러그",
-                    "rich_text": {
-                        "equals": slug
-                    }
+            post = self.find_post_by_slug(slug)
+            if post is None or "content" in post:
+                return post
+            
+            return self.render_post(post)
+            
+        except Exception as e:
+            print(f"글 조회 오류: {str(e)}")
+            return None
+    
+    def find_post_by_slug(self, slug: str) -> Optional[Dict]:
+        """
+        슬러그로 글을 찾되 본문은 렌더링하지 않음
+        
+        콘텐츠 저장소에 있으면 렌더링된 글(content 포함)을, 없으면 Notion API로 조회한
+        속성만(content 없음) 반환합니다. 본문은 iter_post_sections로 이어서 받을 수 있습니다.
+        
+        Args:
+            slug (str): 글의 슬러그
+            
+        Returns:
+            Optional[Dict]: 글 정보 (없으면 None)
+        """
+        if self.store:
+            stored = self.store.get_post_by_slug(slug)
+            if stored:
+                return stored
+        
+        # 슬러그로 페이지 검색
+        response = self.scheduler.call(
+            self.client.databases.query,
+            database_id=self.database_id,
+            filter={
+                "property": "슬러그",
+                "rich_text": {
+                    "equals": slug
                 }
+            }
+        )
+        
+        if not response["results"]:
+            return None
+        
+        return self._extract_page_properties(response["results"][0])
+    
+    def get_post(self, page_id: str) -> Optional[Dict]:
+        """
+        페이지 ID로 글 속성 조회 (본문은 렌더링하지 않음)
+        
+        Args:
+            page_id (str): Notion 페이지 ID
+        
+        Returns:
+            Optional[Dict]: _extract_page_properties 형식의 글
+                (없거나 삭제되었거나 블로그 데이터베이스의 페이지가 아니면 None)
+        
+        Raises:
+            Exception: 404 이외의 조회 오류 (사라진 글로 오인해 제거하지 않도록 전달)
+        """
+        try:
+            page = self.scheduler.call(self.client.pages.retrieve, page_id=page_id)
+        except Exception as e:
+            if getattr(e, "status", None) == 404:
+                return None
+            print(f"페이지 조회 오류 ({page_id}): {e}")
+            raise
+        
+        if page.get("archived") or page.get("in_trash"):
+            return None
+        
+        database_id = page.get("parent", {}).get("database_id")
+        if self.database_id and database_id and database_id.replace("-", "") != self.database_id.replace("-", ""):
+            return None
+        return self._extract_page_properties(page)
+
+    def iter_post_sections(self, post: Dict) -> Iterator[str]:
+        """
+        글 본문을 블록을 받는 대로 섹션(제목 블록) 단위로 렌더링해 반환
+        
+        첫 섹션은 그 섹션의 블록과 이미지만 처리되면 바로 반환되므로 긴 글도
+        전체 조회가 끝나기 전에 표시를 시작할 수 있습니다. 모든 섹션을 반환하고 나면
+        post에 content, images, fetch_stats가 render_post와 같은 형식으로 채워집니다.
+        
+        Args:
+            post (Dict): _extract_page_properties 형식의 글
+            
+        Yields:
+            str: 이미지 URL까지 교체된 섹션 마크다운
+        """
+        loader = BlockTreeLoader(self.client, scheduler=self.scheduler)
+        images: List[Dict] = []
+        sections = []
+        
+        blocks = loader.iter_blocks(post["id"])
+        for section in self.renderer.iter_sections(blocks, resolve_asset=self.image_resolver(post["id"], images)):
+            sections.append(section)
+            yield section
+        
+        post["content"] = "\n\n".join(sections) + "\n\n"
+        post["images"] = images
+        post["fetch_stats"] = loader.last_stats
+    
+    def render_post(self, post: Dict, fragment_store: Optional[ContentStore] = None) -> Dict:
+        """
+        글의 블록 트리를 조회해 마크다운 콘텐츠와 이미지 목록을 채움
+        
+        fragment_store가 주어지면 최상위 블록별로 렌더링 결과를 캐시합니다.
+        블록 ID와 `last_edited_time`이 캐시와 같으면 하위 트리를 조회하지 않고
+        캐시된 조각을 그대로 사용하며, 바뀐 블록만 조회/변환/이미지 처리합니다.
+        
+        Args:
+            post (Dict): _extract_page_properties 형식의 글
+            fragment_store (Optional[ContentStore]): 블록 렌더링 캐시 저장소
+            
+        Returns:
+            Dict: content, images, fetch_stats가 추가된 글
+        """
+        if fragment_store is None:
+            # 페이지 콘텐츠 조회 (중첩 블록 포함)
+            loader = BlockTreeLoader(self.client, scheduler=self.scheduler)
+            content_blocks = loader.load(post["id"])
+            images: List[Dict] = []
+            prefetched = self.prefetch_images(content_blocks, post["id"])
+            post["content"] = self.convert_blocks_to_markdown(
+                content_blocks, resolve_asset=self.image_resolver(post["id"], images, prefetched)
             )
+            post["images"] = images
+            post["fetch_stats"] = loader.last_stats
+        else:
+            # 블록 렌더링 캐시를 이용해 바뀐 최상위 블록만 다시 렌더링
+            job = self.convert_post(self.fetch_post_assets(self.fetch_post_blocks(post, fragment_store)))
+            fragment_store.replace_fragments(post["id"], job["fragments"])
+        
+        print(
+            f"블록 조회 완료 ({post['slug']}): API {post['fetch_stats']['api_calls']}회, "
+            f"{post['fetch_stats']['elapsed']}초"
+        )
+        
+        return post
+    
+    def fetch_post_blocks(self, post: Dict, fragment_store: ContentStore) -> Dict:
+        """
+        렌더링 1단계: 최상위 블록을 조회해 캐시와 비교하고 바뀐 블록의 하위 트리만 조회
+        
+        fetch_post_assets, convert_post로 이어지며 동기화 파이프라인에서는 단계별로 따로 실행됩니다.
+        
+        Args:
+            post (Dict): _extract_page_properties 형식의 글
+            fragment_store (ContentStore): 블록 렌더링 캐시 저장소
             
-            if not response["results"]:
-                return None
+        Returns:
+            Dict: 렌더링 작업 {"post", "top_blocks", "stale_blocks", "cached", "now", "prefetched"}
+        """
+        loader = BlockTreeLoader(self.client, scheduler=self.scheduler)
+        now = datetime.now(timezone.utc)
+        top_blocks = loader.list_children(post["id"])
+        cached = fragment_store.get_fragments(post["id"])
+        
+        # 바뀐 블록의 하위 트리만 조회
+        stale_blocks = self._select_stale_blocks(top_blocks, cached, now)
+        
+        # 중첩된 하위 블록만 수정되면 페이지 수정 시각은 바뀌지만 최상위 블록의 수정 시각은 그대로이므로,
+        # 저장된 글과 수정 시각이 다른데 수정 시각이 바뀐 최상위 블록이 없으면 전체 하위 트리를 다시 조회
+        stored_edited = fragment_store.get_last_edited(post["id"])
+        if stored_edited and post.get("last_edited") and stored_edited != post["last_edited"] and not any(
+            block["id"] not in cached or cached[block["id"]]["last_edited_time"] != block.get("last_edited_time")
+            for block in top_blocks
+        ):
+            stale_blocks = list(top_blocks)
+        loader.expand(stale_blocks)
+        
+        loader.last_stats["reused_blocks"] = len(top_blocks) - len(stale_blocks)
+        loader.last_stats["rendered_blocks"] = len(stale_blocks)
+        post["fetch_stats"] = loader.last_stats
+        
+        return {
+            "post": post,
+            "top_blocks": top_blocks,
+            "stale_blocks": stale_blocks,
+            "cached": cached,
+            "now": now,
+            "prefetched": None
+        }
+    
+    def fetch_post_assets(self, job: Dict) -> Dict:
+        """
+        렌더링 2단계: 다시 렌더링할 블록의 이미지를 내려받고 최적화
+        
+        Args:
+            job (Dict): fetch_post_blocks가 만든 렌더링 작업
             
-            page = response["results"][0]
-            post = self._extract_page_properties(page)
+        Returns:
+            Dict: prefetched(URL별 파일 경로)가 채워진 작업
+        """
+        job["prefetched"] = self.prefetch_images(job["stale_blocks"], job["post"]["id"])
+        return job
+    
+    def convert_post(self, job: Dict) -> Dict:
+        """
+        렌더링 3단계: 바뀐 블록을 마크다운으로 변환하고 캐시 조각과 이어 붙여 글 콘텐츠를 채움
+        
+        Args:
+            job (Dict): fetch_post_assets까지 거친 렌더링 작업
             
-            # 페이지 콘텐츠 조회
-            content_blocks = self.client.blocks.children.list(block_id=page["id"])
-            post["content"] = self.convert_blocks_to_markdown(content_blocks["results"])
-            post["content"] = self.process_notion_images(post["content"], page["id"])
+        Returns:
+            Dict: fragments(블록 렌더링 캐시에 기록할 조각)가 채워진 작업
+        """
+        job["fragments"] = self._assemble_fragments(
+            job["post"], job["top_blocks"], job["stale_blocks"], job["cached"], job["now"], job["prefetched"]
+        )
+        return job
+    
+    def _select_stale_blocks(self, top_blocks: List[Dict], cached: Dict[str, Dict], now: datetime) -> List[Dict]:
+        """
+        캐시를 재사용할 수 없는 최상위 블록 선택
+        
+        Notion은 하위 블록 수정 시 부모의 `last_edited_time`을 항상 갱신하지는 않으므로
+        RENDER_CACHE_MAX_AGE_HOURS보다 오래된 조각은 타임스탬프가 같아도 다시 렌더링합니다.
+        번호 목록 항목은 캐시된 번호가 현재 위치의 번호와 다를 때, 이미지를 내려받지 못해
+        Notion 서명 URL이 남은 조각도 다시 렌더링합니다.
+        
+        Args:
+            top_blocks (List[Dict]): 페이지의 최상위 블록
+            cached (Dict[str, Dict]): 블록 ID별 캐시된 조각
+            now (datetime): 기준 시각 (UTC)
             
-            return post
+        Returns:
+            List[Dict]: 다시 렌더링할 블록
+        """
+        expires_before = (now - timedelta(hours=settings.RENDER_CACHE_MAX_AGE_HOURS)).isoformat()
+        numbers = list_numbers(top_blocks)
+        
+        stale_blocks = []
+        for block in top_blocks:
+            entry = cached.get(block["id"])
+            if (
+                not entry
+                or entry["last_edited_time"] != block.get("last_edited_time")
+                or entry["rendered_at"] < expires_before
+                # 앞쪽 번호 목록 항목이 추가/삭제되면 번호가 바뀜
+                or entry.get("list_number") != numbers.get(block["id"])
+                # 지난 렌더링에서 내려받지 못한 이미지는 다시 시도
+                or unresolved_image_keys(entry["markdown"])
+            ):
+                stale_blocks.append(block)
+        
+        return stale_blocks
+    
+    def _assemble_fragments(
+        self,
+        post: Dict,
+        top_blocks: List[Dict],
+        stale_blocks: List[Dict],
+        cached: Dict[str, Dict],
+        now: datetime,
+        prefetched: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[Dict]:
+        """
+        바뀐 블록은 새로 렌더링하고 나머지는 캐시 조각을 이어 붙여 글 콘텐츠를 채움
+        
+        Args:
+            post (Dict): 렌더링할 글 (content, images가 채워짐)
+            top_blocks (List[Dict]): 페이지의 최상위 블록
+            stale_blocks (List[Dict]): 하위 트리가 채워진 다시 렌더링할 블록
+            cached (Dict[str, Dict]): 블록 ID별 캐시된 조각
+            now (datetime): 렌더링 시각 (UTC)
+            prefetched (Optional[Dict[str, Optional[str]]]): 미리 받은 이미지 경로 (None이면 여기서 내려받음)
             
-        except Exception as e:
-            print(f"글 조회 오류: {str(e)}")
-            return None
+        Returns:
+            List[Dict]: 최상위 블록 순서대로 정렬된 조각 리스트
+        """
+        stale_ids = {block["id"] for block in stale_blocks}
+        numbers = list_numbers(top_blocks)
+        if prefetched is None:
+            prefetched = self.prefetch_images(stale_blocks, post["id"])
+        
+        fragments = []
+        for block in top_blocks:
+            if block["id"] not in stale_ids:
+                fragments.append(cached[block["id"]])
+                continue
+            
+            fragment_images: List[Dict] = []
+            list_number = numbers.get(block["id"])
+            markdown = self.renderer.render(
+                [block],
+                first_number=list_number or 1,
+                resolve_asset=self.image_resolver(post["id"], fragment_images, prefetched)
+            )
+            fragments.append({
+                "block_id": block["id"],
+                "last_edited_time": block.get("last_edited_time", ""),
+                "list_number": list_number,
+                "markdown": markdown,
+                "images": fragment_images,
+                "rendered_at": now.isoformat()
+            })
+        
+        post["content"] = "\n\n".join(
+            fragment["markdown"] for fragment in fragments if fragment["markdown"]
+        ) + "\n\n"
+        post["images"] = [image for fragment in fragments for image in fragment["images"]]
+        
+        return fragments
     
     def _extract_page_properties(self, page: Dict) -> Dict:
         """
@@ -149,146 +541,124 @@ class NotionClient:
             "last_edited": page["last_edited_time"]
         }
     
-    def convert_blocks_to_markdown(self, blocks: List[Dict]) -> str:
+    def convert_blocks_to_markdown(
+        self,
+        blocks: List[Dict],
+        resolve_asset: Optional[AssetResolver] = None
+    ) -> str:
         """
         Notion 블록을 마크다운으로 변환
         
+        `children` 키에 하위 블록이 채워져 있으면 함께 변환합니다.
+        
         Args:
             blocks (List[Dict]): Notion 블록 리스트
+            resolve_asset (Optional[AssetResolver]): 이미지 URL 변환 함수 (예: image_resolver)
             
         Returns:
             str: 변환된 마크다운 텍스트
         """
-        markdown_parts = []
-        
-        for block in blocks:
-            block_type = block["type"]
-            
-            if block_type == "paragraph":
-                text = self._extract_rich_text(block["paragraph"]["rich_text"])
-                markdown_parts.append(text)
-            
-            elif block_type == "heading_1":
-                text = self._extract_rich_text(block["heading_1"]["rich_text"])
-                markdown_parts.append(f"# {text}")
-            
-            elif block_type == "heading_2":
-                text = self._extract_rich_text(block["heading_2"]["rich_text"])
-                markdown_parts.append(f"## {text}")
-            
-            elif block_type == "heading_3":
-                text = self._extract_rich_text(block["heading_3"]["rich_text"])
-                markdown_parts.append(f"### {text}")
-            
-            elif block_type == "bulleted_list_item":
-                text = self._extract_rich_text(block["bulleted_list_item"]["rich_text"])
-                markdown_parts.append(f"- {text}")
-            
-            elif block_type == "numbered_list_item":
-                text = self._extract_rich_text(block["numbered_list_item"]["rich_text"])
-                markdown_parts.append(f"1. {text}")
-            
-            elif block_type == "code":
-                language = block["code"]["language"]
-                text = self._extract_rich_text(block["code"]["rich_text"])
-                markdown_parts.append(f"```{language}\n{text}\n```")
-            
-            elif block_type == "quote":
-                text = self._extract_rich_text(block["quote"]["rich_text"])
-                markdown_parts.append(f"> {text}")
-            
-            elif block_type == "image":
-                image_url = self._get_image_url(block["image"])
-                if image_url:
-                    markdown_parts.append(f"![image]({image_url})")
-        
-        return "\n\n".join(markdown_parts) + "\n\n"
+        return self.renderer.render(blocks, resolve_asset=resolve_asset) + "\n\n"
     
-    def _extract_rich_text(self, rich_text: List[Dict]) -> str:
+    def image_resolver(
+        self,
+        page_id: str,
+        manifest: Optional[List[Dict]] = None,
+        prefetched: Optional[Dict[str, Optional[str]]] = None
+    ) -> AssetResolver:
         """
-        Notion rich text를 일반 텍스트로 변환
+        블록 변환 중 Notion 이미지를 내려받아 저장소 URL로 바꾸는 에셋 리졸버 생성
+        
+        download_images가 False면 내려받지 않고 이미지 매니페스트만 조회하는 리졸버를 반환합니다.
         
         Args:
-            rich_text (List[Dict]): Notion rich text 객체
+            page_id (str): Notion 페이지 ID
+            manifest (Optional[List[Dict]]): 처리한 이미지 정보를 추가할 리스트
+            prefetched (Optional[Dict[str, Optional[str]]]): prefetch_images로 미리 받은 URL별 파일 경로
             
         Returns:
-            str: 변환된 텍스트
+            AssetResolver: BlockRenderer의 resolve_asset으로 전달할 리졸버
+        """
+        if not self.download_images:
+            return ManifestImageResolver(self.downloader.manifest, page_id, manifest)
+        download = self._download_and_save_image
+        if prefetched:
+            def download_prefetched(url: str, page_id: str) -> Optional[str]:
+                if url in prefetched:
+                    return prefetched[url]
+                return self._download_and_save_image(url, page_id)
+            download = download_prefetched
+        return ImageAssetResolver(download, page_id, manifest, describe=self.optimizer.describe)
+    
+    def prefetch_images(self, blocks: List[Dict], page_id: str) -> Dict[str, Optional[str]]:
         """
-        if not rich_text:
-            return ""
+        블록 트리의 Notion 이미지를 변환 전에 다운로더 작업 풀에서 동시에 내려받고
+        최적화 변형을 프로세스 풀에서 만듦
         
-        text_parts = []
-        for text_obj in rich_text:
-            text = text_obj["plain_text"]
-            
-            # 스타일 적용
-            if text_obj["annotations"]["bold"]:
-                text = f"**{text}**"
-            if text_obj["annotations"]["italic"]:
-                text = f"*{text}*"
-            if text_obj["annotations"]["code"]:
-                text = f"`{text}`"
-            
-            # 링크 처리
-            if text_obj.get("href"):
-                text = f"[{text}]({text_obj['href']})"
+        Args:
+            blocks (List[Dict]): 하위 블록이 채워진 블록 리스트
+            page_id (str): Notion 페이지 ID
             
-            text_parts.append(text)
-        
-        return "".join(text_parts)
+        Returns:
+            Dict[str, Optional[str]]: URL별 저장된 파일 경로 (image_resolver의 prefetched로 전달,
+                download_images가 False면 빈 딕셔너리)
+        """
+        if not self.download_images:
+            return {}
+        paths = self.downloader.download_all(
+            notion_image_urls(blocks), page_id, download=self._download_and_save_image
+        )
+        self.optimizer.optimize_all(path for path in paths.values() if path)
+        return paths
     
-    def _get_image_url(self, image_block: Dict) -> Optional[str]:
+    def _extract_rich_text(self, rich_text: List[Dict]) -> str:
         """
-        이미지 블록에서 URL 추출
+        Notion rich text를 마크다운 인라인 텍스트로 변환
+        
+        같은 서식의 인접 런 병합과 결과 캐시는 공유 RichTextCompiler가 처리합니다.
         
         Args:
-            image_block (Dict): Notion 이미지 블록
+            rich_text (List[Dict]): Notion rich text 객체
             
         Returns:
-            Optional[str]: 이미지 URL
+            str: 변환된 텍스트
         """
-        if image_block["type"] == "file":
-            return image_block["file"]["url"]
-        elif image_block["type"] == "external":
-            return image_block["external"]["url"]
-        return None
+        return compile_rich_text(rich_text)
     
-    def process_notion_images(self, content: str, page_id: str) -> str:
+    def process_notion_images(
+        self,
+        content: str,
+        page_id: str,
+        image_manifest: Optional[List[Dict]] = None
+    ) -> str:
         """
-        Notion 이미지 URL을 GitHub 저장소 URL로 교체
+        이미 렌더링된 마크다운의 Notion 이미지 URL을 GitHub 저장소 URL로 교체
+        
+        블록을 변환할 때는 image_resolver로 변환 중에 처리되므로 이 함수는
+        블록 없이 마크다운만 있는 경우(이전 버전에서 저장한 본문 등)에만 사용합니다.
         
         Args:
             content (str): 마크다운 콘텐츠
             page_id (str): Notion 페이지 ID
+            image_manifest (Optional[List[Dict]]): 전달하면 저장한 이미지 정보를 추가
             
         Returns:
             str: 이미지 URL이 교체된 콘텐츠
         """
         import re
         
-        # 이미지 URL 패턴 찾기
-        image_pattern = r'!\[([^\]]*)\]\((https://[^)]+)\)'
+        resolver = self.image_resolver(page_id, image_manifest)
         
         def replace_image(match):
-            alt_text = match.group(1)
-            original_url = match.group(2)
-            
-            # Notion 이미지 URL인지 확인
-            if "prod-files-secure.s3.amazonaws.com" in original_url or "notion.so" in original_url:
-                # 이미지 다운로드 및 저장
-                local_path = self._download_and_save_image(original_url, page_id)
-                if local_path:
-                    # GitHub raw URL로 변환
-                    github_url = f"https://raw.githubusercontent.com/dexelop/notion_to_blog/main/{local_path}"
-                    return f"![{alt_text}]({github_url})"
-            
-            return match.group(0)  # 원본 반환
+            alt_text, original_url = match.group(1), match.group(2)
+            resolved = resolver("", original_url, alt_text)
+            return f"![{alt_text}]({resolved})" if resolved else match.group(0)
         
-        return re.sub(image_pattern, replace_image, content)
+        return re.sub(r'!\[([^\]]*)\]\((https://[^)]+)\)', replace_image, content)
     
     def _download_and_save_image(self, url: str, page_id: str) -> Optional[str]:
         """
-        이미지를 다운로드하고 로컬에 저장
+        이미지를 다운로드하고 로컬에 저장 (본문을 스트리밍으로 저장하며 해시 계산)
         
         Args:
             url (str): 이미지 URL
@@ -297,49 +667,51 @@ class NotionClient:
         Returns:
             Optional[str]: 저장된 파일 경로
         """
-        try:
-            # 이미지 다운로드
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # 파일 확장자 추출
-            content_type = response.headers.get('content-type', '')
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                ext = '.jpg'
-            elif 'png' in content_type:
-                ext = '.png'
-            elif 'gif' in content_type:
-                ext = '.gif'
-            else:
-                ext = '.jpg'  # 기본값
-            
-            # 파일 해시 생성 (중복 방지)
-            image_hash = hashlib.md5(response.content).hexdigest()[:16]
-            
-            # 저장 경로 생성
-            now = datetime.now()
-            year = now.year
-            month = f"{now.month:02d}"
-            
-            save_dir = Path(f"images/{year}/{month}")
-            save_dir.mkdir(parents=True, exist_ok=True)
-            
-            filename = f"{image_hash}{ext}"
-            file_path = save_dir / filename
-            
-            # 이미 존재하면 기존 파일 사용
-            if file_path.exists():
-                return str(file_path)
-            
-            # 파일 저장
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            
-            return str(file_path)
-            
-        except Exception as e:
-            print(f"이미지 다운로드 오류: {str(e)}")
-            return None
\ No newline at end of file
+        return self.downloader.download(url, page_id)
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_notion_client() -> "NotionClient":
+    """
+    프로세스 전역에서 공유하는 NotionClient 조회
+    
+    앱의 글 조회용이므로 요청 중에 이미지를 내려받지 않는 클라이언트를 만듭니다.
+    CONTENT_SOURCE가 "live"면 콘텐츠 저장소를 읽지 않고 항상 Notion API로 조회합니다.
+    
+    Returns:
+        NotionClient: 공유 클라이언트
+    """
+    global _shared_client
+    
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = NotionClient(
+                download_images=False,
+                use_store=settings.CONTENT_SOURCE != "live"
+            )
+        return _shared_client
+
+
+def create_content_client():
+    """
+    설정(CONTENT_SOURCE)에 따라 글 조회 클라이언트 생성
+    
+    - "auto"(기본값): 스냅샷이 있으면 SnapshotReader, 없으면 NotionClient
+    - "snapshot": SnapshotReader (스냅샷이 없으면 경고 후 NotionClient)
+    - "live": 항상 Notion API를 호출하는 NotionClient
+    
+    Returns:
+        SnapshotReader | NotionClient: 같은 조회 메서드를 제공하는 클라이언트
+    """
+    source = settings.CONTENT_SOURCE
+    
+    if source != "live":
+        if SnapshotReader.exists():
+            return SnapshotReader()
+        if source == "snapshot":
+            print(f"스냅샷({settings.SNAPSHOT_DIR})이 없어 Notion API 모드로 조회합니다.")
+    
+    return get_notion_client()
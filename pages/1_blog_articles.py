@@ -4,14 +4,20 @@ Notion에서 발행된 글들을 목록으로 표시
 """
 import streamlit as st
 from datetime import datetime
-from notion_client import NotionClient
+from notion_client import create_content_client, LIST_PROPERTIES
+
+
+@st.cache_resource
+def get_client():
+    """글 조회 클라이언트 (프로세스 전체에서 하나만 생성해 연결을 재사용)"""
+    return create_content_client()
 
 
 @st.cache_data(ttl=3600)  # 1시간 캐싱
 def load_blog_posts():
     """블로그 글 목록을 로드 (캐싱됨)"""
-    client = NotionClient()
-    return client.fetch_published_posts()
+    client = get_client()
+    return client.fetch_published_posts(properties=LIST_PROPERTIES)
 
 
 def format_date(date_str):
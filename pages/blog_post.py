@@ -2,16 +2,160 @@
 블로그 글 상세 페이지
 개별 블로그 글의 전체 내용을 표시
 """
+import time
+import threading
 import streamlit as st
+from collections import OrderedDict
 from datetime import datetime
-from notion_client import NotionClient
+from urllib.parse import quote
+from notion_client import create_content_client
+
+
+# 렌더링된 글 캐시 유지 시간 (6시간)과 최대 글 수 (가장 오래 사용하지 않은 글부터 제거)
+POST_CACHE_TTL = 21600
+POST_CACHE_MAX_ENTRIES = 128
+
+# 긴 글에서 처음 표시할 섹션 수와 "다음 섹션 보기"마다 추가로 표시할 섹션 수
+INITIAL_SECTIONS = 3
+SECTIONS_PER_LOAD = 5
+
+
+@st.cache_resource
+def get_client():
+    """글 조회 클라이언트 (프로세스 전체에서 하나만 생성해 연결을 재사용)"""
+    return create_content_client()
+
+
+class PostCache:
+    """렌더링이 끝난 글의 LRU 캐시 (글마다 TTL이 지나면 만료, 세션 간 공유)"""
+    
+    def __init__(self, max_entries=POST_CACHE_MAX_ENTRIES, ttl=POST_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # {slug: (만료 시각, 글)}
+        self._lock = threading.Lock()
+    
+    def get(self, slug):
+        """만료되지 않은 글 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[slug]
+                return None
+            self._entries.move_to_end(slug)
+            return entry[1]
+    
+    def put(self, post):
+        """글 저장 (만료된 글을 먼저 제거하고, 그래도 가득 차면 가장 오래 사용하지 않은 글 제거)"""
+        now = time.time()
+        with self._lock:
+            self._entries[post["slug"]] = (now + self.ttl, post)
+            self._entries.move_to_end(post["slug"])
+            for slug in [slug for slug, (expires, _) in self._entries.items() if expires <= now]:
+                del self._entries[slug]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource
+def get_post_cache():
+    """렌더링이 끝난 글 캐시 (세션 간 공유)"""
+    return PostCache()
 
 
-@st.cache_data(ttl=21600)  # 6시간 캐싱
 def load_blog_post(slug):
-    """특정 블로그 글을 로드 (캐싱됨)"""
-    client = NotionClient()
-    return client.get_post_by_slug(slug)
+    """
+    특정 블로그 글을 로드
+    
+    캐시나 스냅샷/저장소에 있으면 본문(content)이 포함된 글을,
+    Notion API로 조회해야 하면 본문 없이 속성만 반환합니다.
+    """
+    cached = get_post_cache().get(slug)
+    if cached:
+        return cached
+    
+    try:
+        post = get_client().find_post_by_slug(slug)
+    except Exception as e:
+        print(f"글 조회 오류: {str(e)}")
+        return None
+    
+    if post and "content" in post:
+        get_post_cache().put(post)
+    return post
+
+
+def stream_post_content(post):
+    """
+    본문을 섹션 단위로 받는 대로 표시하고, 끝나면 글을 캐시에 저장
+    
+    Returns:
+        bool: 표시한 내용(또는 오류 안내)이 있으면 True
+    """
+    client = get_client()
+    container = st.container()
+    status = st.empty()
+    status.caption("본문을 불러오는 중...")
+    shown = False
+    
+    try:
+        for section in client.iter_post_sections(post):
+            if section.strip():
+                container.markdown(section, unsafe_allow_html=False)
+                shown = True
+    except Exception as e:
+        print(f"본문 조회 오류: {str(e)}")
+        status.warning("본문을 모두 불러오지 못했습니다. 잠시 후 다시 시도해주세요.")
+        return True
+    
+    status.empty()
+    get_post_cache().put(post)
+    return shown
+
+
+def show_post_sections(post):
+    """
+    목차(섹션 색인)가 있는 긴 글을 목차와 앞쪽 섹션만 먼저 표시
+    
+    나머지 섹션은 "다음 섹션 보기" 버튼이나 목차 링크(upto 파라미터)로 요청할 때
+    저장된 HTML/마크다운을 섹션 경계에서 잘라 추가로 표시합니다.
+    
+    Returns:
+        bool: 표시한 내용이 있으면 True
+    """
+    toc = post["toc"]
+    slug = post["slug"]
+    state_key = f"sections_shown_{slug}"
+    
+    shown = st.session_state.get(state_key, INITIAL_SECTIONS)
+    upto = st.query_params.get("upto", "")
+    if upto.isdigit():
+        shown = max(shown, int(upto) + 1)
+    shown = min(shown, len(toc))
+    st.session_state[state_key] = shown
+    
+    # 목차 (링크를 누르면 해당 섹션까지 표시한 뒤 앵커로 이동)
+    entries = [
+        f"{'    ' * (section['level'] - 1)}- [{section['title'] or '(제목 없음)'}](?post={quote(slug)}&upto={index}#{section['id']})"
+        for index, section in enumerate(toc) if section["id"]
+    ]
+    if entries:
+        with st.expander("📑 목차"):
+            st.markdown("\n".join(entries))
+    
+    last = toc[shown - 1]
+    if post.get("html") and "html_end" in last:
+        st.html(post["html"][:last["html_end"]])
+    else:
+        st.markdown(post["content"][:last["end"]], unsafe_allow_html=False)
+    
+    if shown < len(toc):
+        if st.button(f"다음 섹션 보기 ({shown}/{len(toc)})", key=f"more_sections_{slug}"):
+            st.session_state[state_key] = shown + SECTIONS_PER_LOAD
+            st.rerun()
+    return True
 
 
 def format_date(date_str):
@@ -34,7 +178,7 @@ def show_blog_post(slug):
         st.query_params.clear()
         st.rerun()
     
-    # 글 로드
+    # 글 로드 (본문은 필요하면 아래에서 섹션 단위로 스트리밍)
     with st.spinner("블로그 글을 불러오는 중..."):
         post = load_blog_post(slug)
     
@@ -67,10 +211,21 @@ def show_blog_post(slug):
     
     st.divider()
     
-    # 글 내용
-    if post.get("content"):
+    # 글 내용 (동기화 때 만든 HTML이 있으면 마크다운 해석 없이 그대로 표시)
+    if len(post.get("toc") or []) > INITIAL_SECTIONS and "content" in post:
+        has_content = show_post_sections(post)
+    elif post.get("html"):
+        st.html(post["html"])
+        has_content = True
+    elif "content" not in post:
+        has_content = stream_post_content(post)
+    elif post["content"].strip():
         st.markdown(post["content"], unsafe_allow_html=False)
+        has_content = True
     else:
+        has_content = False
+    
+    if not has_content:
         st.info("이 글은 아직 내용이 없습니다.")
     
     st.divider()
@@ -83,8 +238,13 @@ def show_blog_post(slug):
     st.subheader("더 읽어보기")
     
     # 다른 글들 간단히 표시
-    client = NotionClient()
-    other_posts = client.fetch_published_posts()
+    # 현재 글을 제외해도 3개가 남도록 4개만 조회
+    try:
+        client = get_client()
+        other_posts = client.fetch_recent_posts(4)
+    except Exception as e:
+        print(f"관련 글 조회 오류: {str(e)}")
+        other_posts = []
     
     # 현재 글 제외
     other_posts = [p for p in other_posts if p["slug"] != slug]
@@ -0,0 +1,409 @@
+"""
+요청 스케줄러 모듈
+Notion API 및 외부 HTTP 요청에 대한 속도 제한, 재시도, 데드라인을 공통으로 처리
+"""
+import time
+import re
+import random
+import asyncio
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from config.settings import settings
+
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 서버가 요청을 처리하지 않은 것이 확실해 멱등하지 않은 요청(POST 등)도 재시도할 수 있는 상태 코드와 예외
+UNPROCESSED_STATUS = {429}
+UNSENT_ERRORS = ("ConnectTimeout",)
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 데드라인 안에 처리하지 못한 경우"""
+
+
+class RequestScheduler:
+    """
+    토큰 버킷 기반 요청 스케줄러
+
+    스레드와 asyncio 태스크가 하나의 인스턴스를 공유할 수 있도록 토큰은 락 안에서
+    예약만 하고, 대기는 락 밖에서 수행합니다. 429 응답의 `Retry-After`는 버킷 전체에
+    적용되어 다른 요청들도 함께 대기합니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = None
+    ):
+        """
+        스케줄러 초기화
+
+        Args:
+            rate (float): 초당 허용 요청 수
+            burst (Optional[int]): 순간적으로 허용할 최대 요청 수 (기본값: rate)
+            max_retries (Optional[int]): 최대 재시도 횟수
+            base_delay (float): 지수 백오프 기본 대기 시간(초)
+            max_delay (float): 백오프 최대 대기 시간(초)
+            deadline (Optional[float]): 호출당 기본 데드라인(초)
+        """
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, int(rate)))
+        self.max_retries = settings.REQUEST_MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline or settings.REQUEST_DEADLINE
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._calls: Counter = Counter()
+        self._statuses: Counter = Counter()
+        self._retries = 0
+        self._waited = 0.0
+
+    # ------------------------------------------------------------------
+    # 토큰 버킷
+    # ------------------------------------------------------------------
+
+    def _reserve(self, deadline: float) -> float:
+        """
+        토큰 하나를 예약하고 대기해야 할 시간을 반환
+
+        Args:
+            deadline (float): 절대 데드라인 (time.monotonic 기준)
+
+        Returns:
+            float: 요청 전에 대기해야 할 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            wait = max(wait, self._paused_until - now)
+
+            if now + wait > deadline:
+                raise DeadlineExceeded("요청 데드라인 안에 속도 제한 토큰을 얻지 못했습니다.")
+
+            self._tokens -= 1
+            return wait
+
+    def acquire(self, deadline: Optional[float] = None):
+        """토큰을 얻을 때까지 대기 (스레드용)"""
+        wait = self._reserve(deadline or time.monotonic() + self.deadline)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, deadline: Optional[float] = None):
+        """토큰을 얻을 때까지 대기 (asyncio용)"""
+        wait = self._reserve(deadline or time.monotonic() + self.deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """모든 요청을 지정한 시간 동안 중지 (Retry-After 반영)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def endpoint_name(func: Callable) -> str:
+        """
+        호출 함수의 엔드포인트 이름 (예: client.blocks.children.list → "blocks.children.list")
+
+        Args:
+            func (Callable): notion-client 엔드포인트 메서드 등 호출할 함수
+
+        Returns:
+            str: 엔드포인트 이름 (엔드포인트 객체가 아니면 함수 이름)
+        """
+        owner = type(getattr(func, "__self__", None)).__name__
+        name = getattr(func, "__name__", "call")
+        if owner.endswith("Endpoint") and owner != "Endpoint":
+            words = re.findall(r"[A-Z][a-z0-9]*", owner[:-len("Endpoint")])
+            return ".".join(word.lower() for word in words + [name])
+        return name
+
+    def _record(self, endpoint: str, status: Optional[int] = None):
+        """요청 한 번(재시도 포함)을 엔드포인트별로 집계"""
+        with self._lock:
+            self._calls[endpoint] += 1
+            if status is not None:
+                self._statuses[status] += 1
+
+    def _record_retry(self, delay: float):
+        with self._lock:
+            self._retries += 1
+            self._waited += delay
+
+    def stats(self) -> Dict:
+        """
+        누적 요청 통계
+
+        Returns:
+            Dict: {"calls": 엔드포인트별 요청 수, "total", "rate_limited"(429 응답 수),
+                "retries", "retry_wait"(재시도 대기 시간 합계, 초), "statuses"(재시도 대상 상태 코드별 수)}
+        """
+        with self._lock:
+            return {
+                "calls": dict(sorted(self._calls.items())),
+                "total": sum(self._calls.values()),
+                "rate_limited": self._statuses.get(429, 0),
+                "retries": self._retries,
+                "retry_wait": round(self._waited, 3),
+                "statuses": {str(status): count for status, count in sorted(self._statuses.items())}
+            }
+
+    def reset_stats(self):
+        """누적 요청 통계 초기화"""
+        with self._lock:
+            self._calls.clear()
+            self._statuses.clear()
+            self._retries = 0
+            self._waited = 0.0
+
+    # ------------------------------------------------------------------
+    # 재시도 판단
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간으로 변환"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _classify_error(self, error: Exception) -> Optional[Dict]:
+        """
+        예외가 재시도 대상인지 판단
+
+        notion-client의 HTTPResponseError/RequestTimeoutError와 requests의
+        연결 오류를 속성 기반으로 판별합니다.
+
+        Returns:
+            Optional[Dict]: 재시도 대상이면 {"status", "retry_after"}, 아니면 None
+        """
+        if isinstance(error, DeadlineExceeded):
+            return None
+
+        status = getattr(error, "status", None)
+        if status is None and getattr(error, "response", None) is not None:
+            status = getattr(error.response, "status_code", None)
+
+        if status in RETRYABLE_STATUS:
+            headers = getattr(error, "headers", None)
+            if headers is None and getattr(error, "response", None) is not None:
+                headers = error.response.headers
+            retry_after = self._parse_retry_after((headers or {}).get("Retry-After"))
+            return {"status": status, "retry_after": retry_after}
+
+        if status is None and (
+            getattr(error, "code", None) == "notionhq_client_request_timeout"
+            or isinstance(error, (ConnectionError, TimeoutError))
+            or type(error).__name__ in ("ConnectionError", "Timeout", "ReadTimeout",
+                                        "ConnectTimeout", "ConnectError", "ReadError")
+        ):
+            return {"status": None, "retry_after": None}
+
+        return None
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """재시도 전 대기 시간 계산 (Retry-After 우선, 없으면 full jitter 지수 백오프)"""
+        if retry_after is not None:
+            self.pause(retry_after)
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _next_delay(self, attempt: int, failure: Dict, deadline: float, error: Exception) -> float:
+        """재시도 가능 여부를 확인하고 대기 시간을 반환 (불가능하면 예외 발생)"""
+        if attempt >= self.max_retries:
+            raise error
+
+        delay = self._backoff(attempt, failure["retry_after"])
+        if time.monotonic() + delay > deadline:
+            raise DeadlineExceeded(f"요청 데드라인 초과 (마지막 오류: {error})") from error
+
+        print(f"요청 재시도 {attempt + 1}/{self.max_retries} ({failure['status'] or '연결 오류'}), {delay:.1f}초 후")
+        self._record_retry(delay)
+        return delay
+
+    # ------------------------------------------------------------------
+    # 호출 래퍼
+    # ------------------------------------------------------------------
+
+    def call(self, func: Callable, *args, deadline: Optional[float] = None, **kwargs) -> Any:
+        """
+        속도 제한과 재시도를 적용해 함수 호출
+
+        Args:
+            func (Callable): 호출할 함수 (예: client.databases.query)
+            deadline (Optional[float]): 이 호출의 데드라인(초)
+
+        Returns:
+            Any: 함수 반환값
+        """
+        deadline_at = time.monotonic() + (deadline or self.deadline)
+        endpoint = self.endpoint_name(func)
+        attempt = 0
+
+        while True:
+            self.acquire(deadline_at)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                failure = self._classify_error(e)
+                self._record(endpoint, failure and failure["status"])
+                if failure is None:
+                    raise
+                time.sleep(self._next_delay(attempt, failure, deadline_at, e))
+                attempt += 1
+                continue
+            self._record(endpoint)
+            return result
+
+    async def acall(self, func: Callable, *args, deadline: Optional[float] = None, **kwargs) -> Any:
+        """
+        속도 제한과 재시도를 적용해 코루틴 함수 호출
+
+        Args:
+            func (Callable): 호출할 코루틴 함수 (예: async_client.databases.query)
+            deadline (Optional[float]): 이 호출의 데드라인(초)
+
+        Returns:
+            Any: 코루틴 반환값
+        """
+        deadline_at = time.monotonic() + (deadline or self.deadline)
+        endpoint = self.endpoint_name(func)
+        attempt = 0
+
+        while True:
+            await self.acquire_async(deadline_at)
+            try:
+                result = await asyncio.wait_for(
+                    func(*args, **kwargs),
+                    timeout=max(0.0, deadline_at - time.monotonic())
+                )
+            except asyncio.TimeoutError as e:
+                self._record(endpoint)
+                raise DeadlineExceeded("요청 데드라인 초과") from e
+            except Exception as e:
+                failure = self._classify_error(e)
+                self._record(endpoint, failure and failure["status"])
+                if failure is None:
+                    raise
+                await asyncio.sleep(self._next_delay(attempt, failure, deadline_at, e))
+                attempt += 1
+                continue
+            self._record(endpoint)
+            return result
+
+    def request(
+        self,
+        send: Callable,
+        url: str,
+        deadline: Optional[float] = None,
+        idempotent: bool = True,
+        **kwargs
+    ):
+        """
+        HTTP 요청을 속도 제한, 재시도, 타임아웃과 함께 전송
+
+        429/5xx 응답은 재시도하며, 재시도를 모두 소진하면 마지막 응답을 반환합니다.
+        멱등하지 않은 요청은 5xx 응답이나 전송 중 오류 뒤에도 서버가 이미 처리했을 수 있으므로
+        (예: GitHub 이슈가 중복 생성됨) 429 응답과 연결 시간 초과만 재시도합니다.
+
+        Args:
+            send (Callable): requests.get, session.post 등 요청 함수
+            url (str): 요청 URL
+            deadline (Optional[float]): 이 호출의 데드라인(초)
+            idempotent (bool): 같은 요청을 여러 번 보내도 결과가 같은지 여부 (POST 등은 False로 전달)
+
+        Returns:
+            requests.Response: 응답 객체
+        """
+        deadline_at = time.monotonic() + (deadline or self.deadline)
+        request_timeout = kwargs.pop("timeout", settings.HTTP_TIMEOUT)
+        endpoint = urlparse(url).netloc or url
+        retryable_status = RETRYABLE_STATUS if idempotent else UNPROCESSED_STATUS
+        attempt = 0
+
+        while True:
+            self.acquire(deadline_at)
+            timeout = min(request_timeout, max(0.1, deadline_at - time.monotonic()))
+            try:
+                response = send(url, timeout=timeout, **kwargs)
+            except Exception as e:
+                failure = self._classify_error(e)
+                self._record(endpoint, failure and failure["status"])
+                if failure is None or not (
+                    idempotent or failure["status"] in UNPROCESSED_STATUS or type(e).__name__ in UNSENT_ERRORS
+                ):
+                    raise
+                time.sleep(self._next_delay(attempt, failure, deadline_at, e))
+                attempt += 1
+                continue
+
+            status = getattr(response, "status_code", None)
+            self._record(endpoint, status if status in RETRYABLE_STATUS else None)
+            if status not in retryable_status or attempt >= self.max_retries:
+                return response
+
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            delay = self._backoff(attempt, retry_after)
+            if time.monotonic() + delay > deadline_at:
+                return response
+
+            # 스트리밍 응답은 닫아야 연결이 풀로 돌아감
+            close = getattr(response, "close", None)
+            if close:
+                close()
+
+            print(f"요청 재시도 {attempt + 1}/{self.max_retries} ({status}), {delay:.1f}초 후")
+            self._record_retry(delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+_schedulers: Dict[str, RequestScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(name: str = "notion") -> RequestScheduler:
+    """
+    프로세스 전역에서 공유하는 스케줄러 조회
+
+    Args:
+        name (str): "notion"(Notion API) 또는 "http"(이미지 등 일반 HTTP)
+
+    Returns:
+        RequestScheduler: 공유 스케줄러
+    """
+    with _schedulers_lock:
+        if name not in _schedulers:
+            rate = settings.NOTION_RATE_LIMIT if name == "notion" else settings.HTTP_RATE_LIMIT
+            _schedulers[name] = RequestScheduler(rate=rate)
+        return _schedulers[name]
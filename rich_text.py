@@ -0,0 +1,223 @@
+"""
+rich text 컴파일러 모듈
+Notion rich text 런(run) 목록을 마크다운 인라인 텍스트로 변환하는 기능 제공
+"""
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# Notion 색상 → Streamlit 마크다운 색상 (`:blue[텍스트]`)
+STREAMLIT_COLORS = {
+    "gray": "gray",
+    "brown": "orange",
+    "orange": "orange",
+    "yellow": "orange",
+    "green": "green",
+    "blue": "blue",
+    "purple": "violet",
+    "pink": "red",
+    "red": "red",
+}
+
+# Notion API가 서식 없는 런에 보내는 주석
+PLAIN_ANNOTATIONS = {"bold": False, "italic": False, "strikethrough": False, "underline": False, "code": False, "color": "default"}
+ANNOTATION_KEYS = tuple(PLAIN_ANNOTATIONS)
+PLAIN_VALUES = tuple(PLAIN_ANNOTATIONS.values())
+
+# 서식 표시: (여는 기호, 닫는 기호, 코드 여부)
+Markers = Tuple[str, str, bool]
+
+
+def _is_plain(annotations: Dict) -> bool:
+    """서식과 색상이 없는 주석인지 확인"""
+    return all(value == "default" if name == "color" else not value for name, value in annotations.items())
+
+
+def _annotation_values(annotations: Optional[Dict]) -> Tuple:
+    """캐시 키에 넣을 주석 값 (ANNOTATION_KEYS 순서, 빠진 주석은 기본값)"""
+    if not annotations:
+        return PLAIN_VALUES
+    return tuple(annotations.get(key, PLAIN_ANNOTATIONS[key]) for key in ANNOTATION_KEYS)
+
+
+@lru_cache(maxsize=None)
+def annotation_markers(values: Tuple) -> Markers:
+    """
+    주석 값 튜플을 여는/닫는 마크다운 기호로 변환
+
+    주석 조합은 많지 않으므로 조합마다 한 번만 계산합니다.
+    감싸는 순서는 안쪽부터 코드, 취소선, 기울임, 굵게, 색상입니다.
+    마크다운에는 밑줄 문법이 없으므로 underline은 런 병합 기준으로만 사용됩니다.
+
+    Args:
+        values (Tuple): `_annotation_values()` 결과
+
+    Returns:
+        Markers: (여는 기호, 닫는 기호, 코드 여부)
+    """
+    bold, italic, strikethrough, _underline, code, color = values
+    opening, closing = "", ""
+    if strikethrough:
+        opening, closing = "~~" + opening, closing + "~~"
+    if italic:
+        opening, closing = "*" + opening, closing + "*"
+    if bold:
+        opening, closing = "**" + opening, closing + "**"
+
+    color = color or "default"
+    if color.endswith("_background"):
+        name = STREAMLIT_COLORS.get(color[:-len("_background")])
+        if name:
+            opening, closing = f":{name}-background[" + opening, closing + "]"
+    elif color in STREAMLIT_COLORS:
+        opening, closing = f":{STREAMLIT_COLORS[color]}[" + opening, closing + "]"
+
+    return opening, closing, bool(code)
+
+
+def _wrap_code(text: str) -> str:
+    """코드 스팬 (텍스트에 백틱이 있으면 더 긴 구분자 사용)"""
+    if "`" not in text:
+        return f"`{text}`"
+    padding = " " if text.startswith("`") or text.endswith("`") else ""
+    return f"``{padding}{text}{padding}``"
+
+
+def _render_run(text: str, href: Optional[str], run_type: Optional[str], values: Tuple) -> str:
+    """
+    병합된 런 하나에 서식 적용
+
+    앞뒤 공백은 강조 기호 바깥으로 옮깁니다 (`** 강조**`는 마크다운에서 강조되지 않음).
+
+    Args:
+        text (str): 합친 텍스트
+        href (Optional[str]): 링크
+        run_type (Optional[str]): 런 타입 (text, mention, equation)
+        values (Tuple): 주석 값
+    """
+    if run_type == "equation":
+        text = f"${text}$"
+    elif values != PLAIN_VALUES:
+        opening, closing, code = annotation_markers(values)
+        core = text.strip()
+        if core and (opening or code):
+            if core != text:
+                start = text.index(core[0])
+                leading, trailing = text[:start], text[start + len(core):]
+            else:
+                leading = trailing = ""
+            if code:
+                core = _wrap_code(core)
+            text = f"{leading}{opening}{core}{closing}{trailing}"
+
+    return f"[{text}]({href})" if href else text
+
+
+class RichTextCompiler:
+    """
+    Notion rich text 컴파일러
+
+    - 서식이 없는 런만 있으면 텍스트를 바로 이어 붙이는 빠른 경로를 사용합니다.
+    - 서식, 색상, 링크가 같은 인접 런은 하나로 합쳐 `**a****b**` 같은 깨진 강조를 만들지 않습니다.
+    - 결과는 런 목록의 내용(텍스트, 링크, 타입, 주석 값의 튜플)을 키로 캐시하므로
+      여러 글에 반복되는 캡션/콜아웃은 한 번만 변환합니다.
+      주석 값은 객체의 키 순서와 관계없이 이름으로 꺼내 ANNOTATION_KEYS 순서
+      (bold, italic, strikethrough, underline, code, color)로 키에 들어가며,
+      빠진 주석은 기본값(색상은 "default")으로 채웁니다.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        """
+        Args:
+            cache_size (int): 변환 결과 캐시 크기 (0이면 캐시하지 않음)
+        """
+        self.cache_size = cache_size
+        self._cache: Dict[Tuple, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, rich_text: List[Dict]) -> str:
+        return self.compile(rich_text)
+
+    def compile(self, rich_text: List[Dict]) -> str:
+        """
+        rich text 런 목록을 마크다운으로 변환
+
+        Args:
+            rich_text (List[Dict]): Notion rich text 객체 리스트
+
+        Returns:
+            str: 마크다운 인라인 텍스트
+        """
+        if not rich_text:
+            return ""
+
+        # 빠른 경로: 서식, 색상, 링크가 없는 런만 있으면 텍스트만 이어 붙임
+        texts = []
+        for run in rich_text:
+            annotations = run.get("annotations")
+            if (annotations and annotations != PLAIN_ANNOTATIONS and not _is_plain(annotations)) \
+                    or run.get("href") or run.get("type") == "equation":
+                break
+            texts.append(run.get("plain_text", ""))
+        else:
+            return "".join(texts)
+
+        runs = []
+        for run in rich_text:
+            annotations = run.get("annotations")
+            values = _annotation_values(annotations)
+            runs.append((run.get("plain_text", ""), run.get("href"), run.get("type"), values))
+        key = tuple(runs)
+
+        if not self.cache_size:
+            return self._compile_runs(key)
+
+        markdown = self._cache.get(key)
+        if markdown is not None:
+            self.hits += 1
+            return markdown
+
+        markdown = self._compile_runs(key)
+        with self._lock:
+            self.misses += 1
+            if len(self._cache) >= self.cache_size:
+                # 가장 먼저 저장된 결과부터 제거
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = markdown
+        return markdown
+
+    def cache_info(self) -> Dict[str, int]:
+        """캐시 적중 통계"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+    @staticmethod
+    def _compile_runs(runs: Tuple[Tuple, ...]) -> str:
+        """
+        같은 서식(주석, 링크, 런 타입)의 인접 런을 묶어 변환
+
+        Args:
+            runs (Tuple): (텍스트, 링크, 런 타입, 주석 값) 튜플들
+        """
+        if len(runs) == 1:
+            return _render_run(*runs[0])
+
+        parts = []
+        texts: List[str] = []
+        last_href = last_type = last_values = None
+        for text, href, run_type, values in runs:
+            if texts and values == last_values and href == last_href and run_type == last_type != "equation":
+                texts.append(text)
+                continue
+            if texts:
+                parts.append(_render_run("".join(texts), last_href, last_type, last_values))
+            texts = [text]
+            last_href, last_type, last_values = href, run_type, values
+        parts.append(_render_run("".join(texts), last_href, last_type, last_values))
+        return "".join(parts)
+
+
+# 프로세스 전역에서 공유하는 컴파일러 (글 사이 캐시 공유)
+compile_rich_text = RichTextCompiler()
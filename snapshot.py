@@ -0,0 +1,227 @@
+"""
+콘텐츠 스냅샷 모듈
+sync_notion.py가 렌더링한 글을 파일 스냅샷으로 기록하고, 앱이 Notion API 없이 읽는 기능 제공
+"""
+import os
+import json
+import threading
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Optional, Iterator, Sequence
+
+from config.settings import settings
+
+
+# 스냅샷 파일 형식 버전 (호환되지 않는 변경 시 증가)
+SNAPSHOT_FORMAT_VERSION = 1
+
+INDEX_FILE = "index.json"
+POSTS_DIR = "posts"
+
+# 목록(index.json)에 포함하지 않는 글 필드
+HEAVY_FIELDS = ("content", "html", "toc", "images", "fetch_stats")
+
+
+def _write_json_atomic(path: Path, data: Dict):
+    """임시 파일에 쓴 뒤 교체해 읽는 쪽이 쓰다 만 파일을 보지 않도록 함"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class SnapshotWriter:
+    """콘텐츠 스냅샷 기록"""
+
+    def __init__(self, snapshot_dir: Optional[str] = None):
+        """
+        Args:
+            snapshot_dir (Optional[str]): 스냅샷 디렉토리 (기본값: settings.SNAPSHOT_DIR)
+        """
+        self.snapshot_dir = Path(snapshot_dir or settings.SNAPSHOT_DIR)
+
+    def post_path(self, page_id: str) -> Path:
+        """글 파일 경로"""
+        return self.snapshot_dir / POSTS_DIR / f"{page_id}.json"
+
+    def write_post(self, post: Dict) -> Path:
+        """
+        렌더링된 글 하나를 파일로 기록
+
+        Args:
+            post (Dict): content가 포함된 글
+
+        Returns:
+            Path: 기록된 파일 경로
+        """
+        path = self.post_path(post["id"])
+        data = {key: value for key, value in post.items() if key != "fetch_stats"}
+        data["format_version"] = SNAPSHOT_FORMAT_VERSION
+        _write_json_atomic(path, data)
+        return path
+
+    def remove_post(self, page_id: str) -> bool:
+        """
+        글 파일 삭제
+
+        Args:
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            bool: 삭제한 파일이 있으면 True
+        """
+        path = self.post_path(page_id)
+        if path.exists():
+            path.unlink()
+            return True
+        return False
+
+    def write_index(self, posts: List[Dict]) -> Path:
+        """
+        글 목록 인덱스 기록 (발행일 역순)
+
+        Args:
+            posts (List[Dict]): 전체 발행 글 목록 (본문은 무시됨)
+
+        Returns:
+            Path: 기록된 인덱스 경로
+        """
+        entries = [
+            {key: value for key, value in post.items() if key not in HEAVY_FIELDS}
+            for post in posts
+        ]
+        entries.sort(key=lambda post: post.get("published_date") or "", reverse=True)
+
+        path = self.snapshot_dir / INDEX_FILE
+        _write_json_atomic(path, {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "posts": entries
+        })
+        return path
+
+
+class SnapshotReader:
+    """
+    콘텐츠 스냅샷 읽기
+
+    NotionClient와 같은 조회 메서드를 제공하므로 페이지 코드에서 그대로 대체할 수 있습니다.
+    인덱스는 파일 수정 시각이 바뀔 때만 다시 읽습니다.
+    """
+
+    def __init__(self, snapshot_dir: Optional[str] = None):
+        """
+        Args:
+            snapshot_dir (Optional[str]): 스냅샷 디렉토리 (기본값: settings.SNAPSHOT_DIR)
+        """
+        self.snapshot_dir = Path(snapshot_dir or settings.SNAPSHOT_DIR)
+        self._lock = threading.Lock()
+        self._index: Optional[Dict] = None
+        self._index_mtime: Optional[tuple] = None
+
+    @classmethod
+    def exists(cls, snapshot_dir: Optional[str] = None) -> bool:
+        """스냅샷 인덱스가 있는지 확인"""
+        return (Path(snapshot_dir or settings.SNAPSHOT_DIR) / INDEX_FILE).exists()
+
+    def _load_index(self) -> Dict:
+        """인덱스 로드 (변경되었을 때만 다시 읽음)"""
+        path = self.snapshot_dir / INDEX_FILE
+        stat = path.stat()
+        mtime = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if self._index is None or mtime != self._index_mtime:
+                with open(path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if index.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                    raise ValueError(
+                        f"지원하지 않는 스냅샷 형식입니다: {index.get('format_version')}"
+                    )
+                index["by_slug"] = {post["slug"]: post["id"] for post in index["posts"]}
+                self._index, self._index_mtime = index, mtime
+            return self._index
+
+    @property
+    def generated_at(self) -> Optional[str]:
+        """스냅샷 생성 시각"""
+        return self._load_index().get("generated_at")
+
+    def iter_published_posts(
+        self,
+        page_size: int = 100,
+        properties: Optional[Sequence[str]] = None,
+        edited_after: Optional[datetime] = None
+    ) -> Iterator[Dict]:
+        """
+        발행된 글을 발행일 역순으로 반환 (NotionClient 호환)
+
+        Args:
+            page_size (int): 호환용 (무시됨)
+            properties (Optional[Sequence[str]]): 호환용 (인덱스에는 목록 속성만 있음)
+            edited_after (Optional[datetime]): 이 시각 이후(포함)에 수정된 글만 반환
+
+        Yields:
+            Dict: 발행된 글
+        """
+        for post in self._load_index()["posts"]:
+            if edited_after and post.get("last_edited"):
+                edited = datetime.fromisoformat(post["last_edited"].replace('Z', '+00:00'))
+                if edited < edited_after:
+                    continue
+            yield dict(post)
+
+    def fetch_published_posts(self, properties: Optional[Sequence[str]] = None) -> List[Dict]:
+        """발행된 글 목록 조회 (NotionClient 호환)"""
+        try:
+            return list(self.iter_published_posts(properties=properties))
+        except Exception as e:
+            print(f"스냅샷 글 목록 조회 오류: {str(e)}")
+            return []
+
+    def fetch_recent_posts(self, limit: int, properties: Optional[Sequence[str]] = None) -> List[Dict]:
+        """최신 글 limit개 조회 (NotionClient 호환)"""
+        return list(islice(self.iter_published_posts(), limit))
+
+    def find_post_by_slug(self, slug: str) -> Optional[Dict]:
+        """슬러그로 글 조회 (NotionClient 호환, 스냅샷의 글은 항상 content 포함)"""
+        return self.get_post_by_slug(slug)
+
+    def iter_posts(self) -> Iterator[Dict]:
+        """
+        스냅샷의 모든 글 파일을 본문과 함께 반환 (콘텐츠 저장소 복원용)
+
+        Yields:
+            Dict: 렌더링된 글 (format_version 제외)
+        """
+        for path in sorted((self.snapshot_dir / POSTS_DIR).glob("*.json")):
+            with open(path, 'r', encoding='utf-8') as f:
+                post = json.load(f)
+            if post.pop("format_version", None) != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {path}")
+            yield post
+
+    def get_post_by_slug(self, slug: str) -> Optional[Dict]:
+        """
+        슬러그로 렌더링된 글 조회 (NotionClient 호환)
+
+        Args:
+            slug (str): 글의 슬러그
+
+        Returns:
+            Optional[Dict]: 글 정보 (없으면 None)
+        """
+        try:
+            page_id = self._load_index()["by_slug"].get(slug)
+            if not page_id:
+                return None
+
+            path = self.snapshot_dir / POSTS_DIR / f"{page_id}.json"
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        except Exception as e:
+            print(f"스냅샷 글 조회 오류: {str(e)}")
+            return None
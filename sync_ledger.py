@@ -0,0 +1,266 @@
+"""
+동기화 원장 모듈
+페이지별 마지막 수정 시각, 렌더링 결과 해시, 이미지 해시, 출력 파일을 기록해
+다음 동기화에서 바뀐 글과 발행 취소/삭제된 글을 정확히 찾는 기능 제공
+
+원장은 콘텐츠 저장소와 함께 커밋되므로 새로 체크아웃한 CI 러너에서도 이어서 사용됩니다.
+변경이 없으면 파일을 다시 쓰지 않아 변경 없는 동기화는 커밋할 내용이 생기지 않습니다.
+"""
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.settings import settings
+from image_assets import image_source_key, unresolved_image_keys
+
+
+# 원장 파일 형식 버전 (호환되지 않는 변경 시 증가)
+LEDGER_FORMAT_VERSION = 1
+
+# 렌더링 결과 해시에 포함하는 글 속성 (last_edited는 본문이 같아도 바뀌므로 제외)
+HASHED_FIELDS = ("title", "slug", "status", "published_date", "tags", "meta_description", "content", "images")
+
+
+def post_content_hash(post: Dict) -> str:
+    """
+    렌더링된 글의 내용 해시 (속성, 마크다운, 이미지 목록)
+
+    이미지 원본 URL은 조회할 때마다 서명이 바뀌므로 서명을 뺀 원본 키로 비교합니다.
+
+    Args:
+        post (Dict): content와 images가 포함된 글
+
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    data = {field: post.get(field) for field in HASHED_FIELDS}
+    if data["images"]:
+        data["images"] = [
+            {**image, "source_url": image_source_key(image["source_url"])} if image.get("source_url") else image
+            for image in data["images"]
+        ]
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def post_asset_hashes(post: Dict) -> List[str]:
+    """
+    글이 사용하는 이미지의 내용 해시 목록 (저장 파일명에서 추출)
+
+    Args:
+        post (Dict): images가 포함된 글
+
+    Returns:
+        List[str]: 정렬된 해시 목록
+    """
+    return sorted({Path(image["path"]).stem for image in post.get("images", []) if image.get("path")})
+
+
+class SyncLedger:
+    """
+    페이지별 동기화 원장 (JSON 파일)
+
+    사용 예:
+        ledger = SyncLedger()
+        changed, unchanged, removed = ledger.diff(published_posts, stored_ids)
+        ledger.record(rendered_post, [snapshot_path])
+        ledger.save()
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path (Optional[str]): 원장 파일 경로 (기본값: settings.SYNC_LEDGER_PATH, 없으면 빈 원장으로 시작)
+        """
+        self.path = Path(path or settings.SYNC_LEDGER_PATH)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.pages: Dict[str, Dict] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("format_version") == LEDGER_FORMAT_VERSION:
+                    self.pages = data.get("pages", {})
+            except (OSError, ValueError) as e:
+                print(f"동기화 원장 읽기 오류: {e}")
+
+    def get(self, page_id: str) -> Optional[Dict]:
+        """
+        페이지의 원장 항목 조회
+
+        Args:
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            Optional[Dict]: {"slug", "last_edited", "content_hash", "asset_hashes", "unresolved_images",
+                "outputs", "synced_at"}
+        """
+        with self._lock:
+            return self.pages.get(page_id)
+
+    def is_unchanged(self, post: Dict) -> bool:
+        """
+        글의 수정 시각이 원장과 같은지 확인
+
+        Args:
+            post (Dict): id, last_edited가 포함된 글
+
+        Returns:
+            bool: 원장에 있고 수정 시각이 같으면 True
+        """
+        entry = self.get(post["id"])
+        return bool(entry and entry["last_edited"] == post["last_edited"])
+
+    def unresolved_pages(self) -> List[str]:
+        """
+        내려받지 못한 Notion 이미지가 남아 수정되지 않았어도 다시 렌더링할 페이지
+
+        Returns:
+            List[str]: 정렬된 페이지 ID
+        """
+        with self._lock:
+            return sorted(page_id for page_id, entry in self.pages.items() if entry.get("unresolved_images"))
+
+    def removed_pages(self, published_ids: Iterable[str], stored_ids: Iterable[str] = ()) -> List[str]:
+        """
+        발행된 글 목록에 없는 페이지 (발행 취소되거나 삭제되어 출력을 제거할 페이지)
+
+        Args:
+            published_ids (Iterable[str]): 현재 발행된 전체 글의 페이지 ID
+            stored_ids (Iterable[str]): 콘텐츠 저장소에 있는 페이지 ID (원장 도입 전에 저장된 글 포함)
+
+        Returns:
+            List[str]: 정렬된 페이지 ID
+        """
+        with self._lock:
+            known = set(self.pages)
+        return sorted((known | set(stored_ids)) - set(published_ids))
+
+    def diff(
+        self,
+        posts: Iterable[Dict],
+        stored_ids: Iterable[str] = ()
+    ) -> Tuple[List[Dict], List[str], List[str]]:
+        """
+        발행된 글 목록과 원장 비교
+
+        Args:
+            posts (Iterable[Dict]): 현재 발행된 전체 글 (id, last_edited 포함)
+            stored_ids (Iterable[str]): 콘텐츠 저장소에 있는 페이지 ID (원장 도입 전에 저장된 글 포함)
+
+        Returns:
+            Tuple[List[Dict], List[str], List[str]]: (새로 생기거나 수정된 글, 바뀌지 않은 페이지 ID,
+                발행 취소되거나 삭제되어 출력을 제거할 페이지 ID)
+        """
+        changed: List[Dict] = []
+        unchanged: List[str] = []
+        published: List[str] = []
+
+        for post in posts:
+            published.append(post["id"])
+            if self.is_unchanged(post):
+                unchanged.append(post["id"])
+            else:
+                changed.append(post)
+
+        return changed, unchanged, self.removed_pages(published, stored_ids)
+
+    def record(self, post: Dict, outputs: Optional[List[str]] = None, content_hash: Optional[str] = None) -> bool:
+        """
+        렌더링한 글을 원장에 기록
+
+        Args:
+            post (Dict): content와 images가 포함된 글
+            outputs (Optional[List[str]]): 이 글로 만든 파일 경로 (없으면 이전 항목의 값 유지)
+            content_hash (Optional[str]): 미리 계산한 post_content_hash 결과
+
+        Returns:
+            bool: 렌더링 결과가 이전 기록과 다르면 (새 글 포함) True
+        """
+        content_hash = content_hash or post_content_hash(post)
+        with self._lock:
+            previous = self.pages.get(post["id"])
+            changed = previous is None or previous["content_hash"] != content_hash
+            if not changed and previous["last_edited"] == post["last_edited"]:
+                return False
+            self.pages[post["id"]] = {
+                "slug": post.get("slug", ""),
+                "last_edited": post["last_edited"],
+                "content_hash": content_hash,
+                "asset_hashes": post_asset_hashes(post),
+                "unresolved_images": unresolved_image_keys(post.get("content", "")),
+                "outputs": outputs if outputs is not None else (previous or {}).get("outputs", []),
+                "synced_at": datetime.now(timezone.utc).isoformat() if changed else previous["synced_at"]
+            }
+            self._dirty = True
+        return changed
+
+    def is_current(self, page_id: str, content_hash: str) -> bool:
+        """
+        렌더링 결과가 원장과 같고 출력 파일이 모두 있는지 확인
+
+        Args:
+            page_id (str): Notion 페이지 ID
+            content_hash (str): post_content_hash 결과
+
+        Returns:
+            bool: 출력을 다시 쓸 필요가 없으면 True
+        """
+        entry = self.get(page_id)
+        return bool(
+            entry
+            and entry["content_hash"] == content_hash
+            and all(os.path.exists(path) for path in entry["outputs"])
+        )
+
+    def remove(self, page_id: str) -> Optional[Dict]:
+        """
+        원장에서 페이지 제거
+
+        Args:
+            page_id (str): Notion 페이지 ID
+
+        Returns:
+            Optional[Dict]: 제거한 항목 (없으면 None)
+        """
+        with self._lock:
+            entry = self.pages.pop(page_id, None)
+            if entry is not None:
+                self._dirty = True
+        return entry
+
+    def clear(self):
+        """모든 항목 제거 (전체 동기화)"""
+        with self._lock:
+            if self.pages:
+                self.pages = {}
+                self._dirty = True
+
+    def save(self) -> bool:
+        """
+        변경된 내용이 있으면 파일에 기록 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            bool: 기록했으면 True
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = {
+                "format_version": LEDGER_FORMAT_VERSION,
+                "pages": dict(sorted(self.pages.items()))
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        return True
@@ -0,0 +1,267 @@
+"""
+동기화 지표 모듈
+단계별 소요 시간, Notion API 엔드포인트별 호출 수, 429/재시도 횟수, 이미지 다운로드량,
+초당 렌더링한 글 수를 한 번의 동기화 보고서로 모으고 JSON과 Prometheus 텍스트 파일로 기록하는 기능 제공
+
+Prometheus 텍스트 파일은 node_exporter의 textfile 수집기 디렉토리에 쓰면 그대로 수집됩니다.
+"""
+import os
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from config.settings import settings
+
+
+# Prometheus 지표 이름 접두사
+METRIC_PREFIX = "notion_sync"
+
+
+class SyncMetrics:
+    """
+    한 번의 동기화 실행에 대한 지표
+
+    사용 예:
+        metrics = SyncMetrics()
+        with metrics.phase("pipeline"):
+            pipeline.run(posts)
+        metrics.record_stages(pipeline.stats())
+        metrics.record_requests("notion", get_scheduler("notion").stats())
+        metrics.record_images(downloader.summary())
+        metrics.finish(posts_updated=3)
+        metrics.write_json(".sync_metrics.json")
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.phases: Dict[str, float] = {}
+        self.stages: Dict[str, Dict] = {}
+        self.requests: Dict[str, Dict] = {}
+        self.images: Dict = {"fetched": 0, "skipped": 0, "failed": 0, "bytes": 0}
+        self.posts: Dict = {}
+        self.success: Optional[bool] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        블록 안의 실행 시간을 단계 소요 시간에 더함
+
+        Args:
+            name (str): 단계 이름 (예: "pipeline", "gc", "git")
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(self.phases.get(name, 0.0) + time.perf_counter() - started, 3)
+
+    def record_stages(self, stages: Dict[str, Dict]):
+        """
+        파이프라인 단계별 통계 기록
+
+        Args:
+            stages (Dict[str, Dict]): SyncPipeline.stats 결과
+        """
+        self.stages = dict(stages)
+
+    def record_requests(self, name: str, stats: Dict):
+        """
+        요청 스케줄러 통계 기록
+
+        Args:
+            name (str): 스케줄러 이름 ("notion" 또는 "http")
+            stats (Dict): RequestScheduler.stats 결과
+        """
+        self.requests[name] = stats
+
+    def record_images(self, downloads: Dict):
+        """
+        이미지 다운로드 통계 기록
+
+        매니페스트에서 찾아 요청하지 않은 이미지는 skipped, 내려받은 이미지는
+        (같은 내용의 파일이 이미 있었더라도) fetched로 집계합니다.
+
+        Args:
+            downloads (Dict): ImageDownloader.summary 결과
+        """
+        self.images = {
+            "fetched": downloads["downloaded"] + downloads["existing"],
+            "skipped": downloads["cached"],
+            "failed": downloads["failed"],
+            "bytes": downloads["bytes"]
+        }
+
+    def finish(self, success: bool = True, **posts: int):
+        """
+        전체 소요 시간과 글 수 기록
+
+        Args:
+            success (bool): 동기화 성공 여부
+            **posts (int): 글 수 (예: published, updated, unchanged, removed)
+        """
+        self.elapsed = round(time.perf_counter() - self._started, 3)
+        self.success = success
+        self.posts = dict(posts)
+
+    @property
+    def posts_rendered(self) -> int:
+        """렌더링(변환 단계)을 마친 글 수"""
+        return self.stages.get("convert", {}).get("items", 0)
+
+    @property
+    def posts_per_second(self) -> float:
+        """파이프라인 실행 시간 기준 초당 렌더링한 글 수"""
+        elapsed = self.phases.get("pipeline", 0.0)
+        return round(self.posts_rendered / elapsed, 2) if elapsed > 0 else 0.0
+
+    def report(self) -> Dict:
+        """
+        JSON으로 기록할 보고서
+
+        Returns:
+            Dict: {"started_at", "elapsed", "success", "phases", "stages", "requests",
+                "images", "posts"}
+        """
+        elapsed = self.elapsed if self.elapsed is not None else round(time.perf_counter() - self._started, 3)
+        return {
+            "started_at": self.started_at.isoformat(),
+            "elapsed": elapsed,
+            "success": self.success,
+            "phases": dict(self.phases),
+            "stages": dict(self.stages),
+            "requests": dict(self.requests),
+            "images": dict(self.images),
+            "posts": {**self.posts, "rendered": self.posts_rendered, "per_second": self.posts_per_second}
+        }
+
+    def write_json(self, path: Optional[str] = None) -> Path:
+        """
+        보고서를 JSON 파일로 기록 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path (Optional[str]): 파일 경로 (기본값: settings.SYNC_METRICS_PATH)
+
+        Returns:
+            Path: 기록한 파일 경로
+        """
+        path = Path(path or settings.SYNC_METRICS_PATH)
+        _write_atomic(path, json.dumps(self.report(), ensure_ascii=False, indent=2))
+        return path
+
+    def prometheus_lines(self) -> List[str]:
+        """
+        Prometheus 텍스트 형식 지표
+
+        Returns:
+            List[str]: HELP/TYPE 주석을 포함한 줄 목록
+        """
+        report = self.report()
+        lines: List[str] = []
+
+        def metric(name: str, help_text: str, samples: List, kind: str = "gauge"):
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+                lines.append(f"{full_name}{{{label_text}}} {value}" if label_text else f"{full_name} {value}")
+
+        metric("last_run_timestamp_seconds", "Start time of the last sync run.",
+               [({}, round(self.started_at.timestamp(), 3))])
+        metric("success", "Whether the last sync run succeeded.", [({}, int(bool(report["success"])))])
+        metric("duration_seconds", "Wall time of the last sync run.", [({}, report["elapsed"])])
+        metric("phase_seconds", "Wall time per sync phase.",
+               [({"phase": name}, seconds) for name, seconds in report["phases"].items()])
+        metric("stage_seconds", "Wall time per pipeline stage.",
+               [({"stage": name}, stats["elapsed"]) for name, stats in report["stages"].items()])
+        metric("stage_items", "Items processed per pipeline stage.",
+               [({"stage": name}, stats["items"]) for name, stats in report["stages"].items()])
+        metric("requests", "Requests sent per scheduler and endpoint, including retries.",
+               [({"scheduler": name, "endpoint": endpoint}, count)
+                for name, stats in report["requests"].items()
+                for endpoint, count in stats["calls"].items()])
+        metric("rate_limited", "HTTP 429 responses per scheduler.",
+               [({"scheduler": name}, stats["rate_limited"]) for name, stats in report["requests"].items()])
+        metric("retries", "Retried requests per scheduler.",
+               [({"scheduler": name}, stats["retries"]) for name, stats in report["requests"].items()])
+        metric("images", "Images by download result.",
+               [({"result": result}, report["images"][result]) for result in ("fetched", "skipped", "failed")])
+        metric("image_bytes", "Bytes of images downloaded.", [({}, report["images"]["bytes"])])
+        metric("posts", "Posts by sync result.",
+               [({"result": result}, count) for result, count in report["posts"].items() if result != "per_second"])
+        metric("posts_per_second", "Posts rendered per second of pipeline time.",
+               [({}, report["posts"]["per_second"])])
+        return lines
+
+    def write_prometheus(self, path: Optional[str] = None) -> Optional[Path]:
+        """
+        Prometheus 텍스트 파일 기록 (textfile 수집기가 쓰는 중인 파일을 읽지 않도록 교체)
+
+        Args:
+            path (Optional[str]): 파일 경로 (기본값: settings.SYNC_PROMETHEUS_PATH, 비어 있으면 기록하지 않음)
+
+        Returns:
+            Optional[Path]: 기록한 파일 경로
+        """
+        path = path or settings.SYNC_PROMETHEUS_PATH
+        if not path:
+            return None
+        path = Path(path)
+        _write_atomic(path, "\n".join(self.prometheus_lines()) + "\n")
+        return path
+
+    def save(self):
+        """설정된 경로에 JSON 보고서와 (설정 시) Prometheus 텍스트 파일 기록"""
+        try:
+            self.write_json()
+            self.write_prometheus()
+        except OSError as e:
+            print(f"동기화 지표 기록 오류: {e}")
+
+    def markdown_lines(self) -> List[str]:
+        """
+        알림 메시지에 넣을 지표 요약
+
+        Returns:
+            List[str]: 마크다운 줄 목록
+        """
+        report = self.report()
+        lines = [f"- ⏱️ 전체 소요 시간: {report['elapsed']}초 (초당 {report['posts']['per_second']}개 글 렌더링)"]
+        if report["phases"]:
+            lines.append("- 🧭 단계별 시간: " + ", ".join(
+                f"{name} {seconds}초" for name, seconds in report["phases"].items()
+            ))
+        if report["stages"]:
+            lines.append("- 🔀 파이프라인: " + ", ".join(
+                f"{name} {stats['items']}개/{stats['elapsed']}초" for name, stats in report["stages"].items()
+            ))
+        notion = report["requests"].get("notion")
+        if notion:
+            calls = ", ".join(f"{endpoint} {count}" for endpoint, count in notion["calls"].items()) or "없음"
+            lines.append(
+                f"- 📡 Notion API 호출 {notion['total']}회 ({calls}), "
+                f"429 응답 {notion['rate_limited']}회, 재시도 {notion['retries']}회"
+            )
+        images = report["images"]
+        lines.append(
+            f"- 🖼️ 이미지 다운로드 {images['fetched']}개, 건너뜀 {images['skipped']}개, "
+            f"실패 {images['failed']}개, {images['bytes'] / 1024:.1f}KB"
+        )
+        return lines
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _write_atomic(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
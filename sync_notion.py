@@ -6,75 +6,216 @@ import os
 import json
 import subprocess
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from notion_client import NotionClient
+from async_notion_client import AsyncNotionClient
+from content_store import ContentStore
+from snapshot import SnapshotWriter, SnapshotReader
+from html_renderer import prerender_post
+from image_assets import is_notion_image_url
+from image_gc import collect_garbage, format_bytes
+from sync_ledger import SyncLedger, post_content_hash
+from sync_pipeline import PipelineStage, SyncPipeline
+from sync_metrics import SyncMetrics
+from sync_webhook import WebhookReceiver, normalize_page_id
 from config.settings import settings
+from request_scheduler import get_scheduler
 
 
 class SyncManager:
     """동기화 상태 관리"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[NotionClient] = None):
         self.sync_file = Path(".sync_state.json")
+        self._client = client
     
-    def get_last_sync_time(self) -> Optional[datetime]:
-        """마지막 동기화 시간 조회"""
+    @property
+    def client(self) -> NotionClient:
+        """처음 사용할 때 한 번만 생성하는 NotionClient"""
+        if self._client is None:
+            self._client = NotionClient()
+        return self._client
+    
+    def _load_state(self) -> Dict:
+        """동기화 상태 파일 읽기"""
         if not self.sync_file.exists():
-            return None
+            return {}
         
         try:
             with open(self.sync_file, 'r') as f:
-                data = json.load(f)
-                last_sync_str = data.get("last_sync")
-                if last_sync_str:
-                    return datetime.fromisoformat(last_sync_str)
+                return json.load(f)
         except Exception as e:
             print(f"동기화 상태 파일 읽기 오류: {e}")
+            return {}
+    
+    def _save_state(self, updates: Dict):
+        """동기화 상태 파일에 값 병합 후 저장"""
+        try:
+            data = self._load_state()
+            data.update(updates)
+            
+            with open(self.sync_file, 'w') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        except Exception as e:
+            print(f"동기화 상태 파일 쓰기 오류: {e}")
+    
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        """Notion ISO 타임스탬프를 UTC aware datetime으로 변환"""
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            parsed = parsed.astimezone()
+        return parsed.astimezone(timezone.utc)
+    
+    def get_last_sync_time(self) -> Optional[datetime]:
+        """마지막 동기화 시간 조회"""
+        last_sync_str = self._load_state().get("last_sync")
+        if last_sync_str:
+            try:
+                return datetime.fromisoformat(last_sync_str)
+            except ValueError as e:
+                print(f"동기화 상태 파일 읽기 오류: {e}")
         
         return None
     
     def update_last_sync_time(self, sync_time: datetime):
         """마지막 동기화 시간 업데이트"""
+        self._save_state({
+            "last_sync": sync_time.isoformat(),
+            "last_sync_readable": sync_time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+    
+    def get_sync_cursor(self) -> Tuple[Optional[datetime], Set[str]]:
+        """
+        증분 동기화 커서 조회
+        
+        Returns:
+            Tuple[Optional[datetime], Set[str]]: 마지막으로 처리한 글의
+                `last_edited_time`(UTC)과 그 시각에 이미 처리한 페이지 ID
+        """
+        cursor = self._load_state().get("cursor") or {}
+        edited_str = cursor.get("last_edited_time")
+        if not edited_str:
+            return None, set()
+        
         try:
-            data = {
-                "last_sync": sync_time.isoformat(),
-                "last_sync_readable": sync_time.strftime("%Y-%m-%d %H:%M:%S")
+            return self._parse_timestamp(edited_str), set(cursor.get("page_ids", []))
+        except ValueError as e:
+            print(f"동기화 커서 파싱 오류: {e}")
+            return None, set()
+    
+    def update_sync_cursor(self, posts: List[Dict]):
+        """
+        처리한 글 목록으로 증분 동기화 커서 갱신
+        
+        Notion의 `last_edited_time`은 분 단위로 기록되므로 커서 시각과 같은
+        시각에 수정된 페이지 ID를 함께 저장해 다음 실행에서 중복을 제외합니다.
+        
+        Args:
+            posts (List[Dict]): 이번 실행에서 처리한 글 목록
+        """
+        cursor, seen_ids = self.get_sync_cursor()
+        
+        for post in posts:
+            if not post.get("last_edited"):
+                continue
+            edited = self._parse_timestamp(post["last_edited"])
+            if cursor is None or edited > cursor:
+                cursor, seen_ids = edited, {post["id"]}
+            elif edited == cursor:
+                seen_ids.add(post["id"])
+        
+        if cursor is None:
+            return
+        
+        self._save_state({
+            "cursor": {
+                "last_edited_time": cursor.isoformat().replace('+00:00', 'Z'),
+                "page_ids": sorted(seen_ids)
             }
+        })
+    
+    def is_full_listing_due(self, now: Optional[datetime] = None) -> bool:
+        """
+        전체 글 목록 조회가 필요한지 확인
+        
+        증분 조회는 커서 이후 수정된 발행 글만 받으므로 삭제되거나 발행 취소된 글은
+        SYNC_FULL_LISTING_HOURS마다 전체 목록을 원장과 비교해 찾습니다.
+        
+        Args:
+            now (Optional[datetime]): 기준 시각 (기본값: 현재 UTC 시각)
             
-            with open(self.sync_file, 'w') as f:
-                json.dump(data, f, indent=2)
+        Returns:
+            bool: 커서가 없거나 마지막 전체 조회 후 SYNC_FULL_LISTING_HOURS가 지났으면 True
+        """
+        if settings.SYNC_FULL_LISTING_HOURS <= 0 or self.get_sync_cursor()[0] is None:
+            return True
         
-        except Exception as e:
-            print(f"동기화 상태 파일 쓰기 오류: {e}")
+        listed_str = self._load_state().get("last_full_listing")
+        if not listed_str:
+            return True
+        
+        try:
+            listed = self._parse_timestamp(listed_str)
+        except ValueError as e:
+            print(f"동기화 상태 파일 읽기 오류: {e}")
+            return True
+        
+        now = now or datetime.now(timezone.utc)
+        return now - listed >= timedelta(hours=settings.SYNC_FULL_LISTING_HOURS)
+    
+    def update_full_listing_time(self, listed_time: datetime):
+        """마지막 전체 글 목록 조회 시간 업데이트"""
+        self._save_state({
+            "last_full_listing": listed_time.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+        })
     
-    def fetch_updated_posts(self, since_time: Optional[datetime] = None) -> List[Dict]:
-        """업데이트된 글 목록 조회"""
-        client = NotionClient()
-        all_posts = client.fetch_published_posts()
+    def fetch_updated_posts(
+        self,
+        since_time: Optional[datetime] = None,
+        seen_ids: Optional[Set[str]] = None
+    ) -> List[Dict]:
+        """
+        업데이트된 글 목록 조회
+        
+        수정 시각 필터는 Notion 쿼리에서 처리되므로 변경된 글만 전송됩니다.
+        
+        Args:
+            since_time (Optional[datetime]): 이 시각 이후 수정된 글만 조회.
+                naive datetime은 로컬 시간으로 간주
+            seen_ids (Optional[Set[str]]): since_time과 같은 시각에 이미 처리한 페이지 ID
+            
+        Returns:
+            List[Dict]: 업데이트된 글 목록
+        """
+        client = self.client
         
-        if not since_time:
-            return all_posts
+        if since_time and since_time.tzinfo is None:
+            since_time = since_time.astimezone()
         
         updated_posts = []
-        for post in all_posts:
-            last_edited_str = post.get("last_edited")
-            if last_edited_str:
-                try:
-                    last_edited = datetime.fromisoformat(last_edited_str.replace('Z', '+00:00'))
-                    # UTC to naive datetime for comparison
-                    last_edited = last_edited.replace(tzinfo=None)
-                    
-                    if last_edited > since_time:
-                        updated_posts.append(post)
-                except Exception as e:
-                    print(f"날짜 파싱 오류: {e}")
-                    # 오류 시 포함 (안전장치)
-                    updated_posts.append(post)
+        for post in client.iter_published_posts(edited_after=since_time):
+            if since_time and seen_ids and post["id"] in seen_ids:
+                if self._parse_timestamp(post["last_edited"]) <= since_time:
+                    continue
+            updated_posts.append(post)
         
         return updated_posts
+    
+    def iter_published_posts(self) -> Iterator[Dict]:
+        """
+        발행된 전체 글 목록을 페이지 단위로 받는 대로 반환 (속성만, 본문 제외)
+        
+        원장과 비교해 바뀐 글과 사라진 글을 찾는 데 사용합니다.
+        
+        Yields:
+            Dict: 발행된 글
+        """
+        return self.client.iter_published_posts()
 
 
 class GitManager:
@@ -130,38 +271,49 @@ class GitManager:
 class ImageProcessor:
     """이미지 일괄 처리"""
     
+    def __init__(self, client: Optional[NotionClient] = None):
+        self._client = client
+    
+    @property
+    def client(self) -> NotionClient:
+        """처음 사용할 때 한 번만 생성하는 NotionClient"""
+        if self._client is None:
+            self._client = NotionClient()
+        return self._client
+    
     def extract_all_image_urls(self, posts: List[Dict]) -> List[str]:
-        """모든 포스트에서 이미지 URL 추출"""
+        """
+        모든 포스트에서 Notion 이미지 URL 추출
+        
+        렌더링된 글은 변환 중 만든 이미지 목록(images)의 원본 키(서명을 뺀 호스트와 경로)를 사용하고,
+        목록이 없는 글(이전 버전에서 저장한 본문)만 본문을 검색합니다.
+        """
         import re
         
         image_urls = []
         image_pattern = r'!\[([^\]]*)\]\((https://[^)]+)\)'
         
         for post in posts:
-            content = post.get("content", "")
-            matches = re.findall(image_pattern, content)
-            for _, url in matches:
-                if "prod-files-secure.s3.amazonaws.com" in url or "notion.so" in url:
+            if "images" in post:
+                image_urls.extend(image["source_url"] for image in post["images"])
+                continue
+            
+            for _, url in re.findall(image_pattern, post.get("content", "")):
+                if is_notion_image_url(url):
                     image_urls.append(url)
         
         return image_urls
     
     def process_all_images(self, posts: List[Dict]) -> int:
         """모든 이미지를 처리하고 처리된 개수 반환"""
-        client = NotionClient()
+        client = self.client
         processed_count = 0
         
         for post in posts:
             if post.get("content"):
-                original_content = post["content"]
-                processed_content = client.process_notion_images(
-                    original_content, 
-                    post["id"]
-                )
-                
-                # 이미지가 처리되었는지 확인
-                if original_content != processed_content:
-                    processed_count += len(self.extract_all_image_urls([post]))
+                images: List[Dict] = []
+                post["content"] = client.process_notion_images(post["content"], post["id"], images)
+                processed_count += len(images)
         
         return processed_count
 
@@ -174,18 +326,27 @@ class NotificationManager:
         self.repo_owner = "dexelop"  # GitHub 사용자명
         self.repo_name = "notion_to_blog"
     
-    def send_success_notification(self, posts_count: int, images_count: int) -> bool:
-        """성공 알림 발송"""
+    def send_success_notification(
+        self,
+        posts_count: int,
+        images_count: int,
+        metrics: Optional[SyncMetrics] = None
+    ) -> bool:
+        """성공 알림 발송 (지표가 있으면 단계별 시간, API 호출 수 등을 함께 표시)"""
         if not self.github_token:
             print("GitHub 토큰이 없어 알림을 보낼 수 없습니다.")
             return False
         
+        metrics_text = ""
+        if metrics is not None:
+            metrics_text = "\n\n**실행 지표:**\n" + "\n".join(metrics.markdown_lines())
+        
         message = f"""
 🎉 **Notion 블로그 동기화 성공**
 
 - 📝 업데이트된 글: {posts_count}개
 - 🖼️ 처리된 이미지: {images_count}개  
-- ⏰ 동기화 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- ⏰ 동기화 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{metrics_text}
 
 자동화가 정상적으로 작동하고 있습니다! ✅
         """.strip()
@@ -237,7 +398,10 @@ class NotificationManager:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            # 이슈 생성은 멱등하지 않으므로 5xx 응답 후 재시도하지 않음 (중복 이슈 방지)
+            response = get_scheduler("http").request(
+                requests.post, url, idempotent=False, headers=headers, json=data
+            )
             response.raise_for_status()
             print(f"GitHub 이슈 생성 성공: {title}")
             return True
@@ -276,12 +440,24 @@ class DeploymentManager:
 class NotionSyncWorkflow:
     """전체 동기화 워크플로우"""
     
-    def __init__(self):
+    def __init__(self, concurrency: Optional[int] = None):
+        """
+        Args:
+            concurrency (Optional[int]): 파이프라인 블록 조회 단계에서 동시에 처리할 글 수
+                (2 이상이면 AsyncNotionClient로 블록 트리를 비동기 조회)
+        """
+        self.concurrency = concurrency or settings.SYNC_CONCURRENCY
         self.sync_manager = SyncManager()
         self.git_manager = GitManager()
         self.image_processor = ImageProcessor()
         self.notification_manager = NotificationManager()
         self.deployment_manager = DeploymentManager()
+        self.image_gc: Optional[Dict] = None
+        self.ledger = SyncLedger()
+        self.pipeline: Optional[SyncPipeline] = None
+        self.posts_written = 0
+        self.posts_removed = 0
+        self.metrics = SyncMetrics()
     
     def is_configured(self) -> bool:
         """동기화 설정이 완료되었는지 확인"""
@@ -290,14 +466,193 @@ class NotionSyncWorkflow:
         except:
             return False
     
+    def store_posts(
+        self,
+        posts: Iterable[Dict],
+        removed_ids: Union[Sequence[str], Callable[[], Sequence[str]]] = ()
+    ) -> int:
+        """
+        글을 단계별 파이프라인으로 렌더링해 콘텐츠 저장소와 스냅샷에 기록하고 원장 갱신
+        
+        목록 → 블록 조회 → 이미지 다운로드/최적화 → 변환 → 기록 단계가 크기가 제한된 큐로 연결되어
+        한 글의 블록을 조회하는 동안 다른 글의 이미지 처리, 변환, 기록이 함께 진행됩니다.
+        마크다운과 함께 HTML을 미리 만들어 저장하므로 앱은 글을 볼 때마다 마크다운을 다시 해석하지 않습니다.
+        수정 시각은 바뀌었지만 렌더링 결과가 원장과 같은 글은 출력 파일을 다시 쓰지 않습니다.
+        
+        Args:
+            posts (Iterable[Dict]): 새로 생기거나 수정된 글 (제너레이터면 목록 단계에서 지연 소비됨)
+            removed_ids (Union[Sequence[str], Callable[[], Sequence[str]]]): 발행 취소되거나 삭제되어
+                출력을 제거할 페이지 ID (목록 단계가 끝난 뒤 계산하도록 함수로 전달할 수 있음)
+            
+        Returns:
+            int: 처리된 이미지 수
+        """
+        store = ContentStore()
+        snapshot = SnapshotWriter()
+        if self.concurrency > 1:
+            client = AsyncNotionClient(concurrency=self.concurrency, store=store)
+        else:
+            client = NotionClient(store=store)
+        self.posts_written = 0
+        images = [0]
+        
+        def convert(job: Dict) -> Dict:
+            client.convert_post(job)
+            post = job["post"]
+            job["content_hash"] = post_content_hash(post)
+            job["current"] = self.ledger.is_current(post["id"], job["content_hash"])
+            if not job["current"]:
+                post["html"], post["toc"] = prerender_post(post["content"], post["images"])
+            return job
+        
+        def write(job: Dict) -> Dict:
+            post = job["post"]
+            store.replace_fragments(post["id"], job["fragments"])
+            images[0] += len(post["images"])
+            if job["current"]:
+                # 렌더링 결과가 같으면 수정 시각만 기록
+                self.ledger.record(post, content_hash=job["content_hash"])
+                return post
+            store.upsert_post(post)
+            path = snapshot.write_post(post)
+            self.ledger.record(post, [path.as_posix()], job["content_hash"])
+            self.posts_written += 1
+            return post
+        
+        self.pipeline = SyncPipeline(
+            [
+                PipelineStage("fetch", lambda post: client.fetch_post_blocks(post, store), self.concurrency),
+                PipelineStage("assets", client.fetch_post_assets, settings.SYNC_ASSET_WORKERS),
+                PipelineStage("convert", convert, settings.SYNC_CONVERT_WORKERS),
+                # SQLite와 원장 기록은 한 스레드에서만 실행
+                PipelineStage("write", write, 1),
+            ],
+            queue_size=settings.SYNC_QUEUE_SIZE,
+            describe=lambda item: (item.get("post") or item).get("slug", "") if isinstance(item, dict) else str(item)
+        )
+        with self.metrics.phase("pipeline"):
+            rendered = self.pipeline.run(posts)
+        self.metrics.record_stages(self.pipeline.stats())
+        
+        if any(error["stage"] == self.pipeline.source.name for error in self.pipeline.errors):
+            # 목록이 완전하지 않으면 사라진 글을 판단할 수 없음
+            self.ledger.save()
+            client.optimizer.close()
+            client.downloader.close()
+            if isinstance(client, AsyncNotionClient):
+                client.close()
+            raise Exception("글 목록 조회에 실패해 제거할 글을 판단할 수 없습니다.")
+        
+        removed_ids = list(removed_ids() if callable(removed_ids) else removed_ids)
+        with self.metrics.phase("remove"):
+            for page_id in removed_ids:
+                entry = self.ledger.remove(page_id)
+                store.delete_post(page_id)
+                snapshot.remove_post(page_id)
+                for path in (entry or {}).get("outputs", []):
+                    if os.path.exists(path):
+                        os.remove(path)
+        self.posts_removed = len(removed_ids)
+        if removed_ids:
+            print(f"🗑️ 발행 취소/삭제된 글 제거: {len(removed_ids)}개")
+        
+        # 스냅샷 인덱스는 저장소의 전체 글 목록으로 다시 생성 (바뀐 글이 있을 때만)
+        with self.metrics.phase("index"):
+            if self.posts_written or removed_ids:
+                snapshot.write_index(store.list_posts())
+            self.ledger.save()
+        
+        if rendered or removed_ids:
+            print(
+                f"💾 콘텐츠 저장소/스냅샷 업데이트: {self.posts_written}개 글 기록, "
+                f"{len(rendered) - self.posts_written}개 글 내용 변경 없음 ({store.path}, {snapshot.snapshot_dir})"
+            )
+            for name, stats in self.pipeline.stats().items():
+                print(
+                    f"⏱️ {name}: {stats['items']}개, 작업 {stats['workers']}개, "
+                    f"{stats['elapsed']}초, 초당 {stats['throughput']}개"
+                )
+        
+        downloads = client.downloader.summary()
+        self.metrics.record_images(downloads)
+        client.optimizer.close()
+        if settings.IMAGE_GC and (self.posts_written or removed_ids):
+            with self.metrics.phase("gc"):
+                self.image_gc = collect_garbage(store, str(client.downloader.image_dir), client.downloader.manifest)
+            if self.image_gc["orphaned"]:
+                print(
+                    f"🧹 참조되지 않는 이미지 정리: {self.image_gc['orphaned']}개, "
+                    f"{format_bytes(self.image_gc['reclaimed_bytes'])} 확보"
+                )
+        client.downloader.close()
+        if isinstance(client, AsyncNotionClient):
+            client.close()
+        if any(downloads[status] for status in ("cached", "downloaded", "existing", "failed")):
+            print(
+                f"🖼️ 이미지: 매니페스트 {downloads['cached']}개, "
+                f"새 파일 {downloads['downloaded']}개, 기존 파일 {downloads['existing']}개, "
+                f"실패 {downloads['failed']}개, {downloads['bytes'] / 1024:.1f}KB, "
+                f"평균 {downloads['average_latency']}초"
+            )
+        return images[0]
+    
+    def _restore_store(self) -> Optional[ContentStore]:
+        """
+        커밋된 스냅샷(content/)으로 콘텐츠 저장소의 글을 다시 채움
+        
+        콘텐츠 저장소(data/content.db)는 커밋하지 않으므로 새로 체크아웃한 러너에는 없거나,
+        Actions 캐시에서 복원했다면 스냅샷보다 오래되었을 수 있습니다.
+        글은 스냅샷에 맞추고 블록 렌더링 캐시는 남아 있으면 그대로 사용합니다.
+        
+        Returns:
+            Optional[ContentStore]: 콘텐츠 저장소 (스냅샷과 저장소 파일이 모두 없으면 None)
+        """
+        if not SnapshotReader.exists():
+            return ContentStore.open_existing()
+        
+        with self.metrics.phase("restore"):
+            store = ContentStore()
+            store.replace_posts(SnapshotReader().iter_posts())
+        return store
+    
+    def _adopt_stored_post(self, post: Dict, store: Optional[ContentStore]) -> bool:
+        """
+        원장에 없지만 콘텐츠 저장소에 같은 수정 시각으로 저장된 글을 원장에 등록 (원장 도입 전 저장소)
+        
+        Args:
+            post (Dict): 원장에 없는 글
+            store (Optional[ContentStore]): 콘텐츠 저장소
+            
+        Returns:
+            bool: 등록했으면 True (다시 렌더링할 필요 없음)
+        """
+        if not store or self.ledger.get(post["id"]) is not None:
+            return False
+        if store.get_last_edited(post["id"]) != post["last_edited"]:
+            return False
+        
+        stored = store.get_post_by_slug(post["slug"])
+        path = SnapshotWriter().post_path(post["id"])
+        if not stored or stored["id"] != post["id"] or not path.exists():
+            return False
+        self.ledger.record(stored, [path.as_posix()])
+        return True
+    
     def run_sync(self, dry_run: bool = False) -> Dict:
-        """동기화 실행"""
-        summary = {
-            "posts_updated": 0,
-            "images_processed": 0,
-            "errors": [],
-            "success": False
-        }
+        """
+        동기화 실행
+        
+        증분 동기화 커서 이후 수정된 발행 글만 Notion 쿼리로 받아(`last_edited_time` 필터) 원장과 비교하고,
+        새로 생기거나 수정된 글만 파이프라인으로 렌더링합니다. 커서가 없거나 콘텐츠 저장소가 비어 있거나
+        마지막 전체 조회 후 SYNC_FULL_LISTING_HOURS가 지났으면 발행된 전체 글 목록(속성만)을 받아
+        목록에서 사라진 글의 출력도 제거합니다. 바뀐 글이 없으면 어떤 파일도 쓰지 않습니다.
+        한 글의 처리 중 오류가 나면 그 글만 건너뛰고 errors에 기록하며, 원장에 기록되지 않으므로 다음 실행에서 다시 처리됩니다.
+        실행 지표는 성공 여부와 관계없이 SYNC_METRICS_PATH(와 설정 시 SYNC_PROMETHEUS_PATH)에 기록하고 (dry run 제외)
+        summary["metrics"]로 반환합니다.
+        """
+        self._reset_metrics()
+        published_ids: List[str] = []
+        summary = self._new_summary()
         
         try:
             print("🔄 Notion 블로그 동기화 시작...")
@@ -306,55 +661,107 @@ class NotionSyncWorkflow:
             if not self.is_configured():
                 raise Exception("Notion 설정이 완료되지 않았습니다.")
             
-            # 마지막 동기화 시간 확인
             last_sync = self.sync_manager.get_last_sync_time()
             if last_sync:
                 print(f"📅 마지막 동기화: {last_sync.strftime('%Y-%m-%d %H:%M:%S')}")
+            
+            # 저장소나 스냅샷이 비어 있으면 전체 동기화로 채움
+            store = self._restore_store()
+            if not store or not store.count() or not SnapshotReader.exists():
+                if self.ledger.pages:
+                    print("📦 콘텐츠 저장소가 비어 있어 전체 동기화를 실행합니다.")
+                self.ledger.clear()
+            
+            # 지난 동기화에서 이미지를 내려받지 못한 글은 수정되지 않았어도 다시 렌더링
+            pending_ids = set(self.ledger.unresolved_pages())
+            
+            # 사라진 글은 전체 목록으로만 찾을 수 있으므로 주기적으로 전체 조회
+            cursor, seen_ids = self.sync_manager.get_sync_cursor()
+            full_listing = not self.ledger.pages or self.sync_manager.is_full_listing_due()
+            summary["full_listing"] = full_listing
+            listed: List[Dict] = []
+            listing_started = datetime.now(timezone.utc)
+            if not full_listing:
+                print(f"⏩ 증분 조회: {cursor.isoformat()} 이후 수정된 글")
+            
+            def listed_posts() -> Iterator[Dict]:
+                """전체 목록 또는 커서 이후 수정된 글 목록 (증분 조회면 이미지가 남은 글을 페이지별로 추가)"""
+                if full_listing:
+                    posts = self.sync_manager.iter_published_posts()
+                else:
+                    posts = self.sync_manager.fetch_updated_posts(cursor, seen_ids)
+                for post in posts:
+                    listed.append(post)
+                    yield post
+                
+                if full_listing:
+                    return
+                for page_id in sorted(pending_ids - {post["id"] for post in listed}):
+                    post = self.sync_manager.client.get_post(page_id)
+                    if post is not None and post["status"] == "Published":
+                        yield post
+            
+            def changed_posts() -> Iterator[Dict]:
+                """글 목록을 받는 대로 원장과 비교해 렌더링할 글만 반환 (목록 단계)"""
+                for post in listed_posts():
+                    published_ids.append(post["id"])
+                    if post["id"] not in pending_ids and (
+                        self.ledger.is_unchanged(post) or self._adopt_stored_post(post, store)
+                    ):
+                        continue
+                    yield post
+            
+            def removed_ids() -> List[str]:
+                if not full_listing:
+                    return []
+                stored_ids = [post["id"] for post in store.list_posts()] if store else []
+                return self.ledger.removed_pages(published_ids, stored_ids)
+            
+            if dry_run:
+                with self.metrics.phase("list"):
+                    summary["posts_updated"] = sum(1 for _ in changed_posts())
+                    summary["posts_removed"] = len(removed_ids())
             else:
-                print("📅 첫 번째 동기화입니다.")
+                # 콘텐츠 렌더링 및 저장 (이미지 처리 포함)
+                self._store(summary, changed_posts(), removed_ids)
+            summary["posts_unchanged"] = len(published_ids) - summary["posts_updated"]
             
-            # 업데이트된 글 조회
-            updated_posts = self.sync_manager.fetch_updated_posts(last_sync)
-            summary["posts_updated"] = len(updated_posts)
+            print(
+                f"📝 {'발행된' if full_listing else '수정된'} 글 {len(published_ids)}개: "
+                f"새 글/수정 {summary['posts_updated']}개, "
+                f"변경 없음 {summary['posts_unchanged']}개, 제거 {summary['posts_removed']}개"
+            )
             
-            print(f"📝 업데이트된 글: {len(updated_posts)}개")
+            # 건너뛴 글이 있으면 다음 실행에서 다시 조회하도록 커서를 옮기지 않음
+            if not dry_run and not summary["errors"]:
+                self.sync_manager.update_sync_cursor(listed)
+                if full_listing:
+                    self.sync_manager.update_full_listing_time(listing_started)
             
-            if updated_posts:
-                # 이미지 처리
-                if not dry_run:
-                    images_count = self.image_processor.process_all_images(updated_posts)
-                    summary["images_processed"] = images_count
-                    print(f"🖼️ 처리된 이미지: {images_count}개")
+            if not dry_run and (summary["posts_updated"] or summary["posts_removed"]):
+                print(f"🖼️ 처리된 이미지: {summary['images_processed']}개")
+                self.sync_manager.update_last_sync_time(datetime.now(timezone.utc))
                 
                 # Git 작업
-                if not dry_run and self.git_manager.has_changes():
-                    print("📤 Git 변경사항 커밋 중...")
-                    
-                    self.git_manager.add_all_changes()
-                    
-                    commit_message = f"auto: Notion 블로그 동기화 - {len(updated_posts)}개 글 업데이트"
-                    self.git_manager.commit_changes(commit_message)
-                    self.git_manager.push_changes()
-                    
-                    print("✅ Git 푸시 완료")
+                self._commit_changes(
+                    f"auto: Notion 블로그 동기화 - {summary['posts_updated']}개 글 업데이트, "
+                    f"{summary['posts_removed']}개 글 제거"
+                )
                 
                 # 배포 트리거 (CI/CD에서 자동 처리되므로 선택적)
-                # if not dry_run:
-                #     self.deployment_manager.trigger_fly_deployment()
-            
-            # 동기화 시간 업데이트
-            if not dry_run:
-                self.sync_manager.update_last_sync_time(datetime.now())
-            
-            summary["success"] = True
-            
-            # 성공 알림
-            if not dry_run and updated_posts:
+                # self.deployment_manager.trigger_fly_deployment()
+                
+                # 성공 알림
+                self._record_requests()
                 self.notification_manager.send_success_notification(
-                    len(updated_posts),
-                    summary["images_processed"]
+                    summary["posts_updated"],
+                    summary["images_processed"],
+                    self.metrics
                 )
+            elif not dry_run:
+                print("✨ 변경사항이 없습니다.")
             
+            summary["success"] = True
             print("🎉 동기화 완료!")
             
         except Exception as e:
@@ -366,8 +773,159 @@ class NotionSyncWorkflow:
             if not dry_run:
                 self.notification_manager.send_error_notification(error_msg)
         
+        self._finish_metrics(summary, len(published_ids), dry_run)
         return summary
-
+    
+    def sync_pages(self, page_ids: Iterable[str], dry_run: bool = False) -> Dict:
+        """
+        지정한 페이지만 동기화 (웹훅 이벤트, --page)
+        
+        데이터베이스 전체 목록을 조회하지 않고 페이지별로 속성을 조회해 원장과 비교합니다.
+        발행된 글이 바뀌었으면 run_sync와 같은 파이프라인으로 렌더링하고, 발행 취소/삭제되었거나
+        블로그 데이터베이스에서 빠진 글은 출력을 제거합니다. 알림은 보내지 않습니다.
+        콘텐츠 저장소가 비어 있으면 전체 글 목록이 필요하므로 run_sync를 먼저 실행해야 합니다.
+        
+        Args:
+            page_ids (Iterable[str]): 페이지 ID 또는 Notion 페이지 URL
+            dry_run (bool): 실제 변경 없이 바뀔 글 수만 확인
+            
+        Returns:
+            Dict: run_sync와 같은 형식의 요약
+        """
+        self._reset_metrics()
+        published_ids: List[str] = []
+        summary = self._new_summary()
+        
+        try:
+            page_ids = list(dict.fromkeys(normalize_page_id(page_id) for page_id in page_ids))
+            print(f"🔄 페이지 {len(page_ids)}개 동기화 시작...")
+            
+            if not self.is_configured():
+                raise Exception("Notion 설정이 완료되지 않았습니다.")
+            
+            store = self._restore_store()
+            if not store or not store.count() or not SnapshotReader.exists():
+                raise Exception("콘텐츠 저장소가 비어 있습니다. 전체 동기화를 먼저 실행하세요.")
+            
+            pending_ids = set(self.ledger.unresolved_pages())
+            posts: List[Dict] = []
+            removed_ids: List[str] = []
+            
+            with self.metrics.phase("list"):
+                for page_id in page_ids:
+                    post = self.sync_manager.client.get_post(page_id)
+                    if post is None or post["status"] != "Published":
+                        if self.ledger.get(page_id) is not None or store.get_last_edited(page_id) is not None:
+                            removed_ids.append(page_id)
+                        continue
+                    published_ids.append(post["id"])
+                    if post["id"] not in pending_ids and (
+                        self.ledger.is_unchanged(post) or self._adopt_stored_post(post, store)
+                    ):
+                        continue
+                    posts.append(post)
+            
+            if dry_run:
+                summary["posts_updated"] = len(posts)
+                summary["posts_removed"] = len(removed_ids)
+            elif posts or removed_ids:
+                self._store(summary, posts, removed_ids)
+            summary["posts_unchanged"] = len(published_ids) - summary["posts_updated"]
+            
+            print(
+                f"📝 페이지 {len(page_ids)}개: 새 글/수정 {summary['posts_updated']}개, "
+                f"변경 없음 {summary['posts_unchanged']}개, 제거 {summary['posts_removed']}개"
+            )
+            
+            if not dry_run and (summary["posts_updated"] or summary["posts_removed"]):
+                self._commit_changes(
+                    f"auto: Notion 글 동기화 - {summary['posts_updated']}개 글 업데이트, "
+                    f"{summary['posts_removed']}개 글 제거"
+                )
+            elif not dry_run:
+                print("✨ 변경사항이 없습니다.")
+            
+            summary["success"] = True
+            
+        except Exception as e:
+            summary["errors"].append(str(e))
+            print(f"❌ 페이지 동기화 실패: {e}")
+        
+        self._finish_metrics(summary, len(published_ids), dry_run)
+        return summary
+    
+    @staticmethod
+    def _new_summary() -> Dict:
+        """빈 동기화 요약"""
+        return {
+            "posts_updated": 0,
+            "posts_unchanged": 0,
+            "posts_removed": 0,
+            "full_listing": False,
+            "images_processed": 0,
+            "images_removed": 0,
+            "reclaimed_bytes": 0,
+            "stages": {},
+            "metrics": {},
+            "errors": [],
+            "success": False
+        }
+    
+    def _store(
+        self,
+        summary: Dict,
+        posts: Iterable[Dict],
+        removed_ids: Union[Sequence[str], Callable[[], Sequence[str]]]
+    ):
+        """store_posts를 실행하고 결과를 요약에 기록"""
+        summary["images_processed"] = self.store_posts(posts, removed_ids)
+        summary["posts_updated"] = self.posts_written
+        summary["posts_removed"] = self.posts_removed
+        summary["stages"] = self.pipeline.stats()
+        summary["errors"].extend(
+            f"{error['stage']} ({error['item']}): {error['error']}" for error in self.pipeline.errors
+        )
+        if self.image_gc:
+            summary["images_removed"] = self.image_gc["orphaned"]
+            summary["reclaimed_bytes"] = self.image_gc["reclaimed_bytes"]
+    
+    def _commit_changes(self, message: str):
+        """변경사항이 있으면 커밋하고 푸시"""
+        with self.metrics.phase("git"):
+            if self.git_manager.has_changes():
+                print("📤 Git 변경사항 커밋 중...")
+                
+                self.git_manager.add_all_changes()
+                self.git_manager.commit_changes(message)
+                self.git_manager.push_changes()
+                
+                print("✅ Git 푸시 완료")
+    
+    def _reset_metrics(self):
+        """새 실행의 지표를 만들고 공유 요청 스케줄러의 통계 초기화"""
+        self.metrics = SyncMetrics()
+        self.image_gc = None
+        for name in ("notion", "http"):
+            get_scheduler(name).reset_stats()
+    
+    def _finish_metrics(self, summary: Dict, published: int, dry_run: bool):
+        """지표를 마무리해 기록하고 요약에 추가"""
+        self._record_requests()
+        self.metrics.finish(
+            success=summary["success"],
+            published=published,
+            updated=summary["posts_updated"],
+            unchanged=summary["posts_unchanged"],
+            removed=summary["posts_removed"]
+        )
+        if not dry_run:
+            self.metrics.save()
+        summary["metrics"] = self.metrics.report()
+    
+    def _record_requests(self):
+        """공유 요청 스케줄러의 누적 통계를 지표에 기록"""
+        for name in ("notion", "http"):
+            self.metrics.record_requests(name, get_scheduler(name).stats())
 
 def main():
     """메인 실행 함수"""
@@ -375,16 +933,60 @@ def main():
     
     parser = argparse.ArgumentParser(description="Notion 블로그 동기화")
     parser.add_argument("--dry-run", action="store_true", help="실제 변경 없이 테스트")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.SYNC_CONCURRENCY,
+        help="블록 조회 단계에서 동시에 처리할 글 수 (2 이상이면 비동기 클라이언트 사용)"
+    )
+    parser.add_argument(
+        "--page",
+        action="append",
+        metavar="PAGE_ID",
+        help="전체 목록을 조회하지 않고 이 페이지만 동기화 (페이지 URL 가능, 여러 번 지정 가능)"
+    )
+    parser.add_argument("--serve", action="store_true", help="Notion 웹훅을 받아 변경된 페이지만 동기화하는 수신기 실행")
+    parser.add_argument("--host", default=settings.WEBHOOK_HOST, help="웹훅 수신기 바인딩 주소")
+    parser.add_argument("--port", type=int, default=settings.WEBHOOK_PORT, help="웹훅 수신기 포트")
     
     args = parser.parse_args()
     
-    workflow = NotionSyncWorkflow()
-    summary = workflow.run_sync(dry_run=args.dry_run)
+    workflow = NotionSyncWorkflow(concurrency=args.concurrency)
+    
+    if args.serve:
+        receiver = WebhookReceiver(workflow.sync_pages, host=args.host, port=args.port)
+        print(
+            f"📡 Notion 웹훅 수신 대기: {receiver.url} "
+            f"(디바운스 {receiver.debouncer.delay}초, 최대 {receiver.debouncer.max_delay}초)"
+        )
+        receiver.serve_forever()
+        exit(0)
+    
+    if args.page:
+        summary = workflow.sync_pages(args.page, dry_run=args.dry_run)
+    else:
+        summary = workflow.run_sync(dry_run=args.dry_run)
     
     # 결과 출력
     print("\n📊 동기화 요약:")
     print(f"- 업데이트된 글: {summary['posts_updated']}개")
+    print(f"- 변경 없는 글: {summary['posts_unchanged']}개")
+    if summary["posts_removed"]:
+        print(f"- 제거된 글: {summary['posts_removed']}개")
     print(f"- 처리된 이미지: {summary['images_processed']}개")
+    if summary["images_removed"]:
+        print(f"- 정리된 이미지: {summary['images_removed']}개 ({format_bytes(summary['reclaimed_bytes'])})")
+    for name, stats in summary["stages"].items():
+        print(f"- {name} 단계: {stats['items']}개, {stats['elapsed']}초 (초당 {stats['throughput']}개)")
+    metrics = summary["metrics"]
+    if metrics:
+        notion = metrics["requests"]["notion"]
+        print(
+            f"- 소요 시간: {metrics['elapsed']}초, Notion API 호출 {notion['total']}회 "
+            f"(429 응답 {notion['rate_limited']}회, 재시도 {notion['retries']}회)"
+        )
+        if not args.dry_run:
+            print(f"- 지표 보고서: {settings.SYNC_METRICS_PATH}")
     print(f"- 성공 여부: {'✅' if summary['success'] else '❌'}")
     
     if summary['errors']:
@@ -0,0 +1,207 @@
+"""
+동기화 파이프라인 모듈
+단계별 작업 스레드를 크기가 제한된 큐로 연결해 여러 글의 네트워크 조회, 변환, 디스크 기록을 겹쳐 실행하는 기능 제공
+
+큐가 가득 차면 앞 단계가 기다리므로 느린 단계 앞에 처리되지 않은 글이 무한히 쌓이지 않습니다.
+"""
+import time
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+# 단계 사이 큐에서 입력이 끝났음을 알리는 값
+_DONE = object()
+
+
+class PipelineStage:
+    """
+    파이프라인의 한 단계
+
+    func는 항목 하나를 받아 다음 단계로 넘길 항목을 반환합니다.
+    None을 반환하면 그 항목은 다음 단계로 넘어가지 않습니다.
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1):
+        """
+        Args:
+            name (str): 단계 이름 (통계 키)
+            func (Callable[[Any], Any]): 항목 처리 함수
+            workers (int): 작업 스레드 수
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+        self.items = 0
+        self.busy = 0.0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def _record(self, started: float, finished: float):
+        with self._lock:
+            self.items += 1
+            self.busy += finished - started
+            if self.started is None or started < self.started:
+                self.started = started
+            if self.finished is None or finished > self.finished:
+                self.finished = finished
+
+    def stats(self) -> Dict:
+        """
+        단계 처리 통계
+
+        Returns:
+            Dict: {"workers", "items", "busy", "elapsed", "throughput"}
+                (elapsed는 첫 항목 시작부터 마지막 항목 완료까지, throughput은 초당 항목 수)
+        """
+        with self._lock:
+            elapsed = (self.finished - self.started) if self.started is not None else 0.0
+            return {
+                "workers": self.workers,
+                "items": self.items,
+                "busy": round(self.busy, 3),
+                "elapsed": round(elapsed, 3),
+                "throughput": round(self.items / elapsed, 2) if elapsed > 0 else float(self.items)
+            }
+
+
+class SyncPipeline:
+    """
+    생산자/소비자 단계 파이프라인
+
+    첫 단계는 입력 이터러블을 소비하는 생산자 스레드에서 실행되고,
+    이후 단계는 각자의 작업 스레드가 앞 단계 큐에서 항목을 꺼내 처리합니다.
+    한 항목의 처리 중 예외가 나면 그 항목만 제외하고 errors에 기록합니다.
+
+    사용 예:
+        pipeline = SyncPipeline([
+            PipelineStage("fetch", fetch, workers=4),
+            PipelineStage("write", write),
+        ], queue_size=8)
+        results = pipeline.run(posts)
+        print(pipeline.stats())
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        queue_size: int = 8,
+        source_name: str = "list",
+        describe: Optional[Callable[[Any], str]] = None
+    ):
+        """
+        Args:
+            stages (List[PipelineStage]): 순서대로 실행할 단계
+            queue_size (int): 단계 사이 큐의 최대 크기
+            source_name (str): 입력 이터러블을 소비하는 첫 단계의 이름
+            describe (Optional[Callable[[Any], str]]): 오류 기록에 사용할 항목 설명 함수
+        """
+        self.source = PipelineStage(source_name, lambda item: item)
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.describe = describe or str
+        self.errors: List[Dict] = []
+        self._errors_lock = threading.Lock()
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        모든 항목을 파이프라인으로 처리
+
+        Args:
+            items (Iterable[Any]): 입력 항목 (제너레이터면 첫 단계 스레드에서 지연 소비됨)
+
+        Returns:
+            List[Any]: 마지막 단계의 결과 (완료 순서)
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: List[Any] = []
+        results_lock = threading.Lock()
+        threads = [threading.Thread(target=self._produce, args=(items, queues[0] if queues else None), daemon=True)]
+
+        for index, stage in enumerate(self.stages):
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            remaining = [stage.workers]
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, inbox, outbox, remaining, results, results_lock),
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        단계별 처리 통계 (입력 단계 포함, 실행 순서)
+
+        Returns:
+            Dict[str, Dict]: 단계 이름별 PipelineStage.stats 결과
+        """
+        return {stage.name: stage.stats() for stage in [self.source, *self.stages]}
+
+    def _produce(self, items: Iterable[Any], outbox: Optional[queue.Queue]):
+        iterator = iter(items)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            except Exception as e:
+                self._record_error(self.source, None, e)
+                break
+            self.source._record(started, time.perf_counter())
+            if outbox is not None:
+                outbox.put(item)
+        if outbox is not None:
+            for _ in range(self.stages[0].workers):
+                outbox.put(_DONE)
+
+    def _work(
+        self,
+        stage: PipelineStage,
+        inbox: queue.Queue,
+        outbox: Optional[queue.Queue],
+        remaining: List[int],
+        results: List[Any],
+        results_lock: threading.Lock
+    ):
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                break
+            started = time.perf_counter()
+            try:
+                output = stage.func(item)
+            except Exception as e:
+                self._record_error(stage, item, e)
+                continue
+            stage._record(started, time.perf_counter())
+            if output is None:
+                continue
+            if outbox is not None:
+                outbox.put(output)
+            else:
+                with results_lock:
+                    results.append(output)
+
+        # 이 단계의 마지막 작업 스레드가 다음 단계 작업 스레드 수만큼 종료 신호를 보냄
+        with stage._lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last and outbox is not None:
+            next_stage = self.stages[self.stages.index(stage) + 1]
+            for _ in range(next_stage.workers):
+                outbox.put(_DONE)
+
+    def _record_error(self, stage: PipelineStage, item: Any, error: Exception):
+        description = self.describe(item) if item is not None else ""
+        print(f"파이프라인 {stage.name} 단계 오류 ({description}): {error}")
+        with self._errors_lock:
+            self.errors.append({"stage": stage.name, "item": description, "error": str(error)})
@@ -0,0 +1,362 @@
+"""
+Notion 웹훅 수신 모듈
+페이지 변경 이벤트를 받아 같은 글의 연속 수정을 모은 뒤 해당 글만 동기화하도록 전달하는 기능 제공
+
+전체 데이터베이스를 조회하는 정기 동기화와 달리 이벤트가 가리키는 페이지만 처리하므로
+수정한 글이 1분 안에 반영됩니다. 동기화 함수는 한 스레드에서 차례로 실행되어 원장과
+콘텐츠 저장소에 동시에 기록하지 않습니다.
+"""
+import re
+import hmac
+import json
+import time
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import settings
+
+
+# 동기화 대상이 되는 이벤트 (페이지 생성/수정/이동/삭제/복원)
+PAGE_EVENT_PREFIX = "page."
+
+# 페이지 ID (하이픈 유무와 관계없이 32자리 16진수, Notion 페이지 URL 끝에 붙은 ID 포함)
+PAGE_ID = re.compile(r"([0-9a-fA-F]{8})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{4})-?([0-9a-fA-F]{12})(?![0-9a-fA-F])")
+
+
+def normalize_page_id(value: str) -> str:
+    """
+    페이지 ID나 Notion 페이지 URL을 하이픈이 있는 UUID 형식으로 변환
+
+    Args:
+        value (str): 페이지 ID (하이픈 유무 무관) 또는 페이지 URL
+
+    Returns:
+        str: 소문자 UUID 형식의 페이지 ID
+
+    Raises:
+        ValueError: 페이지 ID를 찾을 수 없는 경우
+    """
+    matches = PAGE_ID.findall(value.split("?")[0])
+    if not matches:
+        raise ValueError(f"페이지 ID를 찾을 수 없습니다: {value}")
+    return "-".join(matches[-1]).lower()
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """
+    Notion 웹훅 서명 (X-Notion-Signature 헤더 값)
+
+    Args:
+        body (bytes): 요청 본문
+        secret (str): 구독 생성 시 받은 verification_token
+
+    Returns:
+        str: "sha256=<HMAC-SHA256 16진수>"
+    """
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def event_page_ids(event: Dict) -> List[str]:
+    """
+    웹훅 이벤트에서 동기화할 페이지 ID 추출
+
+    Args:
+        event (Dict): Notion 웹훅 이벤트 ({"type": "page.content_updated", "entity": {"id", "type"}, ...})
+
+    Returns:
+        List[str]: 페이지 ID (페이지 이벤트가 아니면 빈 목록)
+    """
+    entity = event.get("entity") or {}
+    if not str(event.get("type", "")).startswith(PAGE_EVENT_PREFIX) or entity.get("type") != "page":
+        return []
+    try:
+        return [normalize_page_id(entity["id"])]
+    except (KeyError, TypeError, ValueError):
+        return []
+
+
+class PageEventDebouncer:
+    """
+    페이지별 이벤트 디바운서
+
+    마지막 이벤트 후 delay초 동안 추가 이벤트가 없거나 첫 이벤트 후 max_delay초가 지난 페이지를
+    모아 handler에 전달합니다. handler는 전용 스레드에서 한 번에 하나씩 실행되며,
+    실행 중에 들어온 이벤트는 다음 호출에 모입니다.
+
+    사용 예:
+        debouncer = PageEventDebouncer(workflow.sync_pages, delay=10)
+        debouncer.add(page_id)
+        debouncer.close()
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[str]], Any],
+        delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """
+        Args:
+            handler (Callable[[List[str]], Any]): 페이지 ID 목록을 받아 동기화하는 함수
+            delay (Optional[float]): 마지막 이벤트 후 대기 시간(초) (기본값: settings.WEBHOOK_DEBOUNCE_SECONDS)
+            max_delay (Optional[float]): 첫 이벤트 후 최대 대기 시간(초) (기본값: settings.WEBHOOK_MAX_DELAY_SECONDS)
+        """
+        self.handler = handler
+        self.delay = settings.WEBHOOK_DEBOUNCE_SECONDS if delay is None else delay
+        self.max_delay = max(self.delay, settings.WEBHOOK_MAX_DELAY_SECONDS if max_delay is None else max_delay)
+        self.batches = 0
+        self._pending: Dict[str, List[float]] = {}
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="webhook-debouncer", daemon=True)
+        self._thread.start()
+
+    def add(self, page_id: str):
+        """
+        페이지 이벤트 추가 (같은 페이지의 대기 시간 연장)
+
+        Args:
+            page_id (str): 페이지 ID
+        """
+        now = time.monotonic()
+        with self._condition:
+            if page_id in self._pending:
+                self._pending[page_id][1] = now
+            else:
+                self._pending[page_id] = [now, now]
+            self._condition.notify_all()
+
+    @property
+    def pending(self) -> List[str]:
+        """대기 중인 페이지 ID"""
+        with self._condition:
+            return list(self._pending)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 이벤트가 모두 처리될 때까지 대기
+
+        Args:
+            timeout (Optional[float]): 최대 대기 시간(초)
+
+        Returns:
+            bool: 모두 처리되었으면 True
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, flush: bool = True):
+        """
+        디바운서 종료
+
+        Args:
+            flush (bool): 대기 중인 이벤트를 기다리지 않고 바로 처리할지 여부
+        """
+        with self._condition:
+            if not flush:
+                self._pending.clear()
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _due(self, now: float) -> List[str]:
+        return [
+            page_id for page_id, (first, last) in self._pending.items()
+            if self._closed or now - last >= self.delay or now - first >= self.max_delay
+        ]
+
+    def _next_wait(self, now: float) -> Optional[float]:
+        if not self._pending:
+            return None
+        return max(0.0, min(
+            min(last + self.delay, first + self.max_delay) for first, last in self._pending.values()
+        ) - now)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    due = self._due(time.monotonic())
+                    if due or (self._closed and not self._pending):
+                        break
+                    self._condition.wait(self._next_wait(time.monotonic()))
+                if not due:
+                    return
+                for page_id in due:
+                    del self._pending[page_id]
+                self._busy = True
+
+            try:
+                self.handler(due)
+            except Exception as e:
+                print(f"웹훅 동기화 오류 ({', '.join(due)}): {e}")
+            finally:
+                with self._condition:
+                    self.batches += 1
+                    self._busy = False
+                    self._condition.notify_all()
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """웹훅 요청 처리"""
+
+    server: "_WebhookHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        # 상태 확인 (프록시/터널의 헬스 체크)
+        receiver = self.server.receiver
+        self._send_json({"status": "ok", "pending": receiver.debouncer.pending, **receiver.stats})
+
+    def do_POST(self):
+        receiver = self.server.receiver
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > settings.WEBHOOK_MAX_BODY_BYTES:
+            # 본문을 읽지 않고 연결을 닫음
+            receiver.count("rejected")
+            self.close_connection = True
+            self._send_json({"error": "invalid body size"}, 413 if length > 0 else 400)
+            return
+        body = self.rfile.read(length) if length else b""
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            receiver.count("rejected")
+            self._send_json({"error": "invalid json"}, 400)
+            return
+
+        if not receiver.secret:
+            # 구독 생성 시 한 번 오는 확인 요청만 받음: 토큰을 NOTION_WEBHOOK_SECRET에 설정한 뒤 다시 실행해야
+            # 서명을 검증할 수 있으므로, 그 전에는 누구나 보낼 수 있는 이벤트로 동기화(커밋/푸시)하지 않음
+            if isinstance(payload, dict) and "verification_token" in payload and "type" not in payload:
+                print(f"🔑 Notion 웹훅 확인 토큰을 받았습니다: {payload['verification_token']}")
+                self._send_json({"status": "ok"})
+                return
+            receiver.count("rejected")
+            self._send_json({"error": "webhook secret not configured"}, 401)
+            return
+
+        if not hmac.compare_digest(self.headers.get("X-Notion-Signature", ""), sign_payload(body, receiver.secret)):
+            receiver.count("rejected")
+            self._send_json({"error": "invalid signature"}, 401)
+            return
+
+        # 응답은 바로 보내고 동기화는 디바운서 스레드에서 실행 (Notion은 응답이 늦으면 재전송)
+        events = payload if isinstance(payload, list) else [payload]
+        page_ids = [page_id for event in events if isinstance(event, dict) for page_id in event_page_ids(event)]
+        for page_id in page_ids:
+            receiver.debouncer.add(page_id)
+        receiver.count("accepted" if page_ids else "ignored")
+        self._send_json({"status": "ok", "pages": page_ids}, 202 if page_ids else 200)
+
+    def _send_json(self, data: Dict, status: int = 200):
+        content = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    receiver: "WebhookReceiver"
+
+
+class WebhookReceiver:
+    """
+    Notion 웹훅 수신 서버
+
+    사용 예:
+        WebhookReceiver(workflow.sync_pages, port=8787).serve_forever()
+
+        # 테스트: 백그라운드 스레드에서 수신
+        with WebhookReceiver(handler, port=0, delay=0.1) as receiver:
+            post_page_event(receiver.url, page_id)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[str]], Any],
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        secret: Optional[str] = None,
+        delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """
+        Args:
+            handler (Callable[[List[str]], Any]): 페이지 ID 목록을 받아 동기화하는 함수
+            host (Optional[str]): 바인딩 주소 (기본값: settings.WEBHOOK_HOST)
+            port (Optional[int]): 포트 (기본값: settings.WEBHOOK_PORT, 0이면 빈 포트 자동 선택)
+            secret (Optional[str]): 서명 검증 토큰 (기본값: settings.NOTION_WEBHOOK_SECRET,
+                비어 있으면 구독 확인 요청만 받고 이벤트는 모두 거부)
+            delay (Optional[float]): 디바운스 대기 시간(초)
+            max_delay (Optional[float]): 첫 이벤트 후 최대 대기 시간(초)
+        """
+        host = settings.WEBHOOK_HOST if host is None else host
+        self.secret = settings.NOTION_WEBHOOK_SECRET if secret is None else secret
+        if not self.secret:
+            print(
+                "⚠️ NOTION_WEBHOOK_SECRET이 없어 구독 확인 요청만 받고 이벤트는 거부합니다. "
+                "출력되는 확인 토큰을 설정한 뒤 다시 실행하세요."
+            )
+        self.stats: Dict[str, int] = {"accepted": 0, "ignored": 0, "rejected": 0}
+        self._lock = threading.Lock()
+        self.debouncer = PageEventDebouncer(handler, delay, max_delay)
+        self._httpd = _WebhookHTTPServer(
+            (host, settings.WEBHOOK_PORT if port is None else port),
+            _WebhookHandler
+        )
+        self._httpd.receiver = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """수신 주소"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str):
+        """요청 수 집계"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def start(self) -> "WebhookReceiver":
+        """백그라운드 스레드에서 수신 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 수신 (Ctrl+C로 종료하면 대기 중인 이벤트를 처리한 뒤 종료)"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+            self.debouncer.close()
+
+    def stop(self):
+        """수신을 멈추고 대기 중인 이벤트 처리"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+        self.debouncer.close()
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
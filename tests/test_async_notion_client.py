@@ -0,0 +1,84 @@
+"""
+비동기 Notion 클라이언트 테스트
+여러 글의 블록 트리를 동시에 조회하고 렌더링하는지 검증
+"""
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+
+def make_paragraph(block_id, text, has_children=False):
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "has_children": has_children,
+        "last_edited_time": "2025-01-01T00:00:00.000Z",
+        "paragraph": {
+            "rich_text": [{"plain_text": text, "annotations": {"bold": False, "italic": False, "code": False}}]
+        }
+    }
+
+
+class TestAsyncNotionClient:
+    """AsyncNotionClient 테스트"""
+
+    @patch('async_notion_client.AsyncClient')
+    def test_render_posts_fetches_nested_blocks(self, mock_async_client):
+        """테스트: 여러 글의 중첩 블록을 조회해 입력 순서대로 렌더링하는지 확인"""
+        from async_notion_client import AsyncNotionClient
+
+        children = {
+            "post-1": [make_paragraph("a", "첫 글", has_children=True)],
+            "a": [make_paragraph("a1", "하위 단락")],
+            "post-2": [make_paragraph("b", "둘째 글")]
+        }
+
+        async def list_children(block_id, page_size, start_cursor=None):
+            return {"results": children[block_id], "has_more": False, "next_cursor": None}
+
+        mock_async_client.return_value.blocks.children.list = list_children
+        mock_async_client.return_value.aclose = AsyncMock()
+
+        client = AsyncNotionClient(concurrency=4)
+        posts = asyncio.run(client.render_posts([
+            {"id": "post-1", "slug": "first"},
+            {"id": "post-2", "slug": "second"}
+        ]))
+
+        assert [post["slug"] for post in posts] == ["first", "second"]
+        assert posts[0]["content"] == "첫 글\n\n하위 단락\n\n"
+        assert posts[0]["fetch_stats"]["api_calls"] == 2
+        assert posts[1]["content"] == "둘째 글\n\n"
+        mock_async_client.return_value.aclose.assert_awaited_once()
+
+    def test_sync_pipeline_uses_async_client(self, tmp_path, monkeypatch):
+        """테스트: --concurrency 2 이상이면 파이프라인 블록 조회 단계가 비동기 클라이언트로 실행되는지 확인"""
+        import threading
+        import request_scheduler
+        from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace
+        from config.settings import settings
+        from request_scheduler import RequestScheduler
+        from sync_notion import NotionSyncWorkflow
+        from snapshot import SnapshotReader
+
+        workspace = FakeNotionWorkspace(posts=4, blocks_per_post=6, images_per_post=0, draft_ratio=0, seed=5)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setitem(request_scheduler._schedulers, "notion", RequestScheduler(rate=1000, base_delay=0.01))
+        monkeypatch.setattr(settings, "SYNC_METRICS_PATH", str(tmp_path / "reports" / "sync_metrics.json"))
+
+        with FakeNotionServer(workspace) as server:
+            monkeypatch.setattr(settings, "NOTION_TOKEN", "secret_test")
+            monkeypatch.setattr(settings, "NOTION_DATABASE_ID", workspace.database_id)
+            monkeypatch.setattr(settings, "NOTION_API_BASE_URL", server.url)
+
+            workflow = NotionSyncWorkflow(concurrency=4)
+            workflow.git_manager.has_changes = lambda: False
+            summary = workflow.run_sync()
+
+        assert summary["success"], summary["errors"]
+        assert summary["posts_updated"] == 4
+        assert summary["stages"]["fetch"]["workers"] == 4
+        reader = SnapshotReader()
+        for listed in reader.fetch_published_posts():
+            assert reader.get_post_by_slug(listed["slug"])["content"]
+        assert not any(thread.name == "notion-async" for thread in threading.enumerate())
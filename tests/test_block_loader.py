@@ -0,0 +1,46 @@
+"""
+블록 트리 로더 테스트
+페이지네이션과 중첩 블록 조회를 검증
+"""
+from unittest.mock import Mock
+
+
+def make_block(block_id, has_children=False):
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "has_children": has_children,
+        "paragraph": {"rich_text": [{"plain_text": block_id}]}
+    }
+
+
+class TestBlockTreeLoader:
+    """BlockTreeLoader 테스트"""
+
+    def test_load_follows_pagination_and_children(self):
+        """테스트: 페이지네이션과 하위 블록을 모두 조회하는지 확인"""
+        from block_loader import BlockTreeLoader
+
+        pages = {
+            ("page", None): {"results": [make_block("a"), make_block("b", True)], "has_more": True, "next_cursor": "c1"},
+            ("page", "c1"): {"results": [make_block("c")], "has_more": False, "next_cursor": None},
+            ("b", None): {"results": [make_block("b1", True)], "has_more": False, "next_cursor": None},
+            ("b1", None): {"results": [make_block("b1a")], "has_more": False, "next_cursor": None}
+        }
+
+        client = Mock()
+        client.blocks.children.list.side_effect = (
+            lambda block_id, page_size, start_cursor=None: pages[(block_id, start_cursor)]
+        )
+
+        loader = BlockTreeLoader(client, max_workers=2)
+        tree = loader.load("page")
+
+        assert [block["id"] for block in tree] == ["a", "b", "c"]
+        assert tree[1]["children"][0]["id"] == "b1"
+        assert tree[1]["children"][0]["children"][0]["id"] == "b1a"
+        assert "children" not in tree[0]
+
+        assert loader.last_stats["api_calls"] == 4
+        assert loader.last_stats["blocks"] == 5
+        assert loader.last_stats["max_depth"] == 2
@@ -0,0 +1,95 @@
+"""
+블록 렌더러 테스트
+블록 타입별 핸들러, 중첩/번호 목록, 지원하지 않는 블록 처리 검증
+"""
+from block_renderer import BlockRenderer, list_numbers
+
+
+def make_block(block_type, text="", children=None, block_id=None, **data):
+    """테스트용 블록 생성"""
+    block = {
+        "id": block_id or f"{block_type}-{text}",
+        "type": block_type,
+        block_type: {"rich_text": [{"plain_text": text}] if text else [], **data}
+    }
+    if children:
+        block["children"] = children
+    return block
+
+
+class TestBlockRenderer:
+    """BlockRenderer 테스트"""
+
+    def test_numbered_list_counts_and_restarts(self):
+        """테스트: 번호 목록이 차례로 번호를 매기고 다른 블록 뒤에서 다시 시작하는지 확인"""
+        blocks = [
+            make_block("numbered_list_item", "하나"),
+            make_block("numbered_list_item", "둘"),
+            make_block("paragraph", "단락"),
+            make_block("numbered_list_item", "다시 하나"),
+        ]
+
+        markdown = BlockRenderer().render(blocks)
+
+        assert markdown == "1. 하나\n\n2. 둘\n\n단락\n\n1. 다시 하나"
+        assert list(list_numbers(blocks).values()) == [1, 2, 1]
+
+    def test_nested_lists_are_indented(self):
+        """테스트: 중첩 목록이 깊이마다 들여 쓰이고 하위 번호가 따로 매겨지는지 확인"""
+        blocks = [
+            make_block("numbered_list_item", "상위", children=[
+                make_block("numbered_list_item", "하위 1"),
+                make_block("bulleted_list_item", "하위 글머리", children=[
+                    make_block("code", "print(1)\nprint(2)", language="python"),
+                ]),
+            ]),
+            make_block("numbered_list_item", "다음"),
+        ]
+
+        markdown = BlockRenderer().render(blocks)
+
+        assert markdown == (
+            "1. 상위\n\n"
+            "    1. 하위 1\n\n"
+            "    - 하위 글머리\n\n"
+            "        ```python\n        print(1)\n        print(2)\n        ```\n\n"
+            "2. 다음"
+        )
+
+    def test_unknown_and_registered_types(self):
+        """테스트: 지원하지 않는 블록은 집계 후 텍스트로 출력되고, 등록한 핸들러가 사용되는지 확인"""
+        renderer = BlockRenderer()
+        blocks = [
+            make_block("synced_block", "동기화된 텍스트"),
+            make_block("table_of_contents"),
+        ]
+
+        ctx = renderer.render_context(blocks)
+        assert ctx.markdown == "동기화된 텍스트"
+        assert ctx.unknown_types == {"synced_block": 1, "table_of_contents": 1}
+
+        renderer.register("table_of_contents", lambda block, data, ctx: "[목차]")
+        assert renderer.render(blocks) == "동기화된 텍스트\n\n[목차]"
+
+    def test_first_number_for_partial_render(self):
+        """테스트: 일부 블록만 렌더링할 때 시작 번호를 지정할 수 있는지 확인"""
+        block = make_block("numbered_list_item", "셋째")
+
+        assert BlockRenderer().render([block], first_number=3) == "3. 셋째"
+
+    def test_iter_sections_splits_at_headings(self):
+        """테스트: 제목 블록마다 섹션이 나뉘고 이어 붙이면 render 결과와 같은지 확인"""
+        blocks = [
+            make_block("paragraph", "머리말"),
+            make_block("heading_2", "첫 섹션"),
+            make_block("numbered_list_item", "하나"),
+            make_block("numbered_list_item", "둘"),
+            make_block("heading_2", "둘째 섹션"),
+            make_block("paragraph", "본문"),
+        ]
+        renderer = BlockRenderer()
+
+        sections = list(renderer.iter_sections(iter(blocks)))
+
+        assert sections == ["머리말", "## 첫 섹션\n\n1. 하나\n\n2. 둘", "## 둘째 섹션\n\n본문"]
+        assert "\n\n".join(sections) == renderer.render(blocks)
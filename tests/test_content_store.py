@@ -0,0 +1,96 @@
+"""
+콘텐츠 저장소 테스트
+SQLite 저장소의 저장, 조회, 갱신을 검증
+"""
+
+
+def make_post(page_id, slug, published_date, tags, content="본문"):
+    return {
+        "id": page_id,
+        "title": f"{slug} 제목",
+        "slug": slug,
+        "status": "Published",
+        "published_date": published_date,
+        "tags": tags,
+        "meta_description": "",
+        "last_edited": "2025-01-21T10:00:00.000Z",
+        "content": content,
+        "images": [{"source_url": "https://notion.so/a.png", "path": "images/a.png"}]
+    }
+
+
+class TestContentStore:
+    """ContentStore 테스트"""
+
+    def test_upsert_and_get_by_slug(self, tmp_path):
+        """테스트: 저장한 글을 슬러그로 조회하는지 확인"""
+        from content_store import ContentStore
+
+        store = ContentStore(str(tmp_path / "content.db"))
+        store.upsert_post(make_post("p1", "first", "2025-01-01", ["Python"]))
+
+        post = store.get_post_by_slug("first")
+        assert post["id"] == "p1"
+        assert post["content"] == "본문"
+        assert post["tags"] == ["Python"]
+        assert post["images"][0]["path"] == "images/a.png"
+        assert store.get_post_by_slug("missing") is None
+
+    def test_upsert_replaces_existing_post(self, tmp_path):
+        """테스트: 같은 페이지를 다시 저장하면 갱신되는지 확인"""
+        from content_store import ContentStore
+
+        store = ContentStore(str(tmp_path / "content.db"))
+        store.upsert_post(make_post("p1", "first", "2025-01-01", ["Python"]))
+        store.upsert_post(make_post("p1", "renamed", "2025-01-01", ["Notion"], content="수정"))
+
+        assert store.count() == 1
+        assert store.get_post_by_slug("first") is None
+        assert store.get_post_by_slug("renamed")["content"] == "수정"
+        assert store.list_posts(tag="Python") == []
+
+    def test_list_posts_orders_and_filters(self, tmp_path):
+        """테스트: 발행일 역순 정렬과 태그 필터가 동작하는지 확인"""
+        from content_store import ContentStore
+
+        store = ContentStore(str(tmp_path / "content.db"))
+        store.upsert_post(make_post("p1", "old", "2025-01-01", ["Python"]))
+        store.upsert_post(make_post("p2", "new", "2025-02-01", ["Python", "Notion"]))
+        store.upsert_post(make_post("p3", "draft", None, []))
+
+        assert [post["slug"] for post in store.list_posts()] == ["new", "old", "draft"]
+        assert [post["slug"] for post in store.list_posts(tag="Notion")] == ["new"]
+        assert [post["slug"] for post in store.list_posts(limit=1)] == ["new"]
+        assert "content" not in store.list_posts()[0]
+
+    def test_migrates_existing_fragment_table(self, tmp_path):
+        """테스트: 이전 스키마의 block_fragments 테이블에 새 컬럼이 추가되는지 확인"""
+        import sqlite3
+        from content_store import ContentStore
+
+        path = tmp_path / "content.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE block_fragments (block_id TEXT PRIMARY KEY, page_id TEXT NOT NULL, "
+                "last_edited_time TEXT NOT NULL, markdown TEXT NOT NULL, "
+                "images TEXT NOT NULL DEFAULT '[]', rendered_at TEXT NOT NULL)"
+            )
+            conn.execute("INSERT INTO block_fragments VALUES ('b1', 'p1', 't', '1. 가', '[]', 'r')")
+
+        store = ContentStore(str(path))
+
+        assert store.get_fragments("p1")["b1"]["list_number"] is None
+
+    def test_stores_prerendered_html(self, tmp_path):
+        """테스트: 사전 렌더링한 HTML이 본문과 함께 저장되고 목록에는 포함되지 않는지 확인"""
+        from content_store import ContentStore
+
+        store = ContentStore(str(tmp_path / "content.db"))
+        toc = [{"id": None, "level": 0, "title": "", "start": 0, "end": 2, "html_start": 0, "html_end": 9}]
+        store.upsert_post({**make_post("p1", "first", "2025-01-01", []), "html": "<p>본문</p>", "toc": toc})
+        store.upsert_post(make_post("p2", "second", "2025-01-02", []))
+
+        assert store.get_post_by_slug("first")["html"] == "<p>본문</p>"
+        assert store.get_post_by_slug("first")["toc"] == toc
+        assert "html" not in store.get_post_by_slug("second")
+        assert all("html" not in post and "toc" not in post for post in store.list_posts())
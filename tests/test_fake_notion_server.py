@@ -0,0 +1,78 @@
+"""
+가짜 Notion API 서버 테스트
+벤치마크용 로컬 서버에 NotionClient를 연결해 실제 HTTP 경로를 검증
+"""
+import pytest
+
+from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace
+
+
+@pytest.fixture
+def fake_notion(monkeypatch):
+    """가짜 서버를 띄우고 설정을 연결"""
+    from config.settings import settings
+
+    workspace = FakeNotionWorkspace(posts=5, blocks_per_post=12, images_per_post=0, draft_ratio=0, seed=1)
+    with FakeNotionServer(workspace, rate_limit_every=3, retry_after="0") as server:
+        monkeypatch.setattr(settings, "NOTION_TOKEN", "secret_test")
+        monkeypatch.setattr(settings, "NOTION_DATABASE_ID", workspace.database_id)
+        monkeypatch.setattr(settings, "NOTION_API_BASE_URL", server.url)
+        yield server
+
+
+class TestFakeNotionServer:
+    """가짜 Notion API 서버 테스트"""
+
+    def _client(self):
+        from notion_client import NotionClient
+        from request_scheduler import RequestScheduler
+
+        client = NotionClient()
+        client.store = None
+        client.scheduler = RequestScheduler(rate=1000, base_delay=0.01)
+        return client
+
+    def test_paginated_query_with_rate_limits(self, fake_notion):
+        """테스트: 페이지네이션과 429 응답 재시도를 거쳐 모든 글을 조회하는지 확인"""
+        client = self._client()
+
+        posts = list(client.iter_published_posts(page_size=2))
+
+        assert len(posts) == 5
+        assert [post["published_date"] for post in posts] == sorted(
+            (post["published_date"] for post in posts), reverse=True
+        )
+        assert fake_notion.stats["databases.query"] == 3
+        assert fake_notion.stats["rate_limited"] >= 1
+
+    def test_render_post_with_nested_blocks(self, fake_notion):
+        """테스트: 중첩 목록 블록까지 조회해 마크다운으로 변환하는지 확인"""
+        client = self._client()
+        post = client.get_post_by_slug("benchmark-post-1")
+
+        assert post["title"] == "벤치마크 글 1"
+        assert post["fetch_stats"]["max_depth"] == 1
+        assert "\n    - " in post["content"]
+        assert "```python" in post["content"]
+
+    def test_iter_post_sections_matches_full_render(self, fake_notion):
+        """테스트: 섹션 단위 스트리밍 결과가 전체 렌더링과 같은지 확인"""
+        client = self._client()
+        full = client.get_post_by_slug("benchmark-post-2")
+
+        post = client.find_post_by_slug("benchmark-post-2")
+        assert "content" not in post
+
+        sections = list(client.iter_post_sections(post))
+
+        assert len(sections) > 1
+        assert sections[1].startswith("#")
+        assert post["content"] == full["content"]
+
+    def test_get_post_by_page_id(self, fake_notion):
+        """테스트: 페이지 ID로 글 속성을 조회하고 없는 페이지는 None을 반환하는지 확인"""
+        client = self._client()
+        first = next(client.iter_published_posts())
+
+        assert client.get_post(first["id"]) == first
+        assert client.get_post("00000000-0000-0000-0000-000000000000") is None
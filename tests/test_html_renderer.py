@@ -0,0 +1,116 @@
+"""
+HTML 사전 렌더링 테스트
+BlockRenderer 마크다운의 HTML 변환, 이스케이프, 제목 앵커, 섹션 색인 검증
+"""
+from block_renderer import BlockRenderer
+from html_renderer import HtmlRenderer, prerender_post, render_post_html, render_inline
+from tests.test_block_renderer import make_block
+
+
+class TestHtmlRenderer:
+    """HtmlRenderer 테스트"""
+
+    def test_nested_lists_and_code(self):
+        """테스트: 중첩 목록과 목록 안의 코드 블록이 HTML 구조로 변환되는지 확인"""
+        blocks = [
+            make_block("numbered_list_item", "상위", children=[
+                make_block("bulleted_list_item", "하위", children=[
+                    make_block("code", "a = 1\n\nb = 2", language="python"),
+                ]),
+            ]),
+            make_block("numbered_list_item", "다음"),
+            make_block("to_do", "할 일", checked=True),
+        ]
+
+        html = HtmlRenderer().render(BlockRenderer().render(blocks))
+
+        assert html.startswith("<ol><li>상위<ul><li>하위<")
+        assert "<pre" in html and "</li></ul></li><li>다음</li></ol>" in html
+        assert "<ul><li>☑ 할 일</li></ul>" in html
+
+    def test_headings_get_unique_anchors(self):
+        """테스트: 제목에 앵커 ID가 붙고 같은 제목은 번호로 구분되는지 확인"""
+        html = HtmlRenderer().render("## 시작 **하기**\n\n본문\n\n## 시작 하기")
+
+        assert '<h2 id="시작-하기">시작 <strong>하기</strong>' in html
+        assert 'id="시작-하기-2"' in html
+        assert 'href="#시작-하기"' in html
+
+    def test_inline_markup_is_escaped_and_sanitized(self):
+        """테스트: 원본 HTML은 이스케이프되고 허용되지 않는 링크는 제거되는지 확인"""
+        html = render_inline("<script>x</script> `<b>` [링크](javascript:alert) :red[**빨강**]")
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "<code>&lt;b&gt;</code>" in html
+        assert "javascript" not in html.split("링크")[0]
+        assert "<a " not in html
+        assert '<span style="color:#ff4b4b"><strong>빨강</strong></span>' in html
+
+    def test_urls_are_escaped_once(self):
+        """테스트: 링크와 이미지 URL의 쿼리 문자열 &가 한 번만 이스케이프되는지 확인"""
+        html = render_inline("[링크](https://x/?a=1&b=2) ![그림](https://x/i.png?a=1&b=2)")
+
+        assert 'href="https://x/?a=1&amp;b=2"' in html
+        assert 'src="https://x/i.png?a=1&amp;b=2"' in html
+        assert "&amp;amp;" not in html
+
+    def test_unknown_color_markers_are_kept(self):
+        """테스트: Streamlit 색상 이름이 아닌 :word[...]는 그대로 남는지 확인"""
+        assert render_inline("Time 10:30[note] foo:bar[baz]") == "Time 10:30[note] foo:bar[baz]"
+        assert render_inline(":blue-background[강조]") == '<span style="background-color:#1c83e133">강조</span>'
+
+    def test_images_get_lazy_loading_attributes(self):
+        """테스트: 이미지에 대체 텍스트와 지연 로딩 속성이 붙는지 확인"""
+        html = render_post_html("![표지](/images/p1/cover.png)")
+
+        assert html == (
+            '<figure><img src="/images/p1/cover.png" alt="표지" loading="lazy" decoding="async" '
+            'style="max-width:100%;height:auto"></figure>'
+        )
+
+    def test_equation_blocks_fall_back_to_markdown(self):
+        """테스트: 수식 블록이 있으면 HTML을 만들지 않는지 확인"""
+        assert render_post_html("본문\n\n$$\nx^2\n$$") is None
+        assert render_post_html("   ") is None
+
+    def test_toc_offsets_slice_sections(self):
+        """테스트: 목차의 HTML/마크다운 위치로 섹션 경계를 잘라낼 수 있는지 확인"""
+        markdown = "머리말\n\n## 첫 **장**\n\n- 항목\n\n    ## 목록 안\n\n### 절\n\n본문\n\n## 첫 장"
+
+        html, toc = prerender_post(markdown)
+
+        assert html == HtmlRenderer().render(markdown)
+        assert [(s["id"], s["level"], s["title"]) for s in toc] == [
+            (None, 0, ""), ("첫-장", 2, "첫 장"), ("절", 3, "절"), ("첫-장-2", 2, "첫 장")
+        ]
+        assert html[:toc[1]["html_end"]].endswith("</ul>")
+        assert html[toc[2]["html_start"]:].startswith('<h3 id="절">')
+        assert markdown[toc[2]["start"]:toc[2]["end"]] == "### 절\n\n본문\n\n"
+
+    def test_toc_without_html_for_equations(self):
+        """테스트: HTML로 변환할 수 없는 글도 마크다운 위치가 담긴 목차를 만드는지 확인"""
+        html, toc = prerender_post("## 수식\n\n$$\nx^2\n$$\n\n## 끝")
+
+        assert html is None
+        assert [s["id"] for s in toc] == ["수식", "끝"]
+        assert "html_end" not in toc[0] and toc[1]["start"] == 18
+
+    def test_optimized_images_use_picture(self):
+        """테스트: 최적화 변형이 있는 이미지는 srcset과 크기가 지정된 <picture>로 출력되는지 확인"""
+        base = "https://example.com/images/ab/"
+        images = [{
+            "url": base + "a-960w.webp", "width": 2000, "height": 1000,
+            "variants": [
+                {"url": base + "a-480w.webp", "width": 480, "format": "webp"},
+                {"url": base + "a-960w.webp", "width": 960, "format": "webp"},
+                {"url": base + "a-480w.avif", "width": 480, "format": "avif"},
+            ]
+        }]
+
+        html, _ = prerender_post(f"![구조]({base}a-960w.webp)", images)
+
+        assert html.startswith('<figure><picture><source type="image/avif" srcset="' + base + 'a-480w.avif 480w"')
+        assert f'src="{base}a-960w.webp"' in html
+        assert f'srcset="{base}a-480w.webp 480w, {base}a-960w.webp 960w"' in html
+        assert 'width="2000" height="1000"' in html
@@ -0,0 +1,34 @@
+"""
+공유 HTTP 세션 테스트
+연결 풀이 프로세스 전역에서 재사용되는지 검증
+"""
+from unittest.mock import patch
+
+
+class TestHttpSession:
+    """http_session 모듈 테스트"""
+
+    def test_http_client_is_shared(self):
+        """테스트: 같은 HTTP 클라이언트를 반환하고 닫으면 새로 만드는지 확인"""
+        from http_session import get_http_client, close_http_client
+
+        first = get_http_client()
+        assert get_http_client() is first
+
+        close_http_client()
+        second = get_http_client()
+        assert second is not first
+        assert not second.is_closed
+
+    @patch('notion_client.Client')
+    def test_notion_client_uses_shared_pool(self, mock_notion_client):
+        """테스트: Notion 클라이언트가 연결 풀은 공유하되 이미지 다운로드용 클라이언트와 분리되는지 확인"""
+        from notion_client import NotionClient
+        from http_session import get_http_client, get_http_transport
+
+        NotionClient()
+
+        notion_http = mock_notion_client.call_args.kwargs["client"]
+        assert notion_http is not get_http_client()
+        assert notion_http._transport is get_http_transport()
+        assert get_http_client()._transport is get_http_transport()
@@ -0,0 +1,108 @@
+"""
+이미지 다운로더 테스트
+스트리밍 저장, 내용 해시 경로, 매니페스트, 동시 다운로드, 다운로드 통계 검증
+"""
+import hashlib
+import threading
+
+import httpx
+
+from image_downloader import ImageDownloader
+from request_scheduler import RequestScheduler
+
+
+PNG = b"\x89PNG\r\n" + b"x" * 200_000
+
+
+def make_downloader(tmp_path, handler, workers=4):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    scheduler = RequestScheduler(rate=1000, max_retries=0)
+    return ImageDownloader(workers=workers, image_dir=str(tmp_path / "images"), client=client, scheduler=scheduler)
+
+
+class TestImageDownloader:
+    """ImageDownloader 테스트"""
+
+    def test_streams_to_hashed_path(self, tmp_path):
+        """테스트: 본문을 내용 해시 경로에 저장하고 임시 파일을 남기지 않는지 확인"""
+        downloader = make_downloader(
+            tmp_path, lambda request: httpx.Response(200, headers={"content-type": "image/png"}, content=PNG)
+        )
+
+        first = downloader.download("https://example.com/a.png?sig=1", "page")
+        copy = downloader.download("https://example.com/copy-of-a.png?sig=1", "page")
+
+        content_hash = hashlib.md5(PNG).hexdigest()[:16]
+        assert first == copy == str(tmp_path / "images" / content_hash[:2] / f"{content_hash}.png")
+        with open(first, "rb") as f:
+            assert f.read() == PNG
+        assert not [path for path in (tmp_path / "images").rglob(".download-*")]
+
+        summary = downloader.summary()
+        assert (summary["downloaded"], summary["existing"], summary["failed"]) == (1, 1, 0)
+        assert summary["bytes"] == 2 * len(PNG)
+        assert [record["status"] for record in downloader.recent] == ["downloaded", "existing"]
+
+    def test_manifest_skips_known_images(self, tmp_path):
+        """테스트: 매니페스트에 있는 원본은 서명이 바뀌어도 다시 내려받지 않는지 확인"""
+        downloader = make_downloader(
+            tmp_path, lambda request: httpx.Response(200, headers={"content-type": "image/png"}, content=PNG)
+        )
+        path = downloader.download("https://example.com/ws/file/a.png?X-Amz-Signature=1", "page")
+        downloader.close()
+
+        def offline(request):
+            raise AssertionError("네트워크 요청이 없어야 합니다")
+
+        reloaded = make_downloader(tmp_path, offline)
+
+        assert reloaded.download("https://example.com/ws/file/a.png?X-Amz-Signature=2", "page") == path
+        assert reloaded.summary()["cached"] == 1
+
+    def test_reuses_files_saved_before_manifest(self, tmp_path):
+        """테스트: 매니페스트 도입 전 연/월 경로에 저장된 같은 내용의 파일을 재사용하는지 확인"""
+        content_hash = hashlib.md5(PNG).hexdigest()[:16]
+        legacy = tmp_path / "images" / "2025" / "01" / f"{content_hash}.png"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(PNG)
+
+        downloader = make_downloader(
+            tmp_path, lambda request: httpx.Response(200, headers={"content-type": "image/png"}, content=PNG)
+        )
+
+        assert downloader.download("https://example.com/a.png", "page") == legacy.as_posix()
+        assert downloader.summary()["existing"] == 1
+        assert [path.name for path in (tmp_path / "images").rglob("*.png")] == [legacy.name]
+
+    def test_failed_download_leaves_no_file(self, tmp_path):
+        """테스트: 실패한 다운로드는 None을 반환하고 파일을 남기지 않는지 확인"""
+        downloader = make_downloader(tmp_path, lambda request: httpx.Response(404))
+
+        assert downloader.download("https://example.com/missing.png", "page") is None
+        assert not [path for path in (tmp_path / "images").rglob("*") if path.is_file()]
+        assert downloader.summary()["failed"] == 1
+
+    def test_download_all_is_bounded_and_deduplicated(self, tmp_path):
+        """테스트: 같은 URL은 한 번만 받고 동시 다운로드 수가 workers를 넘지 않는지 확인"""
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0, "requests": 0}
+
+        def handler(request):
+            with lock:
+                active["now"] += 1
+                active["requests"] += 1
+                active["max"] = max(active["max"], active["now"])
+            threading.Event().wait(0.02)
+            with lock:
+                active["now"] -= 1
+            return httpx.Response(200, headers={"content-type": "image/gif"}, content=request.url.path.encode())
+
+        downloader = make_downloader(tmp_path, handler, workers=2)
+        urls = [f"https://example.com/{i}.gif" for i in range(6)] + ["https://example.com/0.gif"]
+
+        paths = downloader.download_all(urls, "page")
+        downloader.close()
+
+        assert len(paths) == 6 and all(path.endswith(".gif") for path in paths.values())
+        assert active["requests"] == 6
+        assert active["max"] <= 2
@@ -0,0 +1,83 @@
+"""
+이미지 정리 테스트
+참조 집계, 참조되지 않는 이미지 삭제, 매니페스트/LFS 규칙 정리 검증
+"""
+from content_store import ContentStore
+from config.settings import settings
+from image_assets import IMAGE_BASE_URL, LFS_BASE_URL, ImageManifest, lfs_tracked_paths, public_image_url
+from image_gc import collect_garbage
+from tests.test_content_store import make_post
+
+
+class TestImageGarbageCollection:
+    """collect_garbage 테스트"""
+
+    def test_removes_unreferenced_images(self, tmp_path, monkeypatch):
+        """테스트: 글 이미지 목록과 본문에서 참조하지 않는 파일만 삭제하고 확보한 용량을 보고하는지 확인"""
+        monkeypatch.chdir(tmp_path)
+        for name, size in [
+            ("images/aa/aa00000000000000.png", 100),
+            ("images/aa/aa00000000000000-480w.webp", 10),
+            ("images/2025/01/bb00000000000000.gif", 200),
+            ("images/cc/cc00000000000000.png", 300),
+            ("images/cc/cc00000000000000-480w.webp", 30),
+        ]:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_bytes(b"x" * size)
+        (tmp_path / "images" / "README.md").write_text("이미지")
+
+        manifest = ImageManifest("images/manifest.json")
+        manifest.record("s3/c.png", "cc00000000000000", "images/cc/cc00000000000000.png", 300)
+        manifest.record("s3/a.png", "aa00000000000000", "images/aa/aa00000000000000.png", 100)
+
+        store = ContentStore(str(tmp_path / "content.db"))
+        store.upsert_post({
+            **make_post("p1", "first", "2025-01-01", []),
+            "images": [{
+                "path": "images/aa/aa00000000000000.png",
+                "variants": [{"path": "images/aa/aa00000000000000-480w.webp"}]
+            }]
+        })
+        store.upsert_post({
+            **make_post("p2", "legacy", "2025-01-02", [],
+                        content=f"![그림]({IMAGE_BASE_URL}images/2025/01/bb00000000000000.gif)"),
+            "images": []
+        })
+
+        report = collect_garbage(store, "images", manifest)
+
+        assert report["orphaned"] == 2 and report["referenced"] == 3
+        assert report["reclaimed_bytes"] == 330
+        assert not (tmp_path / "images" / "cc").exists()
+        assert (tmp_path / "images" / "README.md").exists()
+        assert list(manifest.sources) == ["s3/a.png"]
+
+    def test_skips_when_store_is_empty(self, tmp_path):
+        """테스트: 저장된 글이 없으면 아무 파일도 삭제하지 않는지 확인"""
+        image = tmp_path / "images" / "aa" / "aa00000000000000.png"
+        image.parent.mkdir(parents=True)
+        image.write_bytes(b"x")
+
+        report = collect_garbage(ContentStore(str(tmp_path / "content.db")), str(tmp_path / "images"))
+
+        assert report["orphaned"] == 0
+        assert image.exists()
+
+    def test_large_images_use_lfs(self, tmp_path, monkeypatch):
+        """테스트: 기준보다 큰 이미지는 LFS 규칙에 추가되고 삭제되면 규칙도 제거되는지 확인"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(settings, "IMAGE_LFS_MIN_BYTES", 1000)
+        large = tmp_path / "images" / "dd" / "dd00000000000000.gif"
+        large.parent.mkdir(parents=True)
+        large.write_bytes(b"x" * 2000)
+        (tmp_path / "images" / "dd" / "dd00000000000000-480w.webp").write_bytes(b"x" * 10)
+
+        assert public_image_url("images/dd/dd00000000000000.gif") == LFS_BASE_URL + "images/dd/dd00000000000000.gif"
+        assert public_image_url("images/dd/dd00000000000000-480w.webp").startswith(IMAGE_BASE_URL)
+        assert lfs_tracked_paths() == ["images/dd/dd00000000000000.gif"]
+
+        store = ContentStore(str(tmp_path / "content.db"))
+        store.upsert_post({**make_post("p1", "first", "2025-01-01", []), "images": []})
+        collect_garbage(store, "images")
+
+        assert lfs_tracked_paths() == []
@@ -0,0 +1,65 @@
+"""
+이미지 최적화 테스트
+너비별 WebP 변형 생성, 메타데이터 제거, 매니페스트 기록, 에셋 리졸버 연동 검증
+"""
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from image_assets import ImageAssetResolver, ImageManifest
+from image_optimizer import ImageOptimizer, optimize_image
+
+
+def make_png(path, width, height):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    exif = Image.Exif()
+    exif[0x010F] = "Camera"  # Make
+    Image.new("RGB", (width, height), (200, 80, 40)).save(path, exif=exif)
+    return str(path)
+
+
+class TestImageOptimizer:
+    """ImageOptimizer 테스트"""
+
+    def test_variants_are_capped_and_stripped(self, tmp_path):
+        """테스트: 원본보다 큰 너비는 만들지 않고 변형에서 EXIF가 제거되는지 확인"""
+        path = make_png(tmp_path / "ab" / "ab12345678901234.png", 1200, 600)
+
+        info = optimize_image(path, [480, 960, 1600], ["webp"])
+
+        assert (info["width"], info["height"]) == (1200, 600)
+        assert [(v["width"], v["height"]) for v in info["variants"]] == [(480, 240), (960, 480), (1200, 600)]
+        assert info["variants"][0]["path"].endswith("ab12345678901234-480w.webp")
+        with Image.open(info["variants"][1]["path"]) as variant:
+            assert variant.format == "WEBP" and variant.size == (960, 480)
+            assert not variant.getexif()
+
+    def test_describe_records_manifest_and_default_variant(self, tmp_path):
+        """테스트: 변형 정보가 매니페스트에 기록되고 리졸버가 기본 변형 URL을 반환하는지 확인"""
+        path = make_png(tmp_path / "ab" / "ab12345678901234.png", 2000, 1000)
+        manifest = ImageManifest(str(tmp_path / "manifest.json"))
+        optimizer = ImageOptimizer(manifest, widths=[480, 960, 1600], formats=["webp"], enabled=True)
+
+        images = []
+        resolver = ImageAssetResolver(lambda url, page_id: path, "page", images, describe=optimizer.describe)
+        url = resolver("b1", "https://prod-files-secure.s3.amazonaws.com/ws/a.png?sig=1", "그림")
+
+        assert url.endswith("ab12345678901234-960w.webp")
+        assert (images[0]["width"], images[0]["height"]) == (2000, 1000)
+        assert [v["width"] for v in images[0]["variants"]] == [480, 960, 1600]
+        assert manifest.get_variants("ab12345678901234")["width"] == 2000
+
+    def test_optimize_all_uses_process_pool(self, tmp_path):
+        """테스트: 여러 이미지를 프로세스 풀에서 최적화하는지 확인"""
+        paths = [make_png(tmp_path / "ab" / f"ab1234567890123{i}.png", 640, 320) for i in range(3)]
+        optimizer = ImageOptimizer(
+            ImageManifest(str(tmp_path / "manifest.json")), workers=2, widths=[480], formats=["webp"], enabled=True
+        )
+
+        try:
+            results = optimizer.optimize_all(paths)
+        finally:
+            optimizer.close()
+
+        assert sorted(results) == sorted(paths)
+        assert all(info["variants"][0]["width"] == 480 for info in results.values())
@@ -53,6 +53,40 @@ class TestNotionClient:
         assert posts[0]["status"] == "Published"
         assert posts[0]["tags"] == ["Python", "Notion"]
     
+    @patch('notion_client.Client')
+    def test_iter_published_posts_follows_cursor(self, mock_notion_client):
+        """테스트: next_cursor를 따라 모든 페이지를 순회하는지 확인"""
+        from notion_client import NotionClient
+        
+        def make_page(page_id):
+            return {
+                "id": page_id,
+                "last_edited_time": "2025-01-01T00:00:00.000Z",
+                "properties": {
+                    "제목": {"title": [{"plain_text": page_id}]},
+                    "슬러그": {"rich_text": [{"plain_text": page_id}]}
+                }
+            }
+        
+        mock_query = mock_notion_client.return_value.databases.query
+        mock_query.side_effect = [
+            {"results": [make_page("p1"), make_page("p2")], "has_more": True, "next_cursor": "c1"},
+            {"results": [make_page("p3")], "has_more": False, "next_cursor": None}
+        ]
+        
+        client = NotionClient()
+        posts = list(client.iter_published_posts(page_size=2, properties=["제목", "슬러그"]))
+        
+        assert [post["slug"] for post in posts] == ["p1", "p2", "p3"]
+        assert mock_query.call_count == 2
+        
+        first_call = mock_query.call_args_list[0].kwargs
+        second_call = mock_query.call_args_list[1].kwargs
+        assert first_call["page_size"] == 2
+        assert first_call["filter_properties"] == ["제목", "슬러그"]
+        assert "start_cursor" not in first_call
+        assert second_call["start_cursor"] == "c1"
+    
     @patch('notion_client.Client')
     def test_get_post_by_slug(self, mock_notion_client):
         """테스트: 슬러그로 특정 글을 조회하는지 확인"""
@@ -135,4 +169,234 @@ class TestNotionClient:
         
         # GitHub URL로 변경되었는지 확인
         assert "https://raw.githubusercontent.com/" in processed
-        assert "prod-files-secure.s3.amazonaws.com" not in processed
\ No newline at end of file
+        assert "prod-files-secure.s3.amazonaws.com" not in processed
+
+
+    @patch('notion_client.Client')
+    def test_get_post_by_slug_reads_from_store(self, mock_notion_client, tmp_path):
+        """테스트: 콘텐츠 저장소에 있는 글은 API 호출 없이 반환하는지 확인"""
+        from notion_client import NotionClient
+        from content_store import ContentStore
+        
+        store = ContentStore(str(tmp_path / "content.db"))
+        store.upsert_post({
+            "id": "test-id-1",
+            "title": "저장된 글",
+            "slug": "stored-post",
+            "tags": [],
+            "last_edited": "2025-01-21T10:00:00.000Z",
+            "content": "저장된 본문"
+        })
+        
+        client = NotionClient(store=store)
+        post = client.get_post_by_slug("stored-post")
+        
+        assert post["content"] == "저장된 본문"
+        mock_notion_client.return_value.databases.query.assert_not_called()
+
+    @patch('notion_client.Client')
+    def test_live_mode_does_not_open_store(self, mock_notion_client, monkeypatch):
+        """테스트: CONTENT_SOURCE=live면 콘텐츠 저장소 파일을 열지 않는지 확인"""
+        import notion_client
+        from config.settings import settings
+
+        opened = Mock(return_value=Mock())
+        monkeypatch.setattr(notion_client.ContentStore, "open_existing", opened)
+        monkeypatch.setattr(notion_client, "_shared_client", None)
+        monkeypatch.setattr(settings, "CONTENT_SOURCE", "live")
+
+        client = notion_client.create_content_client()
+
+        assert isinstance(client, notion_client.NotionClient)
+        assert client.store is None
+        opened.assert_not_called()
+
+    @patch('notion_client.Client')
+    def test_render_post_reuses_unchanged_fragments(self, mock_notion_client, tmp_path):
+        """테스트: 수정되지 않은 블록은 하위 트리를 다시 조회하지 않는지 확인"""
+        from notion_client import NotionClient
+        from content_store import ContentStore
+        
+        def make_blocks(toggle_edited):
+            return [
+                {
+                    "id": "b1", "type": "paragraph", "has_children": False,
+                    "last_edited_time": "2025-01-01T00:00:00.000Z",
+                    "paragraph": {"rich_text": [{"plain_text": "첫 단락", "annotations": {"bold": False, "italic": False, "code": False}}]}
+                },
+                {
+                    "id": "b2", "type": "bulleted_list_item", "has_children": True,
+                    "last_edited_time": toggle_edited,
+                    "bulleted_list_item": {"rich_text": [{"plain_text": "목록", "annotations": {"bold": False, "italic": False, "code": False}}]}
+                }
+            ]
+        
+        child = {
+            "id": "c1", "type": "paragraph", "has_children": False,
+            "last_edited_time": "2025-01-01T00:00:00.000Z",
+            "paragraph": {"rich_text": [{"plain_text": "하위", "annotations": {"bold": False, "italic": False, "code": False}}]}
+        }
+        
+        mock_list = mock_notion_client.return_value.blocks.children.list
+        store = ContentStore(str(tmp_path / "content.db"))
+        client = NotionClient(store=store)
+        
+        mock_list.side_effect = [{"results": make_blocks("2025-01-01T00:00:00.000Z")}, {"results": [child]}]
+        first = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+        
+        mock_list.side_effect = [{"results": make_blocks("2025-01-01T00:00:00.000Z")}]
+        second = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+        
+        assert first["content"] == "첫 단락\n\n- 목록\n\n    하위\n\n"
+        assert second["content"] == first["content"]
+        assert second["fetch_stats"]["api_calls"] == 1
+        assert second["fetch_stats"]["reused_blocks"] == 2
+        
+        # 목록 블록이 수정되면 그 하위 트리만 다시 조회
+        mock_list.side_effect = [{"results": make_blocks("2025-01-02T00:00:00.000Z")}, {"results": [child]}]
+        third = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+        assert third["fetch_stats"]["api_calls"] == 2
+        assert third["fetch_stats"]["rendered_blocks"] == 1
+
+    @patch('notion_client.Client')
+    def test_render_post_refetches_when_only_nested_blocks_changed(self, mock_notion_client, tmp_path):
+        """테스트: 페이지 수정 시각만 바뀌고 최상위 블록은 그대로면 캐시 대신 하위 트리를 다시 조회하는지 확인"""
+        from notion_client import NotionClient
+        from content_store import ContentStore
+        
+        def paragraph(block_id, text, has_children=False):
+            return {
+                "id": block_id, "type": "paragraph", "has_children": has_children,
+                "last_edited_time": "2025-01-01T00:00:00.000Z",
+                "paragraph": {"rich_text": [{"plain_text": text, "annotations": {"bold": False, "italic": False, "code": False}}]}
+            }
+        
+        mock_list = mock_notion_client.return_value.blocks.children.list
+        store = ContentStore(str(tmp_path / "content.db"))
+        client = NotionClient(store=store)
+        post = {"id": "page", "slug": "post", "title": "글", "status": "Published", "published_date": "2025-01-01",
+                "tags": [], "meta_description": "", "last_edited": "2025-01-01T00:00:00.000Z"}
+        
+        mock_list.side_effect = [{"results": [paragraph("b1", "부모", True)]}, {"results": [paragraph("c1", "이전")]}]
+        store.upsert_post(client.render_post(dict(post), fragment_store=store))
+        
+        mock_list.side_effect = [{"results": [paragraph("b1", "부모", True)]}, {"results": [paragraph("c1", "수정")]}]
+        edited = client.render_post({**post, "last_edited": "2025-01-02T00:00:00.000Z"}, fragment_store=store)
+        
+        assert "수정" in edited["content"]
+        assert edited["fetch_stats"]["rendered_blocks"] == 1
+
+    @patch('notion_client.Client')
+    def test_render_post_retries_unresolved_images(self, mock_notion_client, tmp_path):
+        """테스트: 이미지를 내려받지 못한 블록은 수정되지 않았어도 다음 렌더링에서 다시 처리하는지 확인"""
+        from notion_client import NotionClient
+        from content_store import ContentStore
+        
+        url = "https://prod-files-secure.s3.amazonaws.com/ws/new.png?X-Amz-Signature=1"
+        block = {
+            "id": "img1", "type": "image", "has_children": False,
+            "last_edited_time": "2025-01-01T00:00:00.000Z",
+            "image": {"type": "file", "file": {"url": url}, "caption": []}
+        }
+        mock_notion_client.return_value.blocks.children.list.return_value = {"results": [block]}
+        store = ContentStore(str(tmp_path / "content.db"))
+        client = NotionClient(store=store)
+        
+        with patch.object(client, "_download_and_save_image", return_value=None):
+            failed = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+        with patch.object(client, "_download_and_save_image", return_value="images/ab/ab12345678901234.png"):
+            retried = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+        
+        assert url in failed["content"]
+        assert retried["fetch_stats"]["rendered_blocks"] == 1
+        assert "images/ab/ab12345678901234.png" in retried["content"]
+
+    @patch('notion_client.Client')
+    def test_render_post_renumbers_cached_list_items(self, mock_notion_client, tmp_path):
+        """테스트: 앞에 번호 목록 항목이 추가되면 수정되지 않은 항목도 번호를 다시 매기는지 확인"""
+        from notion_client import NotionClient
+        from content_store import ContentStore
+
+        def item(block_id, text):
+            return {
+                "id": block_id, "type": "numbered_list_item", "has_children": False,
+                "last_edited_time": "2025-01-01T00:00:00.000Z",
+                "numbered_list_item": {"rich_text": [{"plain_text": text, "annotations": {"bold": False, "italic": False, "code": False}}]}
+            }
+
+        mock_list = mock_notion_client.return_value.blocks.children.list
+        store = ContentStore(str(tmp_path / "content.db"))
+        client = NotionClient(store=store)
+
+        mock_list.side_effect = [{"results": [item("a", "가"), item("b", "나")]}]
+        first = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+
+        mock_list.side_effect = [{"results": [item("new", "새 항목"), item("a", "가"), item("b", "나")]}]
+        second = client.render_post({"id": "page", "slug": "post"}, fragment_store=store)
+
+        assert first["content"] == "1. 가\n\n2. 나\n\n"
+        assert second["content"] == "1. 새 항목\n\n2. 가\n\n3. 나\n\n"
+        assert second["fetch_stats"]["rendered_blocks"] == 3
+
+    @patch('notion_client.Client')
+    def test_render_post_resolves_images_during_conversion(self, mock_notion_client, tmp_path):
+        """테스트: 이미지 블록이 변환 중에 저장소 URL로 바뀌고 캡션이 대체 텍스트가 되는지 확인"""
+        from notion_client import NotionClient
+
+        def image(block_id, url, caption):
+            return {
+                "id": block_id, "type": "image", "has_children": False,
+                "image": {"type": "file", "file": {"url": url}, "caption": [{"plain_text": caption}]}
+            }
+
+        mock_notion_client.return_value.blocks.children.list.return_value = {"results": [
+            image("img1", "https://prod-files-secure.s3.amazonaws.com/a.png?X-Amz=1", "구조도"),
+            image("img2", "https://example.com/b.png", ""),
+        ]}
+        client = NotionClient(store=None)
+
+        with patch.object(client, "_download_and_save_image", return_value="images/2025/01/a.png") as download:
+            post = client.render_post({"id": "page", "slug": "post"})
+
+        assert post["content"] == (
+            "![구조도](https://raw.githubusercontent.com/dexelop/notion_to_blog/main/images/2025/01/a.png)\n\n"
+            "![](https://example.com/b.png)\n\n"
+        )
+        download.assert_called_once_with("https://prod-files-secure.s3.amazonaws.com/a.png?X-Amz=1", "page")
+        assert post["images"][0]["block_id"] == "img1"
+        assert post["images"][0]["caption"] == "구조도"
+
+    @patch('notion_client.Client')
+    def test_serving_client_resolves_images_from_manifest_only(self, mock_notion_client, tmp_path):
+        """테스트: 서빙용 클라이언트는 이미지를 내려받지 않고 매니페스트에 없는 이미지는 서명 URL로 두는지 확인"""
+        from notion_client import NotionClient
+        from image_assets import ImageManifest
+
+        def image(block_id, url):
+            return {
+                "id": block_id, "type": "image", "has_children": False,
+                "image": {"type": "file", "file": {"url": url}, "caption": []}
+            }
+
+        known = "https://prod-files-secure.s3.amazonaws.com/ws/known.png?X-Amz-Signature=2"
+        unknown = "https://prod-files-secure.s3.amazonaws.com/ws/new.png?X-Amz-Signature=2"
+        mock_notion_client.return_value.blocks.children.list.return_value = {"results": [
+            image("img1", known), image("img2", unknown)
+        ]}
+
+        client = NotionClient(store=None, download_images=False)
+        client.downloader.manifest = ImageManifest(str(tmp_path / "manifest.json"))
+        client.downloader.manifest.record(
+            "prod-files-secure.s3.amazonaws.com/ws/known.png", "ab12345678901234", "images/ab/ab12345678901234.png", 10
+        )
+
+        with patch.object(client, "_download_and_save_image") as download:
+            post = client.render_post({"id": "page", "slug": "post"})
+
+        download.assert_not_called()
+        assert post["content"] == (
+            "![](https://raw.githubusercontent.com/dexelop/notion_to_blog/main/images/ab/ab12345678901234.png)\n\n"
+            f"![]({unknown})\n\n"
+        )
+        assert [image["block_id"] for image in post["images"]] == ["img1"]
+        assert not (tmp_path / "pending.json").exists()
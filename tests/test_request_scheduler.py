@@ -0,0 +1,142 @@
+"""
+요청 스케줄러 테스트
+속도 제한, Retry-After 처리, 데드라인을 검증
+"""
+import time
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+
+class FakeRateLimitError(Exception):
+    """notion-client의 APIResponseError를 흉내낸 429 오류"""
+
+    def __init__(self, retry_after="0"):
+        super().__init__("rate limited")
+        self.status = 429
+        self.headers = {"Retry-After": retry_after}
+
+
+class TestRequestScheduler:
+    """RequestScheduler 테스트"""
+
+    def test_call_retries_rate_limited_requests(self):
+        """테스트: 429 응답 후 재시도해서 결과를 반환하는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        scheduler = RequestScheduler(rate=100, max_retries=3, base_delay=0.01)
+        func = Mock(side_effect=[FakeRateLimitError(), FakeRateLimitError(), {"ok": True}])
+
+        assert scheduler.call(func, block_id="b") == {"ok": True}
+        assert func.call_count == 3
+
+    def test_stats_count_calls_by_endpoint(self):
+        """테스트: 엔드포인트별 요청 수와 429/재시도 횟수가 집계되는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        class BlocksChildrenEndpoint:
+            def __init__(self):
+                self.responses = [FakeRateLimitError(), {"results": []}]
+
+            def list(self, **kwargs):
+                response = self.responses.pop(0)
+                if isinstance(response, Exception):
+                    raise response
+                return response
+
+        scheduler = RequestScheduler(rate=100, max_retries=3, base_delay=0.01)
+        scheduler.call(BlocksChildrenEndpoint().list, block_id="b")
+        scheduler.request(Mock(return_value=Mock(status_code=200, headers={})), "https://files.example.com/a.png")
+
+        stats = scheduler.stats()
+        assert stats["calls"] == {"blocks.children.list": 2, "files.example.com": 1}
+        assert stats["rate_limited"] == 1 and stats["retries"] == 1
+
+        scheduler.reset_stats()
+        assert scheduler.stats()["total"] == 0
+
+    def test_call_does_not_retry_other_errors(self):
+        """테스트: 재시도 대상이 아닌 오류는 바로 전달되는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        scheduler = RequestScheduler(rate=100)
+        func = Mock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            scheduler.call(func)
+        assert func.call_count == 1
+
+    def test_deadline_exceeded_when_retry_after_too_long(self):
+        """테스트: Retry-After가 데드라인을 넘기면 DeadlineExceeded가 발생하는지 확인"""
+        from request_scheduler import RequestScheduler, DeadlineExceeded
+
+        scheduler = RequestScheduler(rate=100, max_retries=3)
+        func = Mock(side_effect=FakeRateLimitError(retry_after="30"))
+
+        with pytest.raises(DeadlineExceeded):
+            scheduler.call(func, deadline=1)
+
+    def test_token_bucket_limits_rate(self):
+        """테스트: 버스트 이후 요청이 지정한 속도로 제한되는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        scheduler = RequestScheduler(rate=20, burst=1)
+        started = time.monotonic()
+        for _ in range(5):
+            scheduler.acquire()
+
+        # 첫 요청은 즉시, 이후 4개는 0.05초 간격
+        assert time.monotonic() - started >= 0.18
+
+    def test_acall_retries_rate_limited_coroutines(self):
+        """테스트: asyncio 호출에서도 429 후 재시도하는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        scheduler = RequestScheduler(rate=100, max_retries=2, base_delay=0.01)
+        attempts = []
+
+        async def query():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise FakeRateLimitError()
+            return {"results": []}
+
+        assert asyncio.run(scheduler.acall(query)) == {"results": []}
+        assert len(attempts) == 2
+
+    def test_request_retries_retryable_status(self):
+        """테스트: HTTP 503 응답 후 재시도하고 타임아웃을 전달하는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        scheduler = RequestScheduler(rate=100, max_retries=2, base_delay=0.01)
+        unavailable = Mock(status_code=503, headers={})
+        ok = Mock(status_code=200, headers={})
+        send = Mock(side_effect=[unavailable, ok])
+
+        assert scheduler.request(send, "https://example.com/a.png", timeout=5) is ok
+        assert send.call_count == 2
+        assert send.call_args.kwargs["timeout"] <= 5
+
+    def test_request_does_not_retry_server_errors_for_unsafe_methods(self):
+        """테스트: 멱등하지 않은 요청은 5xx 응답과 전송 중 오류를 재시도하지 않고 429만 재시도하는지 확인"""
+        from request_scheduler import RequestScheduler
+
+        scheduler = RequestScheduler(rate=100, max_retries=2, base_delay=0.01)
+        unavailable = Mock(status_code=502, headers={})
+        send = Mock(return_value=unavailable)
+
+        assert scheduler.request(send, "https://api.github.com/issues", idempotent=False) is unavailable
+        assert send.call_count == 1
+
+        class ReadTimeout(Exception):
+            pass
+
+        send = Mock(side_effect=ReadTimeout())
+        with pytest.raises(ReadTimeout):
+            scheduler.request(send, "https://api.github.com/issues", idempotent=False)
+        assert send.call_count == 1
+
+        created = Mock(status_code=201, headers={})
+        send = Mock(side_effect=[Mock(status_code=429, headers={"Retry-After": "0"}), created])
+        assert scheduler.request(send, "https://api.github.com/issues", idempotent=False) is created
+        assert send.call_count == 2
@@ -0,0 +1,83 @@
+"""
+rich text 컴파일러 테스트
+인접 런 병합, 공백 처리, 서식/색상 변환, 빠른 경로와 캐시 검증
+"""
+from rich_text import RichTextCompiler
+
+
+def run(text, href=None, run_type="text", **annotations):
+    """테스트용 rich text 런 생성"""
+    return {
+        "type": run_type,
+        "plain_text": text,
+        "href": href,
+        "annotations": {
+            "bold": False, "italic": False, "strikethrough": False,
+            "underline": False, "code": False, "color": "default",
+            **annotations
+        }
+    }
+
+
+class TestRichTextCompiler:
+    """RichTextCompiler 테스트"""
+
+    def test_adjacent_runs_with_same_annotations_are_merged(self):
+        """테스트: 같은 서식의 인접 런이 하나의 강조로 합쳐지는지 확인"""
+        compiler = RichTextCompiler()
+
+        markdown = compiler([run("a", bold=True), run("b", bold=True), run(" 그리고 "), run("c", italic=True)])
+
+        assert markdown == "**ab** 그리고 *c*"
+
+    def test_whitespace_moves_outside_markers(self):
+        """테스트: 앞뒤 공백이 강조 기호 바깥으로 옮겨지는지 확인"""
+        compiler = RichTextCompiler()
+
+        assert compiler([run("앞 "), run(" 강조 ", bold=True), run("뒤")]) == "앞  **강조** 뒤"
+        assert compiler([run("   ", bold=True)]) == "   "
+
+    def test_strikethrough_color_code_and_link(self):
+        """테스트: 취소선, 색상, 코드, 링크가 변환되는지 확인"""
+        compiler = RichTextCompiler()
+
+        assert compiler([run("취소", strikethrough=True)]) == "~~취소~~"
+        assert compiler([run("빨강", color="red")]) == ":red[빨강]"
+        assert compiler([run("배경", color="yellow_background", bold=True)]) == ":orange-background[**배경**]"
+        assert compiler([run("a`b", code=True)]) == "``a`b``"
+        assert compiler([run("링크", href="https://example.com", bold=True)]) == "[**링크**](https://example.com)"
+        assert compiler([run("x^2", run_type="equation")]) == "$x^2$"
+
+    def test_plain_runs_and_missing_annotations(self):
+        """테스트: 서식 없는 런과 주석이 없는 런은 텍스트만 이어 붙이는지 확인"""
+        compiler = RichTextCompiler()
+
+        assert compiler([run("일반 "), {"plain_text": "텍스트"}]) == "일반 텍스트"
+        assert compiler([{"plain_text": "굵게", "annotations": {"bold": True}}]) == "**굵게**"
+        assert compiler([]) == ""
+        assert compiler.cache_info()["misses"] == 1
+
+    def test_repeated_rich_text_is_cached(self):
+        """테스트: 같은 내용의 런 목록은 캐시에서 반환되고 캐시 크기가 제한되는지 확인"""
+        compiler = RichTextCompiler(cache_size=2)
+        callout = [run("주의", bold=True), run(": 다시 확인")]
+
+        first = compiler(callout)
+        second = compiler([dict(item) for item in callout])
+
+        assert first == second == "**주의**: 다시 확인"
+        assert compiler.cache_info()["hits"] == 1
+
+        compiler([run("둘", italic=True)])
+        compiler([run("셋", italic=True)])
+        assert compiler.cache_info()["size"] == 2
+
+    def test_cache_key_ignores_annotation_order(self):
+        """테스트: 주석 객체의 키 순서가 달라도 같은 서식으로 변환되는지 확인"""
+        compiler = RichTextCompiler()
+        reordered = {"color": "red", "code": False, "underline": False,
+                     "strikethrough": False, "italic": False, "bold": True}
+
+        assert compiler([run("굵게", bold=True, color="red")]) == ":red[**굵게**]"
+        assert compiler([{"type": "text", "plain_text": "굵게", "href": None, "annotations": reordered}]) == ":red[**굵게**]"
+        assert compiler.cache_info()["hits"] == 1
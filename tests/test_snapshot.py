@@ -0,0 +1,62 @@
+"""
+콘텐츠 스냅샷 테스트
+스냅샷 기록과 NotionClient 호환 조회를 검증
+"""
+
+
+def make_post(page_id, slug, published_date):
+    return {
+        "id": page_id,
+        "title": f"{slug} 제목",
+        "slug": slug,
+        "status": "Published",
+        "published_date": published_date,
+        "tags": ["Python"],
+        "meta_description": "",
+        "last_edited": "2025-01-21T10:00:00.000Z",
+        "content": f"# {slug}\n\n본문\n\n",
+        "images": [],
+        "fetch_stats": {"api_calls": 1}
+    }
+
+
+class TestSnapshot:
+    """SnapshotWriter/SnapshotReader 테스트"""
+
+    def test_write_and_read_snapshot(self, tmp_path):
+        """테스트: 기록한 스냅샷을 NotionClient와 같은 방식으로 조회하는지 확인"""
+        from snapshot import SnapshotWriter, SnapshotReader
+
+        posts = [make_post("p1", "old", "2025-01-01"), make_post("p2", "new", "2025-02-01")]
+        writer = SnapshotWriter(str(tmp_path))
+        for post in posts:
+            writer.write_post(post)
+        writer.write_index(posts)
+
+        assert SnapshotReader.exists(str(tmp_path))
+        reader = SnapshotReader(str(tmp_path))
+
+        listed = reader.fetch_published_posts()
+        assert [post["slug"] for post in listed] == ["new", "old"]
+        assert "content" not in listed[0]
+        assert [post["slug"] for post in reader.fetch_recent_posts(1)] == ["new"]
+
+        post = reader.get_post_by_slug("old")
+        assert post["content"] == "# old\n\n본문\n\n"
+        assert "fetch_stats" not in post
+        assert reader.get_post_by_slug("missing") is None
+
+    def test_removed_post_is_not_served(self, tmp_path):
+        """테스트: 삭제된 글은 인덱스 재생성 후 조회되지 않는지 확인"""
+        from snapshot import SnapshotWriter, SnapshotReader
+
+        writer = SnapshotWriter(str(tmp_path))
+        writer.write_post(make_post("p1", "gone", "2025-01-01"))
+        writer.write_index([make_post("p1", "gone", "2025-01-01")])
+
+        reader = SnapshotReader(str(tmp_path))
+        assert reader.get_post_by_slug("gone") is not None
+
+        assert writer.remove_post("p1")
+        writer.write_index([])
+        assert reader.get_post_by_slug("gone") is None
@@ -0,0 +1,65 @@
+"""
+동기화 원장 테스트
+수정 시각 비교, 렌더링 결과 해시, 제거 대상 판별, 내려받지 못한 이미지 재시도, 변경 없는 저장 생략 검증
+"""
+from sync_ledger import SyncLedger, post_content_hash
+
+
+def rendered(page_id, edited, content="본문", images=None):
+    return {
+        "id": page_id, "slug": page_id, "title": page_id, "last_edited": edited,
+        "content": content, "images": images or []
+    }
+
+
+class TestSyncLedger:
+    """SyncLedger 테스트"""
+
+    def test_diff_finds_changed_and_removed_pages(self, tmp_path):
+        """테스트: 새 글/수정된 글과 목록에서 사라진 글(원장 도입 전 저장된 글 포함)을 구분하는지 확인"""
+        ledger = SyncLedger(str(tmp_path / "ledger.json"))
+        ledger.record(rendered("a", "2025-01-01T00:00:00.000Z"), ["content/posts/a.json"])
+        ledger.record(rendered("b", "2025-01-01T00:00:00.000Z"), ["content/posts/b.json"])
+
+        changed, unchanged, removed = ledger.diff(
+            [
+                {"id": "a", "last_edited": "2025-01-01T00:00:00.000Z"},
+                {"id": "c", "last_edited": "2025-01-02T00:00:00.000Z"}
+            ],
+            stored_ids=["a", "b", "legacy"]
+        )
+
+        assert [post["id"] for post in changed] == ["c"]
+        assert unchanged == ["a"]
+        assert removed == ["b", "legacy"]
+
+    def test_record_detects_content_changes_and_save_is_noop(self, tmp_path):
+        """테스트: 수정 시각만 바뀐 글은 변경으로 보지 않고, 바뀐 것이 없으면 파일을 다시 쓰지 않는지 확인"""
+        path = tmp_path / "ledger.json"
+        ledger = SyncLedger(str(path))
+        post = rendered("a", "2025-01-01T00:00:00.000Z", images=[{"path": "images/ab/ab12345678901234.png"}])
+
+        assert ledger.record(post, ["content/posts/a.json"])
+        assert ledger.save()
+        assert not ledger.record(post)
+        assert not ledger.save()
+
+        reloaded = SyncLedger(str(path))
+        assert reloaded.get("a")["asset_hashes"] == ["ab12345678901234"]
+        assert not reloaded.record({**post, "last_edited": "2025-01-02T00:00:00.000Z"})
+        assert reloaded.get("a")["last_edited"] == "2025-01-02T00:00:00.000Z"
+        assert reloaded.record({**post, "content": "새 본문"})
+        assert reloaded.get("a")["content_hash"] == post_content_hash({**post, "content": "새 본문"})
+
+    def test_unresolved_images_are_retried(self, tmp_path):
+        """테스트: Notion 서명 URL이 남은 글은 다시 렌더링 대상이 되고, 이미지를 받으면 제외되는지 확인"""
+        ledger = SyncLedger(str(tmp_path / "ledger.json"))
+        signed = "https://prod-files-secure.s3.amazonaws.com/ws/new.png?X-Amz-Signature=1"
+        ledger.record(rendered("a", "2025-01-01T00:00:00.000Z", content=f"![]({signed})\n\n"))
+        ledger.record(rendered("b", "2025-01-01T00:00:00.000Z", content="![](https://example.com/a.png)\n\n"))
+
+        assert ledger.get("a")["unresolved_images"] == ["prod-files-secure.s3.amazonaws.com/ws/new.png"]
+        assert ledger.unresolved_pages() == ["a"]
+
+        ledger.record(rendered("a", "2025-01-01T00:00:00.000Z", content="![](images/ab/ab12345678901234.png)\n\n"))
+        assert ledger.unresolved_pages() == []
@@ -0,0 +1,55 @@
+"""
+동기화 지표 테스트
+보고서 집계, JSON/Prometheus 기록, 알림 메시지 요약 검증
+"""
+import json
+
+from sync_metrics import SyncMetrics
+
+
+def make_metrics() -> SyncMetrics:
+    metrics = SyncMetrics()
+    with metrics.phase("pipeline"):
+        pass
+    metrics.phases["pipeline"] = 2.0
+    metrics.record_stages({
+        "list": {"workers": 1, "items": 5, "busy": 0.5, "elapsed": 0.6, "throughput": 8.33},
+        "convert": {"workers": 1, "items": 4, "busy": 1.0, "elapsed": 1.8, "throughput": 2.22},
+    })
+    metrics.record_requests("notion", {
+        "calls": {"blocks.children.list": 9, "databases.query": 2},
+        "total": 11, "rate_limited": 1, "retries": 1, "retry_wait": 0.5, "statuses": {"429": 1}
+    })
+    metrics.record_images({"cached": 3, "downloaded": 1, "existing": 1, "failed": 0, "bytes": 2048})
+    metrics.finish(published=5, updated=4, unchanged=1, removed=0)
+    return metrics
+
+
+class TestSyncMetrics:
+    """SyncMetrics 테스트"""
+
+    def test_report_and_json(self, tmp_path):
+        """테스트: 이미지 건너뜀/다운로드와 초당 렌더링 글 수를 집계해 JSON으로 기록하는지 확인"""
+        metrics = make_metrics()
+
+        report = json.loads(metrics.write_json(str(tmp_path / "metrics.json")).read_text(encoding="utf-8"))
+
+        assert report["images"] == {"fetched": 2, "skipped": 3, "failed": 0, "bytes": 2048}
+        assert report["posts"]["rendered"] == 4 and report["posts"]["per_second"] == 2.0
+        assert report["requests"]["notion"]["rate_limited"] == 1
+        assert report["success"] is True
+
+    def test_prometheus_and_markdown(self, tmp_path):
+        """테스트: Prometheus 텍스트 파일과 알림 메시지 요약에 단계와 엔드포인트별 지표가 포함되는지 확인"""
+        metrics = make_metrics()
+
+        text = metrics.write_prometheus(str(tmp_path / "notion_sync.prom")).read_text(encoding="utf-8")
+
+        assert '# TYPE notion_sync_stage_seconds gauge' in text
+        assert 'notion_sync_stage_seconds{stage="convert"} 1.8' in text
+        assert 'notion_sync_requests{scheduler="notion",endpoint="blocks.children.list"} 9' in text
+        assert 'notion_sync_images{result="skipped"} 3' in text
+        assert metrics.write_prometheus("") is None
+
+        summary = "\n".join(metrics.markdown_lines())
+        assert "429 응답 1회" in summary and "blocks.children.list 9" in summary
@@ -4,7 +4,7 @@ Phase 3: Notion 동기화 스크립트 테스트
 """
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 import os
 from pathlib import Path
@@ -33,36 +33,67 @@ class TestSyncNotion:
     
     @patch('sync_notion.NotionClient')
     def test_fetch_updated_posts(self, mock_notion_client):
-        """테스트: 업데이트된 글 목록 조회"""
+        """테스트: 업데이트된 글 목록 조회 (수정 시각 필터는 Notion 쿼리로 전달)"""
         from sync_notion import SyncManager
         
-        # Mock 설정
+        # Mock 설정 (Notion이 필터링한 결과)
         mock_posts = [
             {
                 "id": "test-1",
                 "title": "새 글",
                 "slug": "new-post",
                 "last_edited": "2025-01-21T10:00:00Z"
-            },
-            {
-                "id": "test-2", 
-                "title": "오래된 글",
-                "slug": "old-post",
-                "last_edited": "2025-01-20T10:00:00Z"
             }
         ]
-        mock_notion_client.return_value.fetch_published_posts.return_value = mock_posts
+        mock_iter = mock_notion_client.return_value.iter_published_posts
+        mock_iter.return_value = iter(mock_posts)
         
         sync_manager = SyncManager()
         
-        # 기준 시간 설정 (2025-01-20 12:00:00)
-        cutoff_time = datetime(2025, 1, 20, 12, 0, 0)
+        # 기준 시간 설정 (2025-01-20 12:00:00 UTC)
+        cutoff_time = datetime(2025, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
         
         updated_posts = sync_manager.fetch_updated_posts(cutoff_time)
         
-        # 기준 시간 이후에 수정된 글만 반환되어야 함
         assert len(updated_posts) == 1
         assert updated_posts[0]["title"] == "새 글"
+        assert mock_iter.call_args.kwargs["edited_after"] == cutoff_time
+    
+    @patch('sync_notion.NotionClient')
+    def test_fetch_updated_posts_skips_seen_boundary(self, mock_notion_client):
+        """테스트: 커서 시각에 이미 처리한 글은 다시 반환하지 않는지 확인"""
+        from sync_notion import SyncManager
+        
+        mock_notion_client.return_value.iter_published_posts.return_value = iter([
+            {"id": "seen", "last_edited": "2025-01-21T10:00:00.000Z"},
+            {"id": "new", "last_edited": "2025-01-21T10:00:00.000Z"}
+        ])
+        
+        cursor = datetime(2025, 1, 21, 10, 0, 0, tzinfo=timezone.utc)
+        updated_posts = SyncManager().fetch_updated_posts(cursor, {"seen"})
+        
+        assert [post["id"] for post in updated_posts] == ["new"]
+    
+    def test_sync_cursor_is_timezone_aware(self, tmp_path):
+        """테스트: 동기화 커서가 UTC 기준으로 저장되는지 확인"""
+        from sync_notion import SyncManager
+        
+        sync_manager = SyncManager()
+        sync_manager.sync_file = tmp_path / ".sync_state.json"
+        sync_manager.update_last_sync_time(datetime(2025, 1, 22, 0, 0, tzinfo=timezone.utc))
+        
+        sync_manager.update_sync_cursor([
+            {"id": "a", "last_edited": "2025-01-21T09:00:00.000Z"},
+            {"id": "b", "last_edited": "2025-01-21T10:00:00.000Z"},
+            {"id": "c", "last_edited": "2025-01-21T10:00:00.000Z"}
+        ])
+        
+        cursor, seen_ids = sync_manager.get_sync_cursor()
+        assert cursor == datetime(2025, 1, 21, 10, 0, 0, tzinfo=timezone.utc)
+        assert seen_ids == {"b", "c"}
+        
+        # 기존 last_sync 값이 유지되는지 확인
+        assert sync_manager.get_last_sync_time() is not None
     
     def test_git_operations(self):
         """테스트: Git 작업 (add, commit, push)"""
@@ -154,4 +185,227 @@ class TestSyncNotion:
         
         assert "posts_updated" in summary
         assert "images_processed" in summary
-        assert "errors" in summary
\ No newline at end of file
+        assert "errors" in summary
+
+class TestLedgerSync:
+    """원장 기반 동기화 테스트 (가짜 Notion 서버)"""
+    
+    def test_unchanged_run_is_noop_and_unpublished_posts_are_removed(self, tmp_path, monkeypatch):
+        """테스트: 변경 없는 실행은 (콘텐츠 저장소가 없어도 스냅샷으로 채워) 파일을 쓰지 않고, 발행 취소된 글의 출력은 제거되는지 확인"""
+        import request_scheduler
+        from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace
+        from config.settings import settings
+        from request_scheduler import RequestScheduler
+        from sync_notion import NotionSyncWorkflow
+        from content_store import ContentStore
+        
+        workspace = FakeNotionWorkspace(posts=3, blocks_per_post=4, images_per_post=0, draft_ratio=0, seed=2)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setitem(request_scheduler._schedulers, "notion", RequestScheduler(rate=1000, base_delay=0.01))
+        reports = tmp_path / "reports"
+        monkeypatch.setattr(settings, "SYNC_METRICS_PATH", str(reports / "sync_metrics.json"))
+        monkeypatch.setattr(settings, "SYNC_PROMETHEUS_PATH", str(reports / "notion_sync.prom"))
+        # 매 실행 전체 목록을 조회해 발행 취소된 글을 바로 찾음
+        monkeypatch.setattr(settings, "SYNC_FULL_LISTING_HOURS", 0)
+        
+        def sync():
+            workflow = NotionSyncWorkflow(concurrency=1)
+            workflow.git_manager.has_changes = lambda: False
+            summary = workflow.run_sync()
+            assert summary["success"], summary["errors"]
+            return summary
+        
+        def snapshot_files():
+            # 지표 보고서와 커밋하지 않는 콘텐츠 저장소(스냅샷으로 다시 채움), 동기화 상태는 매 실행마다 기록되므로 제외
+            return {
+                path: path.stat().st_mtime_ns for path in tmp_path.rglob("*")
+                if path.is_file() and reports not in path.parents
+                and path.name not in ("content.db", ".sync_state.json")
+            }
+        
+        with FakeNotionServer(workspace) as server:
+            monkeypatch.setattr(settings, "NOTION_TOKEN", "secret_test")
+            monkeypatch.setattr(settings, "NOTION_DATABASE_ID", workspace.database_id)
+            monkeypatch.setattr(settings, "NOTION_API_BASE_URL", server.url)
+            
+            first = sync()
+            first_stats = dict(server.stats)
+            files = snapshot_files()
+            server.reset_stats()
+            # 콘텐츠 저장소는 커밋하지 않으므로 새로 체크아웃한 러너에는 없음
+            (tmp_path / "data" / "content.db").unlink()
+            second = sync()
+            
+            assert first["posts_updated"] == 3
+            assert [first["stages"][name]["items"] for name in ("list", "fetch", "assets", "convert", "write")] == [3] * 5
+            assert first["metrics"]["requests"]["notion"]["calls"] == {
+                "blocks.children.list": first_stats["blocks.children.list"],
+                "databases.query": first_stats["databases.query"]
+            }
+            assert first["metrics"]["posts"]["rendered"] == 3
+            assert json.loads((reports / "sync_metrics.json").read_text(encoding="utf-8"))["posts"]["updated"] == 0
+            assert 'notion_sync_requests{scheduler="notion",endpoint="databases.query"}' in \
+                (reports / "notion_sync.prom").read_text(encoding="utf-8")
+            assert second["posts_updated"] == 0 and second["posts_unchanged"] == 3
+            assert snapshot_files() == files
+            assert server.stats.get("blocks.children.list", 0) == 0
+            assert ContentStore().count() == 3
+            
+            # 수정 시각만 바뀐 글은 다시 쓰지 않고, 발행 취소된 글은 제거
+            touched, unpublished = workspace.pages[0], workspace.pages[1]
+            workspace.touch_post(touched["id"])
+            unpublished["properties"]["상태"]["select"]["name"] = "Draft"
+            third = sync()
+        
+        assert third["posts_updated"] == 0 and third["posts_removed"] == 1
+        assert not (tmp_path / "content" / "posts" / f"{unpublished['id']}.json").exists()
+        assert (tmp_path / "content" / "posts" / f"{touched['id']}.json").stat().st_mtime_ns == \
+            files[tmp_path / "content" / "posts" / f"{touched['id']}.json"]
+    
+    def test_changed_image_signatures_do_not_rewrite_posts(self, tmp_path, monkeypatch, request):
+        """테스트: 수정 시각만 바뀐 글은 이미지 URL 서명이 바뀌어도 (블록을 다시 렌더링해도) 파일을 다시 쓰지 않는지 확인"""
+        import httpx
+        import request_scheduler
+        from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace
+        from config.settings import settings
+        from request_scheduler import RequestScheduler
+        from sync_notion import NotionSyncWorkflow
+        from http_session import set_http_client
+        
+        workspace = FakeNotionWorkspace(posts=2, blocks_per_post=4, images_per_post=2, draft_ratio=0, seed=6)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setitem(request_scheduler._schedulers, "notion", RequestScheduler(rate=1000, base_delay=0.01))
+        monkeypatch.setattr(settings, "SYNC_METRICS_PATH", str(tmp_path / "reports" / "sync_metrics.json"))
+        # 블록 렌더링 캐시를 매번 만료시켜 이미지 블록도 새 서명 URL로 다시 렌더링
+        monkeypatch.setattr(settings, "RENDER_CACHE_MAX_AGE_HOURS", 0)
+        
+        def sync():
+            workflow = NotionSyncWorkflow(concurrency=1)
+            workflow.git_manager.has_changes = lambda: False
+            summary = workflow.run_sync()
+            assert summary["success"], summary["errors"]
+            return summary
+        
+        with FakeNotionServer(workspace) as server:
+            monkeypatch.setattr(settings, "NOTION_TOKEN", "secret_test")
+            monkeypatch.setattr(settings, "NOTION_DATABASE_ID", workspace.database_id)
+            monkeypatch.setattr(settings, "NOTION_API_BASE_URL", server.url)
+            # Notion 이미지 호스트 요청을 가짜 서버로 전달
+            image_client = httpx.Client(transport=server.image_transport(), follow_redirects=True)
+            set_http_client(image_client)
+            request.addfinalizer(lambda: (set_http_client(None), image_client.close()))
+            
+            first = sync()
+            assert first["posts_updated"] == 2 and first["images_processed"] == 4
+            posts = sorted((tmp_path / "content" / "posts").glob("*.json"))
+            written = {path: path.stat().st_mtime_ns for path in posts}
+            
+            workspace.rotate_image_signatures()
+            for page in workspace.pages:
+                workspace.touch_post(page["id"])
+            second = sync()
+        
+        assert second["posts_updated"] == 0 and second["posts_unchanged"] == 2
+        assert second["stages"]["fetch"]["items"] == 2
+        assert {path: path.stat().st_mtime_ns for path in posts} == written
+        # 커밋되는 스냅샷에는 서명 URL을 남기지 않음
+        assert all("X-Amz-Signature" not in path.read_text(encoding="utf-8") for path in posts)
+    
+    def test_incremental_run_lists_only_edited_posts(self, tmp_path, monkeypatch):
+        """테스트: 커서 이후 수정된 글만 조회하고, 발행 취소된 글은 전체 목록 조회 주기에만 제거하는지 확인"""
+        import request_scheduler
+        from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace
+        from config.settings import settings
+        from request_scheduler import RequestScheduler
+        from sync_notion import NotionSyncWorkflow
+        
+        workspace = FakeNotionWorkspace(posts=4, blocks_per_post=4, images_per_post=0, draft_ratio=0, seed=4)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setitem(request_scheduler._schedulers, "notion", RequestScheduler(rate=1000, base_delay=0.01))
+        monkeypatch.setattr(settings, "SYNC_METRICS_PATH", str(tmp_path / "reports" / "sync_metrics.json"))
+        monkeypatch.setattr(settings, "SYNC_FULL_LISTING_HOURS", 24)
+        
+        def sync():
+            workflow = NotionSyncWorkflow(concurrency=1)
+            workflow.git_manager.has_changes = lambda: False
+            summary = workflow.run_sync()
+            assert summary["success"], summary["errors"]
+            return summary
+        
+        with FakeNotionServer(workspace) as server:
+            monkeypatch.setattr(settings, "NOTION_TOKEN", "secret_test")
+            monkeypatch.setattr(settings, "NOTION_DATABASE_ID", workspace.database_id)
+            monkeypatch.setattr(settings, "NOTION_API_BASE_URL", server.url)
+            
+            first = sync()
+            idle = sync()
+            
+            edited, unpublished = workspace.pages[0], workspace.pages[1]
+            edited["properties"]["제목"]["title"][0]["plain_text"] = "수정된 제목"
+            workspace.touch_post(edited["id"])
+            unpublished["properties"]["상태"]["select"]["name"] = "Draft"
+            incremental = sync()
+            
+            monkeypatch.setattr(settings, "SYNC_FULL_LISTING_HOURS", 0)
+            full = sync()
+        
+        assert first["full_listing"] and first["posts_updated"] == 4
+        assert not idle["full_listing"] and idle["stages"]["list"]["items"] == 0
+        assert not incremental["full_listing"]
+        assert incremental["stages"]["list"]["items"] == 1
+        assert incremental["posts_updated"] == 1 and incremental["posts_removed"] == 0
+        post = json.loads((tmp_path / "content" / "posts" / f"{edited['id']}.json").read_text(encoding="utf-8"))
+        assert post["title"] == "수정된 제목"
+        assert full["full_listing"] and full["posts_updated"] == 0 and full["posts_removed"] == 1
+        assert not (tmp_path / "content" / "posts" / f"{unpublished['id']}.json").exists()
+    
+    def test_webhook_syncs_only_changed_pages(self, tmp_path, monkeypatch):
+        """테스트: 웹훅 이벤트가 가리키는 글만 전체 목록 조회 없이 다시 렌더링하거나 제거하는지 확인"""
+        import request_scheduler
+        from benchmarks.fake_notion_server import FakeNotionServer, FakeNotionWorkspace, post_page_event
+        from config.settings import settings
+        from request_scheduler import RequestScheduler
+        from sync_notion import NotionSyncWorkflow
+        from sync_webhook import WebhookReceiver
+        
+        workspace = FakeNotionWorkspace(posts=3, blocks_per_post=4, images_per_post=0, draft_ratio=0, seed=3)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setitem(request_scheduler._schedulers, "notion", RequestScheduler(rate=1000, base_delay=0.01))
+        monkeypatch.setattr(settings, "SYNC_METRICS_PATH", str(tmp_path / "reports" / "sync_metrics.json"))
+        
+        workflow = NotionSyncWorkflow(concurrency=1)
+        workflow.git_manager.has_changes = lambda: False
+        summaries = []
+        
+        with FakeNotionServer(workspace) as server:
+            monkeypatch.setattr(settings, "NOTION_TOKEN", "secret_test")
+            monkeypatch.setattr(settings, "NOTION_DATABASE_ID", workspace.database_id)
+            monkeypatch.setattr(settings, "NOTION_API_BASE_URL", server.url)
+            assert workflow.run_sync()["posts_updated"] == 3
+            server.reset_stats()
+            
+            edited, unpublished = workspace.pages[0], workspace.pages[1]
+            edited["properties"]["제목"]["title"][0]["plain_text"] = "수정된 제목"
+            workspace.touch_post(edited["id"])
+            unpublished["properties"]["상태"]["select"]["name"] = "Draft"
+            
+            with WebhookReceiver(
+                lambda ids: summaries.append(workflow.sync_pages(ids)), port=0, secret="secret", delay=0.2
+            ) as receiver:
+                for _ in range(3):
+                    post_page_event(receiver.url, edited["id"], secret="secret")
+                post_page_event(receiver.url, unpublished["id"], "page.properties_updated", secret="secret")
+                assert receiver.debouncer.wait_idle(10)
+        
+        # 같은 글의 연속 이벤트는 한 번만 조회
+        assert all(summary["success"] for summary in summaries), summaries
+        assert sum(summary["posts_updated"] for summary in summaries) == 1
+        assert sum(summary["posts_removed"] for summary in summaries) == 1
+        assert server.stats.get("databases.query", 0) == 0 and server.stats["pages.retrieve"] == 2
+        post = json.loads((tmp_path / "content" / "posts" / f"{edited['id']}.json").read_text(encoding="utf-8"))
+        assert post["title"] == "수정된 제목"
+        assert not (tmp_path / "content" / "posts" / f"{unpublished['id']}.json").exists()
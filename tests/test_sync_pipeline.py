@@ -0,0 +1,63 @@
+"""
+동기화 파이프라인 테스트
+단계 연결, 큐 크기 제한, 단계별 통계, 항목별 오류 처리 검증
+"""
+import threading
+import time
+
+from sync_pipeline import PipelineStage, SyncPipeline
+
+
+class TestSyncPipeline:
+    """SyncPipeline 테스트"""
+
+    def test_stages_overlap_with_bounded_queues(self):
+        """테스트: 모든 항목이 각 단계를 거치고 목록 단계가 큐 크기 이상 앞서가지 않는지 확인"""
+        lock = threading.Lock()
+        state = {"listed": 0, "written": 0, "max_ahead": 0}
+
+        def source():
+            for i in range(20):
+                with lock:
+                    state["listed"] += 1
+                    state["max_ahead"] = max(state["max_ahead"], state["listed"] - state["written"])
+                yield i
+
+        def slow_write(item):
+            time.sleep(0.005)
+            with lock:
+                state["written"] += 1
+            return item
+
+        pipeline = SyncPipeline([
+            PipelineStage("fetch", lambda item: item * 10, workers=3),
+            PipelineStage("write", slow_write, workers=1),
+        ], queue_size=2)
+
+        results = pipeline.run(source())
+        stats = pipeline.stats()
+
+        assert sorted(results) == [i * 10 for i in range(20)]
+        assert list(stats) == ["list", "fetch", "write"]
+        assert stats["list"]["items"] == stats["fetch"]["items"] == stats["write"]["items"] == 20
+        assert stats["fetch"]["workers"] == 3 and stats["write"]["throughput"] > 0
+        # 큐 2개(각 2칸) + 작업 중인 항목만큼만 앞서감
+        assert state["max_ahead"] <= 2 + 2 + 3 + 1 + 1
+
+    def test_failed_items_are_skipped_and_recorded(self):
+        """테스트: 한 항목의 예외는 그 항목만 제외하고 단계와 함께 기록되는지 확인"""
+        def convert(item):
+            if item == 2:
+                raise ValueError("변환 실패")
+            return item
+
+        pipeline = SyncPipeline([
+            PipelineStage("convert", convert, workers=2),
+            PipelineStage("write", lambda item: item if item != 3 else None),
+        ], describe=lambda item: f"글 {item}")
+
+        results = pipeline.run(range(5))
+
+        assert sorted(results) == [0, 1, 4]
+        assert pipeline.errors == [{"stage": "convert", "item": "글 2", "error": "변환 실패"}]
+        assert pipeline.stats()["write"]["items"] == 4
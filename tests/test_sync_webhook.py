@@ -0,0 +1,97 @@
+"""
+웹훅 수신 테스트
+페이지 ID 정규화, 이벤트 디바운스, 서명 검증 검증
+"""
+import time
+import threading
+
+import httpx
+
+from benchmarks.fake_notion_server import post_page_event
+from sync_webhook import PageEventDebouncer, WebhookReceiver, event_page_ids, normalize_page_id
+
+
+PAGE_ID = "1f2e3d4c-5b6a-4978-8877-665544332211"
+
+
+class TestPageIds:
+    """페이지 ID 처리 테스트"""
+
+    def test_normalize_page_id(self):
+        """테스트: 하이픈 없는 ID와 Notion 페이지 URL을 UUID 형식으로 바꾸는지 확인"""
+        assert normalize_page_id(PAGE_ID.replace("-", "").upper()) == PAGE_ID
+        assert normalize_page_id(f"https://www.notion.so/my-post-{PAGE_ID.replace('-', '')}?pvs=4") == PAGE_ID
+        assert event_page_ids({"type": "page.content_updated", "entity": {"id": PAGE_ID, "type": "page"}}) == [PAGE_ID]
+        assert event_page_ids({"type": "comment.created", "entity": {"id": PAGE_ID, "type": "comment"}}) == []
+
+
+class TestWebhookReceiver:
+    """WebhookReceiver 테스트"""
+
+    def test_burst_of_events_is_debounced(self):
+        """테스트: 같은 페이지의 연속 이벤트는 한 번만 동기화하고 서명이 틀린 요청은 거부하는지 확인"""
+        calls = []
+        handled = threading.Event()
+
+        def handler(page_ids):
+            calls.append(page_ids)
+            handled.set()
+
+        with WebhookReceiver(handler, host="127.0.0.1", port=0, secret="secret", delay=0.2) as receiver:
+            for _ in range(3):
+                assert post_page_event(receiver.url, PAGE_ID, secret="secret").status_code == 202
+            assert post_page_event(receiver.url, PAGE_ID, secret="wrong").status_code == 401
+
+            assert handled.wait(5)
+            assert receiver.debouncer.wait_idle(5)
+
+        assert calls == [[PAGE_ID]]
+        assert receiver.stats == {"accepted": 3, "ignored": 0, "rejected": 1}
+
+    def test_max_delay_flushes_continuous_edits(self):
+        """테스트: 이벤트가 계속 들어와도 최대 대기 시간이 지나면 동기화하는지 확인"""
+        calls = []
+        debouncer = PageEventDebouncer(calls.append, delay=0.3, max_delay=0.5)
+
+        started = time.monotonic()
+        while time.monotonic() - started < 1.5:
+            debouncer.add(PAGE_ID)
+            time.sleep(0.05)
+        flushed_while_editing = list(calls)
+        debouncer.close()
+
+        assert flushed_while_editing and flushed_while_editing[0] == [PAGE_ID]
+        assert debouncer.batches == len(calls)
+
+    def test_rejects_events_without_secret(self):
+        """테스트: 서명 검증 토큰이 없으면 (루프백 주소여도) 구독 확인 요청만 받고 이벤트는 거부하는지 확인"""
+        calls = []
+
+        with WebhookReceiver(calls.append, host="127.0.0.1", port=0, secret="", delay=0) as receiver:
+            assert httpx.post(receiver.url, json={"verification_token": "secret_token"}).status_code == 200
+            assert post_page_event(receiver.url, PAGE_ID).status_code == 401
+            assert receiver.debouncer.wait_idle(5)
+
+        assert calls == []
+        assert not hasattr(receiver, "verification_token")
+        assert receiver.stats == {"accepted": 0, "ignored": 0, "rejected": 1}
+
+    def test_signed_receiver_verifies_handshake_shaped_payloads(self):
+        """테스트: 서명 검증 토큰이 있으면 확인 요청 형식의 본문도 서명을 검증하는지 확인"""
+        with WebhookReceiver(lambda page_ids: None, host="127.0.0.1", port=0, secret="secret") as receiver:
+            response = httpx.post(receiver.url, json={"verification_token": "attacker"})
+
+        assert response.status_code == 401
+        assert receiver.stats["rejected"] == 1
+
+    def test_rejects_oversized_body(self, monkeypatch):
+        """테스트: WEBHOOK_MAX_BODY_BYTES보다 큰 요청은 본문을 읽지 않고 거부하는지 확인"""
+        from config.settings import settings
+
+        monkeypatch.setattr(settings, "WEBHOOK_MAX_BODY_BYTES", 1024)
+
+        with WebhookReceiver(lambda page_ids: None, host="127.0.0.1", port=0, secret="secret") as receiver:
+            response = httpx.post(receiver.url, content=b"x" * 4096)
+
+        assert response.status_code == 413
+        assert receiver.stats["rejected"] == 1